@@ -82,6 +82,7 @@ from electionguard.ballot_compact import (
 from electionguard.ballot_validator import (
     ballot_is_valid_for_election,
     ballot_is_valid_for_style,
+    ballots_are_valid_for_election,
     contest_is_valid_for_style,
     selection_is_valid_for_style,
 )
@@ -100,6 +101,8 @@ from electionguard.chaum_pedersen import (
     ChaumPedersenProof,
     ConstantChaumPedersenProof,
     DisjunctiveChaumPedersenProof,
+    batch_is_valid_disjunctive_chaum_pedersen,
+    batch_verify_disjunctive_chaum_pedersen,
     make_chaum_pedersen,
     make_constant_chaum_pedersen,
     make_disjunctive_chaum_pedersen,
@@ -117,9 +120,18 @@ from electionguard.constants import (
     create_constants,
     get_cofactor,
     get_constants,
+    get_constants_for_option,
     get_generator,
+    get_generator_mpz,
     get_large_prime,
+    get_large_prime_mpz,
+    get_prime_option_from_environment,
     get_small_prime,
+    get_small_prime_mpz,
+    reset_constants,
+    set_constants,
+    set_prime_option,
+    use_prime_option,
 )
 from electionguard.data_store import (
     DataStore,
@@ -174,10 +186,13 @@ from electionguard.decryption_share import (
     get_shares_for_selection,
 )
 from electionguard.discrete_log import (
+    DEFAULT_TABLE_SIZE,
     DiscreteLog,
     DiscreteLogCache,
     DiscreteLogExponentError,
     DiscreteLogNotFoundError,
+    DiscreteLogProgress,
+    DiscreteLogTable,
     compute_discrete_log,
     compute_discrete_log_async,
     compute_discrete_log_cache,
@@ -206,6 +221,7 @@ from electionguard.election_polynomial import (
     verify_polynomial_coordinate,
 )
 from electionguard.elgamal import (
+    ElGamalAccumulator,
     ElGamalCiphertext,
     ElGamalKeyPair,
     ElGamalPublicKey,
@@ -238,9 +254,12 @@ from electionguard.group import (
     ElementModPorInt,
     ElementModQ,
     ElementModQorInt,
+    FixedBaseTable,
+    PrecomputedPowers,
     a_minus_b_q,
     a_plus_bc_q,
     add_q,
+    batch_is_valid_residue,
     div_p,
     div_q,
     g_pow_p,
@@ -251,11 +270,14 @@ from electionguard.group import (
     mult_inv_p,
     mult_p,
     mult_q,
+    multi_pow_p,
     negate_q,
     pow_p,
     pow_q,
     rand_q,
     rand_range_q,
+    register_fixed_base,
+    unregister_fixed_base,
 )
 from electionguard.guardian import (
     Guardian,
@@ -269,10 +291,12 @@ from electionguard.hash import (
     CryptoHashable,
     CryptoHashableAll,
     CryptoHashableT,
+    HashPrefix,
     hash_elems,
 )
 from electionguard.hmac import (
     get_hmac,
+    get_hmac_keystream,
 )
 from electionguard.key_ceremony import (
     CeremonyDetails,
@@ -308,6 +332,7 @@ from electionguard.logs import (
     log_error,
     log_handlers,
     log_info,
+    log_is_enabled,
     log_remove_handler,
     log_warning,
 )
@@ -372,11 +397,14 @@ from electionguard.tally import (
     CiphertextTally,
     CiphertextTallyContest,
     CiphertextTallySelection,
+    PartialCiphertextTally,
     PlaintextTally,
     PlaintextTallyContest,
     PlaintextTallySelection,
     PublishedCiphertextTally,
+    STREAM_WINDOW_SIZE,
     tally_ballot,
+    tally_ballot_stream,
     tally_ballots,
 )
 from electionguard.type import (
@@ -452,6 +480,7 @@ __all__ = [
     "CryptoHashable",
     "CryptoHashableAll",
     "CryptoHashableT",
+    "DEFAULT_TABLE_SIZE",
     "DataSize",
     "DataStore",
     "DecryptionMediator",
@@ -460,8 +489,11 @@ __all__ = [
     "DiscreteLogCache",
     "DiscreteLogExponentError",
     "DiscreteLogNotFoundError",
+    "DiscreteLogProgress",
+    "DiscreteLogTable",
     "DisjunctiveChaumPedersenProof",
     "EXTRA_SMALL_TEST_CONSTANTS",
+    "ElGamalAccumulator",
     "ElGamalCiphertext",
     "ElGamalKeyPair",
     "ElGamalPublicKey",
@@ -486,11 +518,13 @@ __all__ = [
     "EncryptionDevice",
     "EncryptionMediator",
     "FORMAT",
+    "FixedBaseTable",
     "GeopoliticalUnit",
     "Guardian",
     "GuardianId",
     "GuardianPair",
     "GuardianRecord",
+    "HashPrefix",
     "HashedElGamalCiphertext",
     "InternalManifest",
     "InternationalizedText",
@@ -507,6 +541,7 @@ __all__ = [
     "NullVoteException",
     "OrderedObjectBase",
     "OverVoteException",
+    "PartialCiphertextTally",
     "Party",
     "PlaintextBallot",
     "PlaintextBallotContest",
@@ -514,6 +549,7 @@ __all__ = [
     "PlaintextTally",
     "PlaintextTallyContest",
     "PlaintextTallySelection",
+    "PrecomputedPowers",
     "PrimeOption",
     "PrivateGuardianRecord",
     "Proof",
@@ -527,6 +563,7 @@ __all__ = [
     "ReportingUnitType",
     "SMALL_TEST_CONSTANTS",
     "STANDARD_CONSTANTS",
+    "STREAM_WINDOW_SIZE",
     "SUPPORTED_VOTE_VARIATIONS",
     "Scheduler",
     "SchnorrProof",
@@ -552,6 +589,10 @@ __all__ = [
     "ballot_is_valid_for_election",
     "ballot_is_valid_for_style",
     "ballot_validator",
+    "ballots_are_valid_for_election",
+    "batch_is_valid_disjunctive_chaum_pedersen",
+    "batch_is_valid_residue",
+    "batch_verify_disjunctive_chaum_pedersen",
     "big_integer",
     "byte_padding",
     "bytes_to_hex",
@@ -641,18 +682,24 @@ __all__ = [
     "get_ballots",
     "get_cofactor",
     "get_constants",
+    "get_constants_for_option",
     "get_file_handler",
     "get_generator",
+    "get_generator_mpz",
     "get_hash_for_device",
     "get_hmac",
+    "get_hmac_keystream",
     "get_i8n_value",
     "get_large_prime",
+    "get_large_prime_mpz",
     "get_optional",
     "get_or_else_optional",
     "get_or_else_optional_func",
+    "get_prime_option_from_environment",
     "get_schema",
     "get_shares_for_selection",
     "get_small_prime",
+    "get_small_prime_mpz",
     "get_stream_handler",
     "get_valid_ballot_shares",
     "group",
@@ -674,6 +721,7 @@ __all__ = [
     "log_error",
     "log_handlers",
     "log_info",
+    "log_is_enabled",
     "log_remove_handler",
     "log_warning",
     "logs",
@@ -693,6 +741,7 @@ __all__ = [
     "mult_inv_p",
     "mult_p",
     "mult_q",
+    "multi_pow_p",
     "negate_q",
     "nonces",
     "padded_decode",
@@ -708,13 +757,17 @@ __all__ = [
     "reconstruct_decryption_contest",
     "reconstruct_decryption_share",
     "reconstruct_decryption_share_for_ballot",
+    "register_fixed_base",
     "remove_padding",
+    "reset_constants",
     "scheduler",
     "schnorr",
     "selection_from",
     "selection_is_valid_for_style",
     "sequence_order_sort",
     "serialize",
+    "set_constants",
+    "set_prime_option",
     "singleton",
     "space_between_capitals",
     "spoil_ballot",
@@ -722,6 +775,7 @@ __all__ = [
     "submit_ballot_to_box",
     "tally",
     "tally_ballot",
+    "tally_ballot_stream",
     "tally_ballots",
     "to_file",
     "to_hex_bytes",
@@ -730,6 +784,8 @@ __all__ = [
     "to_raw",
     "to_ticks",
     "type",
+    "unregister_fixed_base",
+    "use_prime_option",
     "utils",
     "verify_election_partial_key_backup",
     "verify_election_partial_key_challenge",
@@ -9,6 +9,7 @@ from typing import (
     Iterable,
     Optional,
     Protocol,
+    Tuple,
     runtime_checkable,
 )
 
@@ -17,6 +18,7 @@ from .ballot_code import get_ballot_code
 from .chaum_pedersen import (
     ConstantChaumPedersenProof,
     DisjunctiveChaumPedersenProof,
+    batch_verify_disjunctive_chaum_pedersen,
     make_constant_chaum_pedersen,
     make_disjunctive_chaum_pedersen,
 )
@@ -32,7 +34,7 @@ from .elgamal import (
     HashedElGamalCiphertext,
     elgamal_add,
 )
-from .group import add_q, ElementModQ, ZERO_MOD_Q
+from .group import add_q, ElementModQ, PrecomputedPowers, ZERO_MOD_Q
 from .hash import CryptoHashCheckable, hash_elems
 from .logs import log_warning
 from .manifest import ContestDescription
@@ -43,6 +45,7 @@ from .utils import (
     OverVoteException,
     UnderVoteException,
     flatmap_optional,
+    get_optional,
     to_ticks,
 )
 
@@ -187,6 +190,23 @@ class CiphertextBallotSelection(
         :param elgamal_public_key: The election public key
         """
 
+        if not self.is_well_formed(encryption_seed):
+            return False
+
+        return get_optional(self.proof).is_valid(
+            self.ciphertext, elgamal_public_key, crypto_extended_base_hash
+        )
+
+    def is_well_formed(self, encryption_seed: ElementModQ) -> bool:
+        """
+        Given an encrypted BallotSelection, validates the `description_hash` and `crypto_hash`
+        against a specific seed and checks that a proof is present, without verifying the proof.
+        This allows the proofs of many selections to be verified together in a batch.
+
+        :param encryption_seed: the hash of the SelectionDescription, or
+                                whatever `ElementModQ` was used to populate the `description_hash` field.
+        """
+
         if encryption_seed != self.description_hash:
             log_warning(
                 (
@@ -210,9 +230,7 @@ class CiphertextBallotSelection(
             log_warning(f"no proof exists for: {self.object_id}")
             return False
 
-        return self.proof.is_valid(
-            self.ciphertext, elgamal_public_key, crypto_extended_base_hash
-        )
+        return True
 
     def crypto_hash_with(self, encryption_seed: ElementModQ) -> ElementModQ:
         """
@@ -249,12 +267,13 @@ def make_ciphertext_ballot_selection(
     nonce: Optional[ElementModQ] = None,
     crypto_hash: Optional[ElementModQ] = None,
     proof: Optional[DisjunctiveChaumPedersenProof] = None,
+    powers: Optional[PrecomputedPowers] = None,
 ) -> CiphertextBallotSelection:
     """
     Constructs a `CipherTextBallotSelection` object. Most of the parameters here match up to fields
     in the class, but this helper function will optionally compute a Chaum-Pedersen proof if the
     given nonce isn't `None`. Likewise, if a crypto_hash is not provided, it will be derived from
-    the other fields.
+    the other fields. Powers precomputed for the proof nonces may be given to speed up the proof.
     """
     if crypto_hash is None:
         crypto_hash = _ciphertext_ballot_selection_crypto_hash_with(
@@ -271,6 +290,7 @@ def make_ciphertext_ballot_selection(
                 crypto_extended_base_hash,
                 proof_seed,
                 selection_representation,
+                powers,
             ),
         )
 
@@ -653,12 +673,14 @@ def make_ciphertext_ballot_contest(
     proof: Optional[ConstantChaumPedersenProof] = None,
     nonce: Optional[ElementModQ] = None,
     extended_data: Optional[HashedElGamalCiphertext] = None,
+    powers: Optional[PrecomputedPowers] = None,
 ) -> CiphertextBallotContest:
     """
     Constructs a `CipherTextBallotContest` object. Most of the parameters here match up to fields
     in the class, but this helper function will optionally compute a Chaum-Pedersen proof if the
     ballot selections include their encryption nonces. Likewise, if a crypto_hash is not provided,
-    it will be derived from the other fields.
+    it will be derived from the other fields. Powers precomputed for the proof nonce may be given
+    to speed up the proof.
     """
     if crypto_hash is None:
         crypto_hash = _ciphertext_ballot_context_crypto_hash(
@@ -677,6 +699,7 @@ def make_ciphertext_ballot_contest(
                 elgamal_public_key,
                 proof_seed,
                 crypto_extended_base_hash,
+                powers,
             ),
         )
     return CiphertextBallotContest(
@@ -845,6 +868,32 @@ class CiphertextBallot(ElectionObjectBase, CryptoHashCheckable):
         Specifically, the seed in this context is the hash of the Election Manifest,
         or whatever `ElementModQ` was used to populate the `manifest_hash` field.
         """
+        selection_proofs = self.get_selection_proofs(
+            encryption_seed, elgamal_public_key, crypto_extended_base_hash
+        )
+        if selection_proofs is None:
+            return False
+
+        # The selection proofs share a public key and base hash, so verify them together
+        return all(
+            batch_verify_disjunctive_chaum_pedersen(
+                selection_proofs, elgamal_public_key, crypto_extended_base_hash
+            )
+        )
+
+    def get_selection_proofs(
+        self,
+        encryption_seed: ElementModQ,
+        elgamal_public_key: ElGamalPublicKey,
+        crypto_extended_base_hash: ElementModQ,
+    ) -> Optional[List[Tuple[ElGamalCiphertext, DisjunctiveChaumPedersenProof]]]:
+        """
+        Given an encrypted Ballot, validates the encryption state as `is_valid_encryption` does,
+        except for the proofs of the selections, which are returned instead of verified.
+        This allows the selection proofs of many ballots to be verified together in a batch.
+
+        :return: The ciphertext and proof of each selection, or None if the ballot is not valid
+        """
 
         if encryption_seed != self.manifest_hash:
             log_warning(
@@ -853,7 +902,7 @@ class CiphertextBallot(ElectionObjectBase, CryptoHashCheckable):
                     f"actual({str(self.manifest_hash)})"
                 )
             )
-            return False
+            return None
 
         recalculated_crypto_hash = self.crypto_hash_with(encryption_seed)
         if self.crypto_hash != recalculated_crypto_hash:
@@ -863,28 +912,30 @@ class CiphertextBallot(ElectionObjectBase, CryptoHashCheckable):
                     f"actual({str(self.crypto_hash)})"
                 )
             )
-            return False
+            return None
 
         # Check the proofs on the ballot
-        valid_proofs: List[bool] = []
+        is_valid = True
+        selection_proofs: List[
+            Tuple[ElGamalCiphertext, DisjunctiveChaumPedersenProof]
+        ] = []
 
         for contest in self.contests:
             for selection in contest.ballot_selections:
-                valid_proofs.append(
-                    selection.is_valid_encryption(
-                        selection.description_hash,
-                        elgamal_public_key,
-                        crypto_extended_base_hash,
+                if selection.is_well_formed(selection.description_hash):
+                    selection_proofs.append(
+                        (selection.ciphertext, get_optional(selection.proof))
                     )
-                )
-            valid_proofs.append(
-                contest.is_valid_encryption(
-                    contest.description_hash,
-                    elgamal_public_key,
-                    crypto_extended_base_hash,
-                )
-            )
-        return all(valid_proofs)
+                else:
+                    is_valid = False
+            if not contest.is_valid_encryption(
+                contest.description_hash,
+                elgamal_public_key,
+                crypto_extended_base_hash,
+            ):
+                is_valid = False
+
+        return selection_proofs if is_valid else None
 
 
 class BallotBoxState(Enum):
@@ -1,5 +1,13 @@
+from typing import List, Optional, Sequence, Tuple
+
 from .ballot import CiphertextBallot, CiphertextBallotContest, CiphertextBallotSelection
+from .chaum_pedersen import (
+    DisjunctiveChaumPedersenProof,
+    batch_is_valid_disjunctive_chaum_pedersen,
+    batch_verify_disjunctive_chaum_pedersen,
+)
 from .election import CiphertextElectionContext
+from .elgamal import ElGamalCiphertext
 from .logs import log_warning
 from .manifest import (
     ContestDescriptionWithPlaceholders,
@@ -35,6 +43,60 @@ def ballot_is_valid_for_election(
     return True
 
 
+def ballots_are_valid_for_election(
+    ballots: Sequence[CiphertextBallot],
+    internal_manifest: InternalManifest,
+    context: CiphertextElectionContext,
+    should_validate: bool,
+) -> List[bool]:
+    """
+    Determine if each of the ballots is valid for a given election.
+    The selection proofs of all the ballots are verified together in one batch,
+    and the proofs of each ballot are only verified separately if the batch fails.
+    :return: The validity of each ballot, in the order given
+    """
+    ballot_proofs: List[
+        Optional[List[Tuple[ElGamalCiphertext, DisjunctiveChaumPedersenProof]]]
+    ] = []
+    for ballot in ballots:
+        if not ballot_is_valid_for_style(ballot, internal_manifest):
+            ballot_proofs.append(None)
+            continue
+
+        proofs = (
+            ballot.get_selection_proofs(
+                internal_manifest.manifest_hash,
+                context.elgamal_public_key,
+                context.crypto_extended_base_hash,
+            )
+            if should_validate
+            else []
+        )
+        if proofs is None:
+            log_warning(
+                f"ballots_are_valid_for_election: mismatching ballot encryption {ballot.object_id}"
+            )
+        ballot_proofs.append(proofs)
+
+    selection_proofs = [
+        proof for proofs in ballot_proofs if proofs is not None for proof in proofs
+    ]
+    if not selection_proofs or batch_is_valid_disjunctive_chaum_pedersen(
+        selection_proofs, context.elgamal_public_key, context.crypto_extended_base_hash
+    ):
+        return [proofs is not None for proofs in ballot_proofs]
+
+    return [
+        proofs is not None
+        and all(
+            batch_verify_disjunctive_chaum_pedersen(
+                proofs, context.elgamal_public_key, context.crypto_extended_base_hash
+            )
+        )
+        for proofs in ballot_proofs
+    ]
+
+
 def selection_is_valid_for_style(
     selection: CiphertextBallotSelection, description: SelectionDescription
 ) -> bool:
@@ -98,12 +160,13 @@ def ballot_is_valid_for_style(
     """
     descriptions = internal_manifest.get_contests_for(ballot.style_id)
 
+    # index the contests by id, keeping the first contest for an id
+    contests_by_id = {
+        contest.object_id: contest for contest in reversed(ballot.contests)
+    }
+
     for description in descriptions:
-        use_contest = None
-        for contest in ballot.contests:
-            if description.object_id == contest.object_id:
-                use_contest = contest
-                break
+        use_contest = contests_by_id.get(description.object_id)
 
         # verify the contest exists on the ballot
         if use_contest is None:
@@ -116,12 +179,12 @@ def ballot_is_valid_for_style(
             return False
 
         # verify the selection metadata
+        selections_by_id = {
+            selection.object_id: selection
+            for selection in reversed(use_contest.ballot_selections)
+        }
         for selection_description in description.ballot_selections:
-            use_selection = None
-            for selection in use_contest.ballot_selections:
-                if selection_description.object_id == selection.object_id:
-                    use_selection = selection
-                    break
+            use_selection = selections_by_id.get(selection_description.object_id)
 
             if use_selection is None:
                 log_warning(
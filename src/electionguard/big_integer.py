@@ -1,10 +1,9 @@
-from typing import Any, Tuple, Union
-from base64 import b16decode
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
 
 # pylint: disable=no-name-in-module
 from gmpy2 import mpz
 
-from .utils import BYTE_ORDER
+from .utils import BYTE_ENCODING, BYTE_ORDER
 
 
 def _hex_to_int(input: str) -> int:
@@ -29,31 +28,63 @@ def bytes_to_hex(input: bytes) -> str:
     return _int_to_hex(int.from_bytes(input, BYTE_ORDER))
 
 
-_zero = mpz(0)
+_INTEGER_TYPES = (int, mpz)
 
 
-def _convert_to_element(data: Union[int, str]) -> Tuple[str, int]:
-    """Convert element to consistent types"""
-    if isinstance(data, str):
-        integer = _hex_to_int(data)
-        hex = _int_to_hex(integer)
-    else:
-        hex = _int_to_hex(data)
-        integer = data
-    return (hex, integer)
+class BigInteger:
+    """
+    A specialized representation of a big integer in python.
 
+    The integer is held as an `mpz` for math calculations. The hex representation used
+    for hashing and serialization, and its encoded bytes, are only computed on first use
+    and then cached.
+    """
 
-class BigInteger(str):
-    """A specialized representation of a big integer in python"""
+    __slots__ = ("_value", "_hex", "_hex_encoding")
 
-    _value: mpz = _zero
+    _value: mpz
+    _hex: Optional[str]
+    _hex_encoding: Optional[bytes]
 
-    def __new__(cls, data: Union[int, str]):  # type: ignore
-        (hex, integer) = _convert_to_element(data)
-        big_int = super(BigInteger, cls).__new__(cls, hex)
-        big_int._value = mpz(integer)
+    def __new__(cls, data: Union[int, str, "BigInteger"]):  # type: ignore
+        big_int = super(BigInteger, cls).__new__(cls)
+        if isinstance(data, BigInteger):
+            big_int._value = data.value
+        elif isinstance(data, str):
+            big_int._value = mpz(_hex_to_int(data))
+        else:
+            big_int._value = mpz(data)
+        big_int._hex = None
+        big_int._hex_encoding = None
         return big_int
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Support pickling, e.g. when sending elements to a process pool."""
+        return (self.__class__, (int(self._value),))
+
+    def __copy__(self) -> "BigInteger":
+        """Elements are immutable, so a copy is the element itself."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "BigInteger":
+        """Elements are immutable, so a copy is the element itself."""
+        return self
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[[Any], "BigInteger"]]:
+        """Validators for pydantic models and schemas."""
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: Any) -> "BigInteger":
+        """Validate a value as this type, converting from int or hex when necessary."""
+        return value if isinstance(value, cls) else cls(value)
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: Dict[str, Any]) -> None:
+        """Big integers are represented as hex strings in json."""
+        field_schema.update(type="string")
+
     @property
     def value(self) -> mpz:
         """Get internal value for math calculations"""
@@ -65,9 +96,9 @@ class BigInteger(str):
 
     def __eq__(self, other: Any) -> bool:
         """Overload == (equal to) operator."""
-        return (
-            isinstance(other, BigInteger) and int(self.value) == int(other.value)
-        ) or (isinstance(other, int) and int(self.value) == other)
+        if isinstance(other, BigInteger):
+            return self._value == other._value
+        return isinstance(other, _INTEGER_TYPES) and self._value == other
 
     def __ne__(self, other: Any) -> bool:
         """Overload != (not equal to) operator."""
@@ -75,37 +106,60 @@ class BigInteger(str):
 
     def __lt__(self, other: Any) -> bool:
         """Overload <= (less than) operator."""
-        return (
-            isinstance(other, BigInteger) and int(self.value) < int(other.value)
-        ) or (isinstance(other, int) and int(self.value) < other)
+        if isinstance(other, BigInteger):
+            return self._value < other._value
+        return isinstance(other, _INTEGER_TYPES) and self._value < other
 
     def __le__(self, other: Any) -> bool:
         """Overload <= (less than or equal) operator."""
-        return self.__lt__(other) or self.__eq__(other)
+        if isinstance(other, BigInteger):
+            return self._value <= other._value
+        return isinstance(other, _INTEGER_TYPES) and self._value <= other
 
     def __gt__(self, other: Any) -> bool:
         """Overload > (greater than) operator."""
-        return (
-            isinstance(other, BigInteger) and int(self.value) > int(other.value)
-        ) or (isinstance(other, int) and int(self.value) > other)
+        if isinstance(other, BigInteger):
+            return self._value > other._value
+        return isinstance(other, _INTEGER_TYPES) and self._value > other
 
     def __ge__(self, other: Any) -> bool:
         """Overload >= (greater than or equal) operator."""
-        return self.__gt__(other) or self.__eq__(other)
+        if isinstance(other, BigInteger):
+            return self._value >= other._value
+        return isinstance(other, _INTEGER_TYPES) and self._value >= other
 
     def __hash__(self) -> int:
-        """Overload the hashing function."""
-        return hash(self.value)
+        """Overload the hashing function, consistent with the hash of the equal int."""
+        return hash(self._value)
+
+    def __str__(self) -> str:
+        """Overload str conversion with the hex representation."""
+        return self.to_hex()
+
+    def __repr__(self) -> str:
+        """Overload repr with the class name and hex representation."""
+        return f"{self.__class__.__name__}('{self.to_hex()}')"
 
     def to_hex(self) -> str:
         """
         Convert from the element to the hex representation of bytes.
         """
-        return str(self)
+        if self._hex is None:
+            self._hex = _int_to_hex(self._value)
+        return self._hex
 
-    def to_hex_bytes(self) -> bytes:
+    def to_hex_encoding(self) -> bytes:
         """
-        Convert from the element to the representation of bytes by first going through hex.
+        Convert from the element to its hex representation encoded as utf-8, as fed to hashes.
         """
+        if self._hex_encoding is None:
+            self._hex_encoding = self.to_hex().encode(BYTE_ENCODING)
+        return self._hex_encoding
 
-        return b16decode(self)
+    def to_hex_bytes(self) -> bytes:
+        """
+        Convert from the element to the representation of bytes, matching the bytes of its hex.
+        """
+        return int(self._value).to_bytes(
+            max(1, (self._value.bit_length() + 7) // 8), BYTE_ORDER
+        )
@@ -1,12 +1,19 @@
 # pylint: disable=too-many-instance-attributes
 from dataclasses import dataclass
+from secrets import randbits
+from typing import List, Optional, Sequence, Tuple
 
+from .constants import get_generator, get_small_prime
 from .elgamal import ElGamalCiphertext
 from .group import (
+    BATCH_EXPONENT_BITS,
     ElementModQ,
     ElementModP,
+    PrecomputedPowers,
+    batch_is_valid_residue,
     g_pow_p,
     mult_p,
+    multi_pow_p,
     pow_p,
     a_minus_b_q,
     a_plus_bc_q,
@@ -19,6 +26,7 @@ from .hash import hash_elems
 from .logs import log_warning
 from .nonces import Nonces
 from .proof import Proof, ProofUsage
+from .utils import get_or_else_optional
 
 
 @dataclass
@@ -88,7 +96,7 @@ class DisjunctiveChaumPedersenProof(Proof):
         consistent_gv0 = g_pow_p(v0) == mult_p(a0, pow_p(alpha, c0))
         consistent_gv1 = g_pow_p(v1) == mult_p(a1, pow_p(alpha, c1))
         consistent_kv0 = pow_p(k, v0) == mult_p(b0, pow_p(beta, c0))
-        consistent_gc1kv1 = mult_p(g_pow_p(c1), pow_p(k, v1)) == mult_p(
+        consistent_gc1kv1 = multi_pow_p([get_generator(), k], [c1, v1]) == mult_p(
             b1, pow_p(beta, c1)
         )
 
@@ -138,6 +146,133 @@ class DisjunctiveChaumPedersenProof(Proof):
         return success
 
 
+def batch_verify_disjunctive_chaum_pedersen(
+    proofs: Sequence[Tuple[ElGamalCiphertext, DisjunctiveChaumPedersenProof]],
+    k: ElementModP,
+    q: ElementModQ,
+) -> List[bool]:
+    """
+    Validates many "disjunctive" Chaum-Pedersen (zero or one) proofs at once.
+
+    All four verification equations of every proof are raised to small random exponents
+    and multiplied into a single equation, so the whole batch costs little more than
+    a handful of individual proofs. If the batch does not verify, each proof is
+    checked with `DisjunctiveChaumPedersenProof.is_valid` to identify the invalid ones.
+
+    :param proofs: The ciphertext messages and their proofs
+    :param k: The public key of the election
+    :param q: The extended base hash of the election
+    :return: The validity of each proof, in the order given
+    """
+    if len(proofs) == 0:
+        return []
+
+    if batch_is_valid_disjunctive_chaum_pedersen(proofs, k, q):
+        return [True] * len(proofs)
+
+    return [proof.is_valid(message, k, q) for (message, proof) in proofs]
+
+
+def batch_is_valid_disjunctive_chaum_pedersen(
+    proofs: Sequence[Tuple[ElGamalCiphertext, DisjunctiveChaumPedersenProof]],
+    k: ElementModP,
+    q: ElementModQ,
+) -> bool:
+    """
+    Check a batch of disjunctive Chaum-Pedersen proofs with one combined equation,
+    without identifying the invalid proofs.
+
+    :param proofs: The ciphertext messages and their proofs
+    :param k: The public key of the election
+    :param q: The extended base hash of the election
+    :return: False if at least one proof is invalid, or if the batch cannot be soundly
+        combined because Q is too small for the random exponents
+    """
+    if get_small_prime().bit_length() <= BATCH_EXPONENT_BITS:
+        return False
+    if not k.is_valid_residue():
+        return False
+
+    residues: List[ElementModP] = []
+    for (message, proof) in proofs:
+        alpha = message.pad
+        beta = message.data
+        if not (
+            proof.proof_zero_challenge.is_in_bounds()
+            and proof.proof_one_challenge.is_in_bounds()
+            and proof.proof_zero_response.is_in_bounds()
+            and proof.proof_one_response.is_in_bounds()
+            and add_q(proof.proof_zero_challenge, proof.proof_one_challenge)
+            == proof.challenge
+            == hash_elems(
+                q,
+                alpha,
+                beta,
+                proof.proof_zero_pad,
+                proof.proof_zero_data,
+                proof.proof_one_pad,
+                proof.proof_one_data,
+            )
+        ):
+            return False
+        residues.extend(
+            [
+                alpha,
+                beta,
+                proof.proof_zero_pad,
+                proof.proof_zero_data,
+                proof.proof_one_pad,
+                proof.proof_one_data,
+            ]
+        )
+
+    if not batch_is_valid_residue(residues):
+        return False
+
+    # Each proof satisfies g^v0 = a0 A^c0, g^v1 = a1 A^c1, K^v0 = b0 B^c0 and g^c1 K^v1 = b1 B^c1.
+    # Raise these to random exponents s0..s3 and multiply every equation of every proof together.
+    small_prime = get_small_prime()
+    g_exponent = 0
+    k_exponent = 0
+    bases: List[ElementModP] = []
+    exponents: List[int] = []
+    for (message, proof) in proofs:
+        s0, s1, s2, s3 = (randbits(BATCH_EXPONENT_BITS) for _ in range(4))
+        c0 = int(proof.proof_zero_challenge)
+        c1 = int(proof.proof_one_challenge)
+        v0 = int(proof.proof_zero_response)
+        v1 = int(proof.proof_one_response)
+
+        g_exponent += s0 * v0 + s1 * v1 + s3 * c1
+        k_exponent += s2 * v0 + s3 * v1
+        bases.extend(
+            [
+                proof.proof_zero_pad,
+                proof.proof_one_pad,
+                proof.proof_zero_data,
+                proof.proof_one_data,
+                message.pad,
+                message.data,
+            ]
+        )
+        # the residues have order Q, so their exponents are reduced mod Q
+        exponents.extend(
+            [
+                s0,
+                s1,
+                s2,
+                s3,
+                (s0 * c0 + s1 * c1) % small_prime,
+                (s2 * c0 + s3 * c1) % small_prime,
+            ]
+        )
+
+    left = multi_pow_p(
+        [get_generator(), k], [g_exponent % small_prime, k_exponent % small_prime]
+    )
+    return left == multi_pow_p(bases, exponents)
+
+
 @dataclass
 class ChaumPedersenProof(Proof):
     """
@@ -325,8 +460,8 @@ class ConstantChaumPedersenProof(Proof):
         )
 
         # The equation 𝑔^𝐿𝐾^𝑣 = 𝑏𝐵^𝐶 mod 𝑝
-        consistent_kv = in_bounds_constant and mult_p(
-            g_pow_p(mult_p(c, constant_q)), pow_p(k, v)
+        consistent_kv = in_bounds_constant and multi_pow_p(
+            [get_generator(), k], [mult_p(c, constant_q), v]
         ) == mult_p(b, pow_p(beta, c))
 
         success = (
@@ -374,6 +509,7 @@ def make_disjunctive_chaum_pedersen(
     q: ElementModQ,
     seed: ElementModQ,
     plaintext: int,
+    powers: Optional[PrecomputedPowers] = None,
 ) -> DisjunctiveChaumPedersenProof:
     """
     Produce a "disjunctive" proof that an encryption of a given plaintext is either an encrypted zero or one.
@@ -387,14 +523,15 @@ def make_disjunctive_chaum_pedersen(
                         usually the election extended base hash (𝑄')
     :param seed: Used to generate other random values here
     :param plaintext: Zero or one
+    :param powers: Optional powers of the generator and public key precomputed for the nonces
     """
 
     assert (
         0 <= plaintext <= 1
     ), "make_disjunctive_chaum_pedersen only supports plaintexts of 0 or 1"
     if plaintext == 0:
-        return make_disjunctive_chaum_pedersen_zero(message, r, k, q, seed)
-    return make_disjunctive_chaum_pedersen_one(message, r, k, q, seed)
+        return make_disjunctive_chaum_pedersen_zero(message, r, k, q, seed, powers)
+    return make_disjunctive_chaum_pedersen_one(message, r, k, q, seed, powers)
 
 
 def make_disjunctive_chaum_pedersen_zero(
@@ -403,6 +540,7 @@ def make_disjunctive_chaum_pedersen_zero(
     k: ElementModP,
     q: ElementModQ,
     seed: ElementModQ,
+    powers: Optional[PrecomputedPowers] = None,
 ) -> DisjunctiveChaumPedersenProof:
     """
     Produces a "disjunctive" proof that an encryption of zero is either an encrypted zero or one.
@@ -413,6 +551,7 @@ def make_disjunctive_chaum_pedersen_zero(
     :param q: A value used when generating the challenge,
                         usually the election extended base hash (𝑄')
     :param seed: Used to generate other random values here
+    :param powers: Optional powers of the generator and public key precomputed for the nonces
     """
     alpha = message.pad
     beta = message.data
@@ -421,10 +560,11 @@ def make_disjunctive_chaum_pedersen_zero(
     c1, v, u0 = Nonces(seed, "disjoint-chaum-pedersen-proof")[0:3]
 
     # Compute the NIZKP
-    a0 = g_pow_p(u0)
-    b0 = pow_p(k, u0)
-    a1 = g_pow_p(v)
-    b1 = mult_p(pow_p(k, v), g_pow_p(c1))
+    powers = get_or_else_optional(powers, PrecomputedPowers(k))
+    a0 = powers.g_pow_p(u0)
+    b0 = powers.pow_p(k, u0)
+    a1 = powers.g_pow_p(v)
+    b1 = mult_p(powers.pow_p(k, v), powers.g_pow_p(c1))
     c = hash_elems(q, alpha, beta, a0, b0, a1, b1)
     c0 = a_minus_b_q(c, c1)
     v0 = a_plus_bc_q(u0, c0, r)
@@ -439,6 +579,7 @@ def make_disjunctive_chaum_pedersen_one(
     k: ElementModP,
     q: ElementModQ,
     seed: ElementModQ,
+    powers: Optional[PrecomputedPowers] = None,
 ) -> DisjunctiveChaumPedersenProof:
     """
     Produces a "disjunctive" proof that an encryption of one is either an encrypted zero or one.
@@ -449,6 +590,7 @@ def make_disjunctive_chaum_pedersen_one(
     :param q: A value used when generating the challenge,
                         usually the election extended base hash (𝑄')
     :param seed: Used to generate other random values here
+    :param powers: Optional powers of the generator and public key precomputed for the nonces
     """
     alpha = message.pad
     beta = message.data
@@ -457,10 +599,11 @@ def make_disjunctive_chaum_pedersen_one(
     w, v, u1 = Nonces(seed, "disjoint-chaum-pedersen-proof")[0:3]
 
     # Compute the NIZKP
-    a0 = g_pow_p(v)
-    b0 = mult_p(pow_p(k, v), g_pow_p(w))
-    a1 = g_pow_p(u1)
-    b1 = pow_p(k, u1)
+    powers = get_or_else_optional(powers, PrecomputedPowers(k))
+    a0 = powers.g_pow_p(v)
+    b0 = mult_p(powers.pow_p(k, v), powers.g_pow_p(w))
+    a1 = powers.g_pow_p(u1)
+    b1 = powers.pow_p(k, u1)
     c = hash_elems(q, alpha, beta, a0, b0, a1, b1)
     c0 = negate_q(w)
     c1 = add_q(c, w)
@@ -508,6 +651,7 @@ def make_constant_chaum_pedersen(
     k: ElementModP,
     seed: ElementModQ,
     hash_header: ElementModQ,
+    powers: Optional[PrecomputedPowers] = None,
 ) -> ConstantChaumPedersenProof:
     """
     Produces a proof that a given encryption corresponds to a specific total value.
@@ -519,14 +663,16 @@ def make_constant_chaum_pedersen(
     :param seed: Used to generate other random values here
     :param hash_header: A value used when generating the challenge,
                         usually the election extended base hash (𝑄')
+    :param powers: Optional powers of the generator and public key precomputed for the nonces
     """
     alpha = message.pad
     beta = message.data
 
     # Pick one random number in Q.
     u = Nonces(seed, "constant-chaum-pedersen-proof")[0]
-    a = g_pow_p(u)  # 𝑔^𝑢𝑖 mod 𝑝
-    b = pow_p(k, u)  # 𝐴^𝑢𝑖 mod 𝑝
+    powers = get_or_else_optional(powers, PrecomputedPowers(k))
+    a = powers.g_pow_p(u)  # 𝑔^𝑢𝑖 mod 𝑝
+    b = powers.pow_p(k, u)  # 𝐴^𝑢𝑖 mod 𝑝
     c = hash_elems(hash_header, alpha, beta, a, b)  # sha256(𝑄', A, B, a, b)
     v = a_plus_bc_q(u, c, r)
 
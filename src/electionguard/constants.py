@@ -1,8 +1,13 @@
 """Creating and managing mathematic constants for the election."""
+from contextlib import contextmanager
 from os import getenv
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import Iterator
+
+# pylint: disable=no-name-in-module
+from gmpy2 import mpz
 
 from .big_integer import BigInteger
 
@@ -63,13 +68,14 @@ class PrimeOption(Enum):
     TestOnly = "TestOnly"
 
 
-def get_constants() -> ElectionConstants:
-    """Get constants for the election by the option for the primes."""
+def get_prime_option_from_environment() -> PrimeOption:
+    """Get the option for the primes from the `PRIME_OPTION` environment variable."""
     env_option = getenv("PRIME_OPTION")
-    option: PrimeOption = (
-        PrimeOption(env_option) if env_option is not None else PrimeOption.Standard
-    )
+    return PrimeOption(env_option) if env_option is not None else PrimeOption.Standard
+
 
+def get_constants_for_option(option: PrimeOption) -> ElectionConstants:
+    """Get constants for the election by the option for the primes."""
     option_map = {
         PrimeOption.Standard: STANDARD_CONSTANTS,
         PrimeOption.TestOnly: LARGE_TEST_CONSTANTS,
@@ -77,7 +83,106 @@ def get_constants() -> ElectionConstants:
     return option_map.get(option) or STANDARD_CONSTANTS
 
 
-get_large_prime = lambda: int(get_constants().large_prime.value)
-get_small_prime = lambda: int(get_constants().small_prime.value)
-get_cofactor = lambda: int(get_constants().cofactor.value)
-get_generator = lambda: int(get_constants().generator.value)
+class _ActiveConstants:
+    """
+    The constants in use for the election, resolved once and pre-converted
+    so the math functions do not convert them on every call.
+    """
+
+    constants: ElectionConstants
+    large_prime: int
+    small_prime: int
+    generator: int
+    large_prime_mpz: mpz
+    small_prime_mpz: mpz
+    generator_mpz: mpz
+
+    def __init__(self, constants: ElectionConstants) -> None:
+        self.constants = constants
+        self.large_prime_mpz = constants.large_prime.value
+        self.small_prime_mpz = constants.small_prime.value
+        self.generator_mpz = constants.generator.value
+        self.large_prime = int(self.large_prime_mpz)
+        self.small_prime = int(self.small_prime_mpz)
+        self.generator = int(self.generator_mpz)
+
+
+_active = _ActiveConstants(
+    get_constants_for_option(get_prime_option_from_environment())
+)
+
+
+def set_constants(constants: ElectionConstants) -> None:
+    """
+    Set the constants used for the election in this process.
+
+    Processes started by spawning rather than forking resolve their constants
+    from the `PRIME_OPTION` environment variable instead, except the worker processes
+    of the `Scheduler`, which are started with the constants in use.
+    """
+    global _active  # pylint: disable=global-statement
+    _active = _ActiveConstants(constants)
+
+
+def set_prime_option(option: PrimeOption) -> None:
+    """Set the constants used for the election by the option for the primes."""
+    set_constants(get_constants_for_option(option))
+
+
+def reset_constants() -> None:
+    """Reset the constants used for the election to the `PRIME_OPTION` environment variable."""
+    set_prime_option(get_prime_option_from_environment())
+
+
+@contextmanager
+def use_prime_option(option: PrimeOption) -> Iterator[ElectionConstants]:
+    """
+    Temporarily use the constants for the option for the primes, e.g. within a test.
+    Can also be used as a decorator.
+    """
+    previous = get_constants()
+    set_prime_option(option)
+    try:
+        yield get_constants()
+    finally:
+        set_constants(previous)
+
+
+def get_constants() -> ElectionConstants:
+    """Get constants for the election."""
+    return _active.constants
+
+
+def get_large_prime() -> int:
+    """Get the large prime or p."""
+    return _active.large_prime
+
+
+def get_small_prime() -> int:
+    """Get the small prime or q."""
+    return _active.small_prime
+
+
+def get_cofactor() -> int:
+    """Get the cofactor or r."""
+    return int(_active.constants.cofactor.value)
+
+
+def get_generator() -> int:
+    """Get the generator or g."""
+    return _active.generator
+
+
+def get_large_prime_mpz() -> mpz:
+    """Get the large prime or p as an mpz for math calculations."""
+    return _active.large_prime_mpz
+
+
+def get_small_prime_mpz() -> mpz:
+    """Get the small prime or q as an mpz for math calculations."""
+    return _active.small_prime_mpz
+
+
+def get_generator_mpz() -> mpz:
+    """Get the generator or g as an mpz for math calculations."""
+    return _active.generator_mpz
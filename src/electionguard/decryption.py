@@ -23,9 +23,7 @@ from .election_polynomial import compute_lagrange_coefficient
 from .group import (
     ElementModP,
     ElementModQ,
-    ONE_MOD_P,
-    mult_p,
-    pow_p,
+    multi_pow_p,
     pow_q,
     rand_q,
 )
@@ -531,11 +529,11 @@ def compute_recovery_public_key(
     K_ij^(l^j) for j in 0..k-1.  K_ij is coefficients[j].public_key
     """
 
-    pub_key = ONE_MOD_P
-    for index, commitment in enumerate(missing_guardian_key.coefficient_commitments):
-        exponent = pow_q(guardian_key.sequence_order, index)
-        pub_key = mult_p(pub_key, pow_p(commitment, exponent))
-    return pub_key
+    commitments = missing_guardian_key.coefficient_commitments
+    exponents = [
+        pow_q(guardian_key.sequence_order, index) for index in range(len(commitments))
+    ]
+    return multi_pow_p(commitments, exponents)
 
 
 def reconstruct_decryption_share(
@@ -649,13 +647,13 @@ def reconstruct_decryption_contest(
             for available_guardian_id, compensated_contest in contest_shares.items()
         }
 
-        share_pow_p = []
-        for available_guardian_id, share in compensated_selection_shares.items():
-            share_pow_p.append(
-                pow_p(share.share, lagrange_coefficients[available_guardian_id])
-            )
-
-        reconstructed_share = mult_p(*share_pow_p)
+        reconstructed_share = multi_pow_p(
+            [share.share for share in compensated_selection_shares.values()],
+            [
+                lagrange_coefficients[available_guardian_id]
+                for available_guardian_id in compensated_selection_shares
+            ],
+        )
 
         selections[selection.object_id] = create_ciphertext_decryption_selection(
             selection.object_id,
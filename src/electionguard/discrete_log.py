@@ -2,9 +2,35 @@
 # support for computing discrete logs, with a cache so they're never recomputed
 
 import asyncio
-from typing import Dict, Tuple
-
-from .constants import get_generator
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from hashlib import sha256
+from math import isqrt
+import mmap
+import os
+from os import PathLike
+import struct
+import sys
+from threading import RLock
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from weakref import WeakKeyDictionary
+
+# pylint: disable=no-name-in-module
+from gmpy2 import mpz, powmod
+
+from .constants import get_generator, get_generator_mpz, get_large_prime_mpz
+from .scheduler import Scheduler
 from .singleton import Singleton
 from .group import BaseElement, ElementModP, ONE_MOD_P, mult_p
 
@@ -15,6 +41,32 @@ _DLOG_MAX_EXPONENT = 100_000_000
 
 _INITIAL_CACHE = {ONE_MOD_P: 0}
 
+_default_mutexes: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    WeakKeyDictionary()
+)
+"""Default mutexes of the async discrete log, created within each event loop."""
+
+_pending_discrete_logs: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[ElementModP, asyncio.Future[int]]]" = (
+    WeakKeyDictionary()
+)
+"""Discrete logs being computed for each event loop, shared by concurrent requests."""
+
+DiscreteLogProgress = Callable[[int, int], None]
+"""Progress of a precomputation, called with the number of exponents computed and the total."""
+
+_T = TypeVar("_T")
+
+_PRECOMPUTE_CHUNK_SIZE = 1 << 16
+"""The number of exponents computed by each task of a precomputation."""
+
+DEFAULT_TABLE_SIZE = 1 << 16
+"""The default number of baby steps held by a discrete log table."""
+
+_FINGERPRINT_MASK = (1 << 64) - 1
+_TABLE_MAGIC = b"EGDLOG01"
+_TABLE_HEADER = struct.Struct("<8s32sQ")
+"""Header of a saved table: magic, digest of the constants and table size."""
+
 
 class DiscreteLogExponentError(ValueError):
     """Raised when the max exponent is larger than the system allows."""
@@ -62,7 +114,7 @@ def compute_discrete_log(
 async def compute_discrete_log_async(
     element: ElementModP,
     cache: DiscreteLogCache,
-    mutex: asyncio.Lock = asyncio.Lock(),
+    mutex: Optional[asyncio.Lock] = None,
     max_exponent: int = _DLOG_MAX_EXPONENT,
     lazy_evaluation: bool = True,
 ) -> Tuple[int, DiscreteLogCache]:
@@ -72,7 +124,9 @@ async def compute_discrete_log_async(
     multiple times when the exponent is at most in the single-digit millions.
     Performance will degrade if it's much larger.
 
-    Note: *this function is thread-safe*. For the best possible performance,
+    Note: *this function is thread-safe*. Growing the cache runs in the event loop's
+    executor while holding the mutex (by default, one per event loop), so it never
+    blocks the event loop. For the best possible performance,
     pre-compute the discrete log of a number you expect to have the biggest
     exponent you'll ever see. After that, the cache will be fully loaded,
     and every call will be nothing more than a dictionary lookup.
@@ -80,21 +134,116 @@ async def compute_discrete_log_async(
     if element in cache:
         return (cache[element], cache)
 
-    async with mutex:
+    async with mutex or _get_default_mutex():
         if element in cache:
             return (cache[element], cache)
         if not lazy_evaluation:
             raise DiscreteLogNotFoundError(element)
 
-        _cache = compute_discrete_log_cache(element, cache, max_exponent)
+        _cache = await asyncio.get_running_loop().run_in_executor(
+            None, compute_discrete_log_cache, element, cache, max_exponent
+        )
         return (_cache[element], _cache)
 
 
+def _get_default_mutex() -> asyncio.Lock:
+    """Get the default mutex for growing caches within the running event loop."""
+    loop = asyncio.get_running_loop()
+    mutex = _default_mutexes.get(loop)
+    if mutex is None:
+        mutex = _default_mutexes[loop] = asyncio.Lock()
+    return mutex
+
+
+def _compute_powers(start: int, count: int) -> List[int]:
+    """Compute g^start, ..., g^(start + count - 1) mod p."""
+    large_prime = get_large_prime_mpz()
+    generator = get_generator_mpz()
+    element = powmod(generator, start, large_prime)
+    powers = []
+    for _ in range(count):
+        powers.append(int(element))
+        element = element * generator % large_prime
+    return powers
+
+
+def _compute_fingerprints(start: int, count: int) -> bytes:
+    """Compute the fingerprints of g^start, ..., g^(start + count - 1) mod p."""
+    large_prime = get_large_prime_mpz()
+    generator = get_generator_mpz()
+    element = powmod(generator, start, large_prime)
+    fingerprints = array("Q")
+    for _ in range(count):
+        fingerprints.append(_fingerprint(element))
+        element = element * generator % large_prime
+    return fingerprints.tobytes()
+
+
+def _compute_chunks(
+    task: Callable[[int, int], _T],
+    start: int,
+    stop: int,
+    scheduler: Optional[Scheduler] = None,
+    progress: Optional[DiscreteLogProgress] = None,
+) -> Iterator[_T]:
+    """
+    Split the exponents [start, stop) into chunks, each computed from g^start of the chunk,
+    and compute them concurrently in the scheduler's process pool when there is more
+    than one. Without a scheduler, one is opened and closed for the computation.
+    The results are yielded in the order of the exponents as each round of chunks is
+    computed, so the caller can store them without holding every round at once.
+    """
+    chunks = [
+        (chunk_start, min(_PRECOMPUTE_CHUNK_SIZE, stop - chunk_start))
+        for chunk_start in range(start, stop, _PRECOMPUTE_CHUNK_SIZE)
+    ]
+    if len(chunks) > 1 and scheduler is None:
+        with Scheduler() as chunk_scheduler:
+            yield from _schedule_chunks(task, chunks, chunk_scheduler, progress)
+    else:
+        yield from _schedule_chunks(task, chunks, scheduler, progress)
+
+
+def _schedule_chunks(
+    task: Callable[[int, int], _T],
+    chunks: List[Tuple[int, int]],
+    scheduler: Optional[Scheduler],
+    progress: Optional[DiscreteLogProgress],
+) -> Iterator[_T]:
+    """
+    Compute the chunks in rounds of one chunk per cpu, yielding the results of each round,
+    and computing them serially when there is no scheduler or its process pool fails.
+    """
+    total = sum(count for (_, count) in chunks)
+    round_size = Scheduler.cpu_count() if len(chunks) > 1 else 1
+
+    completed = 0
+    for index in range(0, len(chunks), round_size):
+        arguments = chunks[index : index + round_size]
+        round_results: List[_T] = (
+            scheduler.schedule(task, arguments) if scheduler is not None else []
+        )
+        if len(round_results) != len(arguments):
+            round_results = [task(*chunk_arguments) for chunk_arguments in arguments]
+        completed += sum(count for (_, count) in arguments)
+        if progress is not None:
+            progress(completed, total)
+        yield from round_results
+
+
 def precompute_discrete_log_cache(
-    max_exponent: int, cache: DiscreteLogCache = None
+    max_exponent: int,
+    cache: DiscreteLogCache = None,
+    scheduler: Optional[Scheduler] = None,
+    progress: Optional[DiscreteLogProgress] = None,
 ) -> DiscreteLogCache:
     """
     Precompute the discrete log by the max exponent.
+
+    The exponents are computed in chunks, concurrently in the scheduler's process pool
+    when there is more than one chunk.
+
+    :param progress: Called with the number of exponents computed and the total.
     """
 
     if max_exponent > _DLOG_MAX_EXPONENT:
@@ -109,11 +258,13 @@ def precompute_discrete_log_cache(
     if prev_exponent >= max_exponent:
         return cache
 
-    g = ElementModP(get_generator(), False)
-
-    for exponent in range(prev_exponent + 1, max_exponent + 1):
-        current_element = mult_p(g, current_element)
-        cache[current_element] = exponent
+    exponent = prev_exponent + 1
+    for powers in _compute_chunks(
+        _compute_powers, exponent, max_exponent + 1, scheduler, progress
+    ):
+        for power in powers:
+            cache[ElementModP(power, False)] = exponent
+            exponent += 1
 
     return cache
 
@@ -149,46 +300,349 @@ def compute_discrete_log_cache(
     return cache
 
 
+def _fingerprint(element: mpz) -> int:
+    """Truncate an element (mod p) to the 64 bit key used by discrete log tables."""
+    return int(element & _FINGERPRINT_MASK)
+
+
+@lru_cache(maxsize=None)
+def _get_constants_digest(large_prime: mpz, generator: mpz) -> bytes:
+    """Digest of the constants a discrete log table is built for."""
+    return sha256(f"{large_prime:X}|{generator:X}".encode()).digest()
+
+
+def _current_constants_digest() -> bytes:
+    return _get_constants_digest(get_large_prime_mpz(), get_generator_mpz())
+
+
+class DiscreteLogTable:
+    """
+    A baby-step giant-step table for discrete logs (base g, mod p).
+
+    The table holds the baby steps g^j for j in [0, table_size) as 64 bit fingerprints
+    sorted for binary search, alongside their exponents. Larger exponents are found by
+    giant steps of g^-table_size from the element, so a lookup up to a max exponent N
+    takes at most N / table_size multiplications. Every match is checked against
+    the element, so fingerprint collisions never produce a wrong exponent.
+    """
+
+    _fingerprints: Sequence[int]
+    _exponents: Sequence[int]
+    _constants_digest: bytes
+
+    def __init__(
+        self,
+        fingerprints: Sequence[int],
+        exponents: Sequence[int],
+        constants_digest: bytes,
+    ) -> None:
+        if len(fingerprints) != len(exponents) or not fingerprints:
+            raise ValueError("discrete log table requires one exponent per fingerprint")
+        self._fingerprints = fingerprints
+        self._exponents = exponents
+        self._constants_digest = constants_digest
+
+    @classmethod
+    def build(
+        cls,
+        table_size: int = DEFAULT_TABLE_SIZE,
+        scheduler: Optional[Scheduler] = None,
+        progress: Optional[DiscreteLogProgress] = None,
+    ) -> "DiscreteLogTable":
+        """
+        Build the table of baby steps for the current election constants.
+
+        The baby steps are computed in chunks, concurrently in the scheduler's process pool
+        when there is more than one chunk.
+
+        :param progress: Called with the number of baby steps computed and the total.
+        """
+        if table_size < 1:
+            raise ValueError("discrete log table size must be positive")
+
+        fingerprints = array("Q")
+        for chunk in _compute_chunks(
+            _compute_fingerprints, 0, table_size, scheduler, progress
+        ):
+            fingerprints.frombytes(chunk)
+
+        order = sorted(range(table_size), key=fingerprints.__getitem__)
+        return cls(
+            array("Q", (fingerprints[j] for j in order)),
+            array("Q", order),
+            _current_constants_digest(),
+        )
+
+    @property
+    def table_size(self) -> int:
+        """The number of baby steps in the table."""
+        return len(self._exponents)
+
+    def is_for_current_constants(self) -> bool:
+        """Check the table was built for the election constants in use."""
+        return self._constants_digest == _current_constants_digest()
+
+    def discrete_log(
+        self, element: ElementModP, max_exponent: int = _DLOG_MAX_EXPONENT
+    ) -> int:
+        """
+        Compute the discrete log (base g, mod p) of the element, searching exponents
+        up to the max exponent.
+
+        :raises DiscreteLogNotFoundError: the exponent is larger than the max exponent.
+        """
+        if max_exponent > _DLOG_MAX_EXPONENT:
+            raise DiscreteLogExponentError(max_exponent)
+        if not self.is_for_current_constants():
+            raise ValueError(
+                "discrete log table was built for other election constants"
+            )
+
+        large_prime = get_large_prime_mpz()
+        generator = get_generator_mpz()
+        table_size = self.table_size
+        giant_step = powmod(generator, -table_size, large_prime)
+
+        current = element.value
+        for offset in range(0, max_exponent + 1, table_size):
+            for baby_step in self._find(_fingerprint(current)):
+                if offset + baby_step > max_exponent:
+                    break
+                if powmod(generator, baby_step, large_prime) == current:
+                    return offset + baby_step
+            current = current * giant_step % large_prime
+        raise DiscreteLogNotFoundError(element)
+
+    def _find(self, fingerprint: int) -> Iterator[int]:
+        """Find the baby steps with the fingerprint, smallest first."""
+        index = bisect_left(self._fingerprints, fingerprint)
+        while (
+            index < len(self._fingerprints) and self._fingerprints[index] == fingerprint
+        ):
+            yield self._exponents[index]
+            index += 1
+
+    def save(self, path: Union[str, PathLike]) -> None:
+        """
+        Save the table to a file. The file is written under a temporary name and then
+        replaced, so other processes never map a partially written table.
+        """
+        temporary_path = f"{os.fspath(path)}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as table_file:
+            table_file.write(
+                _TABLE_HEADER.pack(
+                    _TABLE_MAGIC, self._constants_digest, self.table_size
+                )
+            )
+            for values in (self._fingerprints, self._exponents):
+                data = array("Q", values)
+                if sys.byteorder != "little":
+                    data.byteswap()
+                data.tofile(table_file)
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(
+        cls, path: Union[str, PathLike], memory_map: bool = False
+    ) -> "DiscreteLogTable":
+        """
+        Load a table saved to a file.
+
+        :param memory_map: Map the file read-only instead of reading it into memory,
+            so every process mapping the same file shares one copy of the table.
+        """
+        if memory_map and sys.byteorder == "little":
+            return cls._map(path)
+
+        with open(path, "rb") as table_file:
+            (constants_digest, table_size) = _read_table_header(
+                table_file.read(_TABLE_HEADER.size)
+            )
+            fingerprints = array("Q")
+            exponents = array("Q")
+            fingerprints.fromfile(table_file, table_size)
+            exponents.fromfile(table_file, table_size)
+        if sys.byteorder != "little":
+            fingerprints.byteswap()
+            exponents.byteswap()
+        return cls(fingerprints, exponents, constants_digest)
+
+    @classmethod
+    def _map(cls, path: Union[str, PathLike]) -> "DiscreteLogTable":
+        """Map a table saved to a file, with views of its fingerprints and exponents."""
+        with open(path, "rb") as table_file:
+            mapping = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+        (constants_digest, table_size) = _read_table_header(
+            mapping[: _TABLE_HEADER.size]
+        )
+        start = _TABLE_HEADER.size
+        middle = start + 8 * table_size
+        end = middle + 8 * table_size
+        if len(mapping) < end:
+            raise ValueError("discrete log table file is truncated")
+        view = memoryview(mapping)
+        return cls(
+            view[start:middle].cast("Q"), view[middle:end].cast("Q"), constants_digest
+        )
+
+
+def _read_table_header(header: bytes) -> Tuple[bytes, int]:
+    """Read the constants digest and table size from the header of a saved table."""
+    if len(header) != _TABLE_HEADER.size:
+        raise ValueError("discrete log table file is truncated")
+    (magic, constants_digest, table_size) = _TABLE_HEADER.unpack(header)
+    if magic != _TABLE_MAGIC:
+        raise ValueError("file is not a discrete log table")
+    return (constants_digest, table_size)
+
+
 class DiscreteLog(Singleton):
     """
     A class instance of the discrete log that includes a cache.
     """
 
     _cache: DiscreteLogCache = {ONE_MOD_P: 0}
-    _mutex = asyncio.Lock()
+    _table_lock = RLock()
     _max_exponent: int = _DLOG_MAX_EXPONENT
     _lazy_evaluation: bool = True
+    _table: Optional[DiscreteLogTable] = None
+    _table_size: int = DEFAULT_TABLE_SIZE
+    _table_path: Optional[Union[str, PathLike]] = None
 
     def get_cache(self) -> DiscreteLogCache:
         return self._cache
 
+    def get_table(self) -> DiscreteLogTable:
+        """Get the baby-step giant-step table, building it when first needed."""
+        table = self._table
+        if table is not None and self._is_table_current(table):
+            return table
+        with self._table_lock:
+            table = self._table
+            if table is None or not self._is_table_current(table):
+                table = self._load_table_file() or DiscreteLogTable.build(
+                    self._table_size
+                )
+                type(self)._table = table
+            return table
+
+    def _is_table_current(self, table: DiscreteLogTable) -> bool:
+        return table.is_for_current_constants() and (
+            self._table_path is not None or table.table_size == self._table_size
+        )
+
+    def set_table_path(self, path: Optional[Union[str, PathLike]]) -> None:
+        """
+        Back the table with a memory-mapped file at the path, built by `precompute_cache`
+        and shared read-only by every process using the same path. None removes the file
+        backing and uses an in-memory table.
+        """
+        type(self)._table_path = path
+        type(self)._table = None
+
+    def _load_table_file(self) -> Optional[DiscreteLogTable]:
+        """Map the table file, if there is one for the current constants."""
+        if self._table_path is None or not os.path.exists(self._table_path):
+            return None
+        table = DiscreteLogTable.load(self._table_path, memory_map=True)
+        return table if table.is_for_current_constants() else None
+
+    def set_table_size(self, table_size: int) -> None:
+        """Set the number of baby steps of the table, rebuilt on next use if different."""
+        if table_size < 1:
+            raise ValueError("discrete log table size must be positive")
+        type(self)._table_size = table_size
+
+    def save_table(self, path: Union[str, PathLike]) -> None:
+        """Save the baby-step giant-step table to a file."""
+        self.get_table().save(path)
+
+    def load_table(self, path: Union[str, PathLike], memory_map: bool = False) -> None:
+        """Load a baby-step giant-step table saved to a file."""
+        table = DiscreteLogTable.load(path, memory_map)
+        type(self)._table = table
+        type(self)._table_size = table.table_size
+
     def set_max_exponent(self, max_exponent: int) -> None:
         self._max_exponent = max_exponent
 
     def set_lazy_evaluation(self, lazy_evaluation: bool) -> None:
         self._lazy_evaluation = lazy_evaluation
 
-    def precompute_cache(self, exponent: int) -> None:
-        if exponent > self._max_exponent:
-            exponent = self._max_exponent
-
-        precompute_discrete_log_cache(exponent, self._cache)
-
-    async def precompute_cache_async(self, exponent: int) -> None:
+    def precompute_cache(
+        self,
+        exponent: int,
+        scheduler: Optional[Scheduler] = None,
+        progress: Optional[DiscreteLogProgress] = None,
+    ) -> None:
+        """
+        Precompute discrete logs up to the exponent. With a table path, the table file
+        is built unless it already holds enough baby steps, then mapped. The file holds
+        the larger of the table size and sqrt(exponent) + 1 baby steps, so a lookup up to
+        the exponent takes at most sqrt(exponent) giant steps. The file takes 16 bytes per
+        baby step plus a 48 byte header, so it grows with the square root of the exponent,
+        about 1 MB for the default table size, which covers exponents up to 2^32.
+
+        :param scheduler: Scheduler whose process pool computes the chunks of exponents.
+        :param progress: Called with the number of exponents computed and the total.
+        """
         if exponent > self._max_exponent:
             exponent = self._max_exponent
 
-        async with self._mutex:
-            precompute_discrete_log_cache(exponent)
+        with self._table_lock:
+            if self._table_path is None:
+                precompute_discrete_log_cache(
+                    exponent, self._cache, scheduler, progress
+                )
+                return
+
+            table_size = max(self._table_size, isqrt(exponent) + 1)
+            table = self._load_table_file()
+            if table is None or table.table_size < table_size:
+                # Release any mapping of the old file before it is replaced
+                table = type(self)._table = None
+                DiscreteLogTable.build(table_size, scheduler, progress).save(
+                    self._table_path
+                )
+                table = DiscreteLogTable.load(self._table_path, memory_map=True)
+            type(self)._table = table
+
+    async def precompute_cache_async(
+        self,
+        exponent: int,
+        scheduler: Optional[Scheduler] = None,
+        progress: Optional[DiscreteLogProgress] = None,
+    ) -> None:
+        """Precompute discrete logs up to the exponent in the event loop's executor."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.precompute_cache, exponent, scheduler, progress
+        )
 
     def discrete_log(self, element: ElementModP) -> int:
-        (result, _cache) = compute_discrete_log(
-            element, self._cache, self._max_exponent, self._lazy_evaluation
-        )
-        return result
+        if element in self._cache:
+            return self._cache[element]
+        if not self._lazy_evaluation:
+            raise DiscreteLogNotFoundError(element)
+        return self.get_table().discrete_log(element, self._max_exponent)
 
     async def discrete_log_async(self, element: ElementModP) -> int:
-        (result, _cache) = await compute_discrete_log_async(
-            element, self._cache, self._mutex, self._max_exponent, self._lazy_evaluation
-        )
-        return result
+        """
+        Compute the discrete log without blocking the event loop. Lookups missing from
+        the cache, including building the table, run in the event loop's executor and
+        concurrent requests for the same element share one computation.
+        """
+        if element in self._cache:
+            return self._cache[element]
+        if not self._lazy_evaluation:
+            raise DiscreteLogNotFoundError(element)
+
+        loop = asyncio.get_running_loop()
+        pending = _pending_discrete_logs.setdefault(loop, {})
+        if element not in pending:
+            result = asyncio.ensure_future(
+                loop.run_in_executor(None, self.discrete_log, element)
+            )
+            result.add_done_callback(lambda _: pending.pop(element, None))
+            pending[element] = result
+        # Shielded so a cancelled request does not cancel the others sharing the result
+        return await asyncio.shield(pending[element])
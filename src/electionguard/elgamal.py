@@ -1,13 +1,19 @@
 from dataclasses import dataclass
+from logging import INFO
 from typing import Any, Iterable, Optional, Union
 
+# pylint: disable=no-name-in-module
+from gmpy2 import mpz
+
 
 from .big_integer import bytes_to_hex
 from .byte_padding import to_padded_bytes
+from .constants import get_large_prime_mpz
 from .discrete_log import DiscreteLog
 from .group import (
     ElementModQ,
     ElementModP,
+    PrecomputedPowers,
     g_pow_p,
     mult_p,
     mult_inv_p,
@@ -17,9 +23,9 @@ from .group import (
     rand_range_q,
 )
 from .hash import hash_elems
-from .hmac import get_hmac
-from .logs import log_info, log_error
-from .utils import get_optional
+from .hmac import get_hmac, get_hmac_keystream
+from .logs import log_error, log_info, log_is_enabled
+from .utils import BYTE_ORDER, get_optional, get_or_else_optional
 
 ElGamalSecretKey = ElementModQ
 ElGamalPublicKey = ElementModP
@@ -130,15 +136,13 @@ class HashedElGamalCiphertext:
         :return: Decrypted plaintext message.
         """
 
-        session_key = hash_elems(self.pad, pow_p(self.pad, secret_key))
+        session_key = hash_elems(self.pad, pow_p(self.pad, secret_key)).to_hex_bytes()
+        seed = encryption_seed.to_hex_bytes()
         data_bytes = to_padded_bytes(self.data)
 
-        (ciphertext_chunks, bit_length) = _get_chunks(data_bytes)
-        mac_key = get_hmac(
-            session_key.to_hex_bytes(),
-            encryption_seed.to_hex_bytes(),
-            bit_length,
-        )
+        ciphertext = _pad_to_blocks(data_bytes)
+        bit_length = len(ciphertext) * 8
+        mac_key = get_hmac(session_key, seed, bit_length)
         to_mac = self.pad.to_hex_bytes() + data_bytes
         mac = bytes_to_hex(get_hmac(mac_key, to_mac))
 
@@ -146,16 +150,7 @@ class HashedElGamalCiphertext:
             log_error("MAC verification failed in decryption.")
             return None
 
-        data = b""
-        for i, block in enumerate(ciphertext_chunks):
-            data_key = get_hmac(
-                session_key.to_hex_bytes(),
-                encryption_seed.to_hex_bytes(),
-                bit_length,
-                (i + 1),
-            )
-            data += bytes([a ^ b for (a, b) in zip(block, data_key)])
-        return data
+        return _xor_with_keystream(ciphertext, session_key, seed, bit_length)
 
 
 def elgamal_keypair_from_secret(a: ElementModQ) -> Optional[ElGamalKeyPair]:
@@ -191,7 +186,10 @@ def elgamal_combine_public_keys(keys: Iterable[ElGamalPublicKey]) -> ElGamalPubl
 
 
 def elgamal_encrypt(
-    message: int, nonce: ElementModQ, public_key: ElGamalPublicKey
+    message: int,
+    nonce: ElementModQ,
+    public_key: ElGamalPublicKey,
+    powers: Optional[PrecomputedPowers] = None,
 ) -> Optional[ElGamalCiphertext]:
     """
     Encrypts a set length message with a given random nonce and an ElGamal public key.
@@ -199,20 +197,23 @@ def elgamal_encrypt(
     :param message: Known length message (m) to elgamal_encrypt; must be an integer in [0,Q).
     :param nonce: Randomly chosen nonce in [1,Q).
     :param public_key: ElGamal public key.
+    :param powers: Optional powers of the generator and public key precomputed for the nonce.
     :return: An `ElGamalCiphertext`.
     """
     if nonce == ZERO_MOD_Q:
         log_error("ElGamal encryption requires a non-zero nonce")
         return None
 
-    pad = g_pow_p(nonce)
+    powers = get_or_else_optional(powers, PrecomputedPowers(public_key))
+    pad = powers.g_pow_p(nonce)
     gpowp_m = g_pow_p(message)
-    pubkey_pow_n = pow_p(public_key, nonce)
+    pubkey_pow_n = powers.pow_p(public_key, nonce)
     data = mult_p(gpowp_m, pubkey_pow_n)
 
-    log_info(f": publicKey: {public_key.to_hex()}")
-    log_info(f": pad: {pad.to_hex()}")
-    log_info(f": data: {data.to_hex()}")
+    if log_is_enabled(INFO):
+        log_info(": publicKey: %s", public_key)
+        log_info(": pad: %s", pad)
+        log_info(": data: %s", data)
 
     return ElGamalCiphertext(pad, data)
 
@@ -222,6 +223,7 @@ def hashed_elgamal_encrypt(
     nonce: ElementModQ,
     public_key: ElGamalPublicKey,
     encryption_seed: ElementModQ,
+    powers: Optional[PrecomputedPowers] = None,
 ) -> HashedElGamalCiphertext:
     """
     Encrypts a variable length byte message with a given random nonce and an ElGamal public key.
@@ -230,51 +232,107 @@ def hashed_elgamal_encrypt(
     :param nonce: Randomly chosen nonce in [1, Q).
     :param public_key: ElGamal public key.
     :param encryption_seed: Encryption seed (Q) for election.
+    :param powers: Optional powers of the generator and public key precomputed for the nonce.
     """
 
-    pad = g_pow_p(nonce)
-    pubkey_pow_n = pow_p(public_key, nonce)
+    powers = get_or_else_optional(powers, PrecomputedPowers(public_key))
+    pad = powers.g_pow_p(nonce)
+    pubkey_pow_n = powers.pow_p(public_key, nonce)
 
-    session_key = hash_elems(pad, pubkey_pow_n)
+    session_key = hash_elems(pad, pubkey_pow_n).to_hex_bytes()
+    seed = encryption_seed.to_hex_bytes()
 
-    (message_chunks, bit_length) = _get_chunks(message)
-    data = b""
-    for i, block in enumerate(message_chunks):
-        data_key = get_hmac(
-            session_key.to_hex_bytes(),
-            encryption_seed.to_hex_bytes(),
-            bit_length,
-            (i + 1),
-        )
-        data += bytes([a ^ b for (a, b) in zip(block, data_key)])
+    padded_message = _pad_to_blocks(message)
+    bit_length = len(padded_message) * 8
+    data = _xor_with_keystream(padded_message, session_key, seed, bit_length)
 
-    mac_key = get_hmac(
-        session_key.to_hex_bytes(), encryption_seed.to_hex_bytes(), bit_length
-    )
+    mac_key = get_hmac(session_key, seed, bit_length)
     to_mac = pad.to_hex_bytes() + data
     mac = get_hmac(mac_key, to_mac)
 
-    log_info(f": publicKey: {public_key.to_hex()}")
-    log_info(f": pad: {pad.to_hex()}")
-    log_info(f": data: {data!r}")
-    log_info(f": mac: {bytes_to_hex(mac)}")
-    log_info(f"to_mac {to_mac!r}")
+    if log_is_enabled(INFO):
+        log_info(": publicKey: %s", public_key)
+        log_info(": pad: %s", pad)
+        log_info(": data: %r", data)
+        log_info(": mac: %s", bytes_to_hex(mac))
+        log_info("to_mac %r", to_mac)
 
     return HashedElGamalCiphertext(pad, bytes_to_hex(data), bytes_to_hex(mac))
 
 
-def _get_chunks(message: bytes) -> tuple[list[bytes], int]:
+def _pad_to_blocks(message: bytes) -> bytes:
+    """Pad the message with zeros to a whole number of blocks."""
     remainder = len(message) % _BLOCK_SIZE
     if remainder:
-        message += bytes([0 for _n in range(_BLOCK_SIZE - remainder)])
-    number_of_blocks = int(len(message) / _BLOCK_SIZE)
-    return (
-        [
-            message[_BLOCK_SIZE * i : _BLOCK_SIZE * (i + 1)]
-            for i in range(number_of_blocks)
-        ],
-        len(message) * 8,
+        return message + bytes(_BLOCK_SIZE - remainder)
+    return message
+
+
+def _xor_with_keystream(
+    blocks: bytes, session_key: bytes, seed: bytes, bit_length: int
+) -> bytes:
+    """
+    Xor the padded blocks with the keystream of hmac data keys for each block,
+    which either encrypts or decrypts them.
+    """
+    keystream = get_hmac_keystream(
+        session_key, seed, bit_length, len(blocks) // _BLOCK_SIZE
     )
+    data = int.from_bytes(blocks, BYTE_ORDER) ^ int.from_bytes(keystream, BYTE_ORDER)
+    return data.to_bytes(len(blocks), BYTE_ORDER)
+
+
+class ElGamalAccumulator:
+    """
+    A homomorphic accumulation of ElGamal ciphertexts. The products of the pads and data
+    are kept as integers, so adding a ciphertext creates no new elements, and an
+    `ElGamalCiphertext` is only created when the total is asked for.
+    """
+
+    __slots__ = ("_pad", "_data")
+
+    _pad: mpz
+    _data: mpz
+
+    def __init__(self, *ciphertexts: ElGamalCiphertext) -> None:
+        self._pad = mpz(1)
+        self._data = mpz(1)
+        self.add_all(ciphertexts)
+
+    def add(self, *ciphertexts: ElGamalCiphertext) -> "ElGamalAccumulator":
+        """
+        Homomorphically add the ciphertexts to the accumulation.
+        """
+        return self.add_all(ciphertexts)
+
+    def add_all(self, ciphertexts: Iterable[ElGamalCiphertext]) -> "ElGamalAccumulator":
+        """
+        Homomorphically add all of the ciphertexts to the accumulation.
+        """
+        pad = self._pad
+        data = self._data
+        large_prime = get_large_prime_mpz()
+        for ciphertext in ciphertexts:
+            pad = pad * ciphertext.pad.value % large_prime
+            data = data * ciphertext.data.value % large_prime
+        self._pad = pad
+        self._data = data
+        return self
+
+    def combine(self, other: "ElGamalAccumulator") -> "ElGamalAccumulator":
+        """
+        Homomorphically add another accumulation to this one.
+        """
+        large_prime = get_large_prime_mpz()
+        self._pad = self._pad * other._pad % large_prime
+        self._data = self._data * other._data % large_prime
+        return self
+
+    def ciphertext(self) -> ElGamalCiphertext:
+        """
+        Get the accumulated ciphertext.
+        """
+        return ElGamalCiphertext(ElementModP(self._pad), ElementModP(self._data))
 
 
 def elgamal_add(*ciphertexts: ElGamalCiphertext) -> ElGamalCiphertext:
@@ -284,10 +342,6 @@ def elgamal_add(*ciphertexts: ElGamalCiphertext) -> ElGamalCiphertext:
     """
     assert len(ciphertexts) != 0, "Must have one or more ciphertexts for elgamal_add"
 
-    result = ciphertexts[0]
-    for c in ciphertexts[1:]:
-        result = ElGamalCiphertext(
-            mult_p(result.pad, c.pad), mult_p(result.data, c.data)
-        )
-
-    return result
+    if len(ciphertexts) == 1:
+        return ciphertexts[0]
+    return ElGamalAccumulator(*ciphertexts).ciphertext()
@@ -1,6 +1,8 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Type, TypeVar
+from logging import INFO
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 from uuid import getnode
 
 from .ballot import (
@@ -19,8 +21,8 @@ from .ballot_code import get_hash_for_device
 from .election import CiphertextElectionContext
 from .elgamal import ElGamalPublicKey, elgamal_encrypt, hashed_elgamal_encrypt
 from .serialize import padded_decode, padded_encode
-from .group import ElementModQ, rand_q
-from .logs import log_info, log_warning
+from .group import ElementModQ, PrecomputedPowers, rand_q, register_fixed_base
+from .logs import log_info, log_is_enabled, log_warning
 from .manifest import (
     InternalManifest,
     ContestDescription,
@@ -28,7 +30,8 @@ from .manifest import (
     SelectionDescription,
 )
 from .nonces import Nonces
-from .type import SelectionId
+from .scheduler import Scheduler
+from .type import BallotId, SelectionId
 from .utils import (
     ContestException,
     NullVoteException,
@@ -94,6 +97,15 @@ class EncryptionDevice:
         return int(datetime.utcnow().timestamp())
 
 
+@dataclass
+class _PrecomputedBallot:
+    """The master nonce of a ballot and the powers precomputed for its nonces."""
+
+    style_id: str
+    nonce: ElementModQ
+    powers: PrecomputedPowers
+
+
 class EncryptionMediator:
     """
     An object for caching election and encryption state.
@@ -104,6 +116,8 @@ class EncryptionMediator:
     _internal_manifest: InternalManifest
     _context: CiphertextElectionContext
     _encryption_seed: ElementModQ
+    _precomputed_ballots: Dict[BallotId, Future[_PrecomputedBallot]]
+    _precompute_executor: Optional[ThreadPoolExecutor]
 
     def __init__(
         self,
@@ -114,20 +128,315 @@ class EncryptionMediator:
         self._internal_manifest = internal_manifest
         self._context = context
         self._encryption_seed = encryption_device.get_hash()
+        self._precomputed_ballots = {}
+        self._precompute_executor = None
+
+    def __enter__(self) -> "EncryptionMediator":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Discard the ballots still being precomputed, and stop the background thread
+        precomputing them. A later `precompute` starts a new thread.
+        """
+
+        for precomputed in self._precomputed_ballots.values():
+            precomputed.cancel()
+        self._precomputed_ballots.clear()
+        if self._precompute_executor is not None:
+            self._precompute_executor.shutdown()
+            self._precompute_executor = None
+
+    def precompute(
+        self,
+        ballot_id: BallotId,
+        style_id: str,
+        nonce: Optional[ElementModQ] = None,
+    ) -> None:
+        """
+        Precompute the exponentiations for encrypting a ballot before its votes are known,
+        such as while the voter marks it, so `encrypt` only has cheap multiplications left.
+
+        The exponentiations are computed on a background thread, so this returns at once,
+        and `encrypt` waits for them if the ballot is encrypted before they are done.
+        The thread is stopped by `close`, or on leaving the mediator as a context manager.
+        They only depend on the nonces of the ballot, which are derived from its id and
+        master nonce, so the ballot is encrypted with the master nonce chosen here.
+        The precomputed values take about 4 KB of memory for each selection on the ballot,
+        and are kept until the ballot is encrypted.
+
+        :param ballot_id: the `object_id` of the ballot that will be encrypted
+        :param style_id: the ballot style of the ballot
+        :param nonce: an optional master nonce for the ballot, a random nonce is used by default
+        """
+
+        self.discard_precomputed(ballot_id)
+        random_master_nonce = get_or_else_optional_func(nonce, lambda: rand_q())
+        if self._precompute_executor is None:
+            self._precompute_executor = ThreadPoolExecutor(max_workers=1)
+        self._precomputed_ballots[ballot_id] = self._precompute_executor.submit(
+            _precompute_ballot,
+            self._internal_manifest,
+            self._context.elgamal_public_key,
+            ballot_id,
+            style_id,
+            random_master_nonce,
+        )
+
+    def discard_precomputed(self, ballot_id: BallotId) -> None:
+        """
+        Discard the precomputed exponentiations for a ballot that will not be encrypted.
+        """
+
+        precomputed = self._precomputed_ballots.pop(ballot_id, None)
+        if precomputed is not None:
+            precomputed.cancel()
 
     def encrypt(self, ballot: PlaintextBallot) -> Optional[CiphertextBallot]:
         """
-        Encrypt the specified ballot using the cached election context.
+        Encrypt the specified ballot using the cached election context,
+        and any exponentiations precomputed for it.
         """
 
         log_info(f" encrypt: objectId: {ballot.object_id}")
+        precomputed = self._take_precomputed(ballot)
         encrypted_ballot = encrypt_ballot(
-            ballot, self._internal_manifest, self._context, self._encryption_seed
+            ballot,
+            self._internal_manifest,
+            self._context,
+            self._encryption_seed,
+            precomputed.nonce if precomputed is not None else None,
+            powers=precomputed.powers if precomputed is not None else None,
         )
         if encrypted_ballot is not None and encrypted_ballot.code is not None:
             self._encryption_seed = encrypted_ballot.code
         return encrypted_ballot
 
+    def encrypt_batch(
+        self,
+        ballots: List[PlaintextBallot],
+        nonces: Optional[List[ElementModQ]] = None,
+        scheduler: Optional[Scheduler] = None,
+    ) -> List[Optional[CiphertextBallot]]:
+        """
+        Encrypt the specified ballots in order using the cached election context,
+        and any exponentiations precomputed for them.
+
+        The ballots are split into a chunk per cpu, and each chunk is encrypted in a worker
+        process, so the manifest and context are sent to each worker once.
+        If the process pool fails, the ballots are encrypted in this process instead.
+        The ballot codes are then chained in order, so the result is the same as encrypting
+        each ballot in turn with `encrypt`.
+
+        :param ballots: the ballots to encrypt, in the order of the ballot code chain
+        :param nonces: optional master nonces for the ballots, by default the nonces chosen
+            when precomputing the ballots, or random nonces
+        :param scheduler: an optional scheduler to encrypt the ballots with, so its pools are
+            reused across batches. By default a scheduler is opened and closed for the batch.
+        :return: the encrypted ballots, or None for each ballot that could not be encrypted
+        """
+
+        log_info(f" encrypt_batch: {len(ballots)} ballots")
+        if nonces is not None and len(nonces) != len(ballots):
+            log_warning(
+                f"encrypt_batch cannot encrypt {len(ballots)} ballots with {len(nonces)} nonces"
+            )
+            return [None for _ in ballots]
+        if len(ballots) == 0:
+            return []
+
+        precomputed_ballots = [self._take_precomputed(ballot) for ballot in ballots]
+        master_nonces = (
+            nonces
+            if nonces is not None
+            else [
+                precomputed.nonce if precomputed is not None else rand_q()
+                for precomputed in precomputed_ballots
+            ]
+        )
+        # the precomputed powers are only of use with the nonce they were computed for
+        ballots_powers = [
+            precomputed.powers
+            if precomputed is not None and precomputed.nonce == nonce
+            else None
+            for (precomputed, nonce) in zip(precomputed_ballots, master_nonces)
+        ]
+
+        ballots_contests: List[Optional[List[CiphertextBallotContest]]]
+        if scheduler is None:
+            with Scheduler() as batch_scheduler:
+                ballots_contests = self._encrypt_contests_in_chunks(
+                    ballots, master_nonces, ballots_powers, batch_scheduler
+                )
+        else:
+            ballots_contests = self._encrypt_contests_in_chunks(
+                ballots, master_nonces, ballots_powers, scheduler
+            )
+
+        encrypted_ballots: List[Optional[CiphertextBallot]] = []
+        for (ballot, contests, nonce) in zip(ballots, ballots_contests, master_nonces):
+            encrypted_ballot = (
+                _make_encrypted_ballot(
+                    ballot,
+                    self._internal_manifest,
+                    self._context,
+                    self._encryption_seed,
+                    contests,
+                    nonce,
+                )
+                if contests is not None
+                else None
+            )
+            if encrypted_ballot is not None and encrypted_ballot.code is not None:
+                self._encryption_seed = encrypted_ballot.code
+            encrypted_ballots.append(encrypted_ballot)
+        return encrypted_ballots
+
+    def _take_precomputed(
+        self, ballot: PlaintextBallot
+    ) -> Optional[_PrecomputedBallot]:
+        """
+        Take the exponentiations precomputed for a ballot, waiting for them to be done,
+        if they were precomputed for the style of the ballot.
+        """
+
+        precomputed = self._precomputed_ballots.pop(ballot.object_id, None)
+        if precomputed is None:
+            return None
+        precomputed_ballot = precomputed.result()
+        if precomputed_ballot.style_id != ballot.style_id:
+            return None
+        return precomputed_ballot
+
+    def _encrypt_contests_in_chunks(
+        self,
+        ballots: List[PlaintextBallot],
+        nonces: List[ElementModQ],
+        ballots_powers: List[Optional[PrecomputedPowers]],
+        scheduler: Scheduler,
+    ) -> List[Optional[List[CiphertextBallotContest]]]:
+        """
+        Encrypt the contests of the ballots in a chunk of ballots per cpu,
+        encrypting them in this process if the process pool fails.
+        """
+
+        chunk_size = -(-len(ballots) // max(1, Scheduler.cpu_count()))
+        chunks = [
+            (
+                ballots[index : index + chunk_size],
+                nonces[index : index + chunk_size],
+                ballots_powers[index : index + chunk_size],
+                self._internal_manifest,
+                self._context,
+            )
+            for index in range(0, len(ballots), chunk_size)
+        ]
+        chunk_results: List[
+            List[Optional[List[CiphertextBallotContest]]]
+        ] = scheduler.schedule(_encrypt_ballots_in_worker, chunks)
+        if len(chunk_results) == len(chunks):
+            return [contests for chunk in chunk_results for contests in chunk]
+
+        log_warning("encrypt_batch process pool failed, encrypting in this process")
+        return [
+            _encrypt_ballot_with_nonce(
+                ballot, self._internal_manifest, self._context, nonce, powers=powers
+            )
+            for (ballot, nonce, powers) in zip(ballots, nonces, ballots_powers)
+        ]
+
+
+def _encrypt_ballots_in_worker(
+    ballots: List[PlaintextBallot],
+    nonces: List[ElementModQ],
+    ballots_powers: List[Optional[PrecomputedPowers]],
+    internal_manifest: InternalManifest,
+    context: CiphertextElectionContext,
+) -> List[Optional[List[CiphertextBallotContest]]]:
+    """
+    Encrypt the contests of a chunk of ballots in a worker process.
+    """
+    return [
+        _encrypt_ballot_with_nonce(
+            ballot, internal_manifest, context, nonce, powers=powers
+        )
+        for (ballot, nonce, powers) in zip(ballots, nonces, ballots_powers)
+    ]
+
+
+def _precompute_ballot(
+    internal_manifest: InternalManifest,
+    elgamal_public_key: ElGamalPublicKey,
+    ballot_id: BallotId,
+    style_id: str,
+    random_master_nonce: ElementModQ,
+) -> _PrecomputedBallot:
+    """
+    Precompute the powers of the generator and the public key for the nonces of a ballot.
+    """
+
+    (generator_exponents, public_key_exponents) = _get_precomputable_exponents(
+        internal_manifest, ballot_id, style_id, random_master_nonce
+    )
+    return _PrecomputedBallot(
+        style_id,
+        random_master_nonce,
+        PrecomputedPowers(
+            elgamal_public_key, generator_exponents, public_key_exponents
+        ),
+    )
+
+
+def _get_precomputable_exponents(
+    internal_manifest: InternalManifest,
+    ballot_id: BallotId,
+    style_id: str,
+    random_master_nonce: ElementModQ,
+) -> Tuple[List[ElementModQ], List[ElementModQ]]:
+    """
+    Get the nonces the generator and the public key are raised to when encrypting a ballot,
+    deriving them the same way as `encrypt_ballot`, `encrypt_contest` and `encrypt_selection`.
+    """
+
+    nonce_seed = CiphertextBallot.nonce_seed(
+        internal_manifest.manifest_hash, ballot_id, random_master_nonce
+    )
+    generator_exponents: List[ElementModQ] = []
+    public_key_exponents: List[ElementModQ] = []
+    for contest_description in internal_manifest.get_contests_for(style_id):
+        contest_nonce_sequence = Nonces(contest_description.crypto_hash(), nonce_seed)
+        contest_nonce = contest_nonce_sequence[contest_description.sequence_order]
+
+        # the contest proof and extended data
+        contest_exponents = [
+            Nonces(contest_nonce_sequence[0], "constant-chaum-pedersen-proof")[0],
+            Nonces(contest_nonce, "constant-extended-data")[0],
+        ]
+        generator_exponents.extend(contest_exponents)
+        public_key_exponents.extend(contest_exponents)
+
+        for selection_description in (
+            contest_description.ballot_selections
+            + contest_description.placeholder_selections
+        ):
+            nonce_sequence = Nonces(selection_description.crypto_hash(), contest_nonce)
+            selection_nonce = nonce_sequence[selection_description.sequence_order]
+
+            # the ciphertext and its proof, which raises the generator to all three proof
+            # nonces and the public key to the last two, whatever the vote
+            proof_nonces = Nonces(nonce_sequence[0], "disjoint-chaum-pedersen-proof")[
+                0:3
+            ]
+            generator_exponents.append(selection_nonce)
+            generator_exponents.extend(proof_nonces)
+            public_key_exponents.append(selection_nonce)
+            public_key_exponents.extend(proof_nonces[1:])
+
+    return (generator_exponents, public_key_exponents)
+
 
 def generate_device_uuid() -> int:
     """
@@ -185,6 +494,7 @@ def encrypt_selection(
     nonce_seed: ElementModQ,
     is_placeholder: bool = False,
     should_verify_proofs: bool = False,
+    powers: Optional[PrecomputedPowers] = None,
 ) -> Optional[CiphertextBallotSelection]:
     """
     Encrypt a specific `BallotSelection` in the context of a specific `BallotContest`
@@ -198,6 +508,7 @@ def encrypt_selection(
                  this value can be (or derived from) the BallotContest nonce, but no relationship is required
     :param is_placeholder: specifies if this is a placeholder selection
     :param should_verify_proofs: specify if the proofs should be verified prior to returning (default False)
+    :param powers: optional powers of the generator and public key precomputed for the nonces
     """
 
     # Validate Input
@@ -210,15 +521,18 @@ def encrypt_selection(
     selection_nonce = nonce_sequence[selection_description.sequence_order]
     disjunctive_chaum_pedersen_nonce = next(iter(nonce_sequence))
 
-    log_info(
-        f": encrypt_selection: for {selection_description.object_id} hash: {selection_description_hash.to_hex()}"
-    )
+    if log_is_enabled(INFO):
+        log_info(
+            ": encrypt_selection: for %s hash: %s",
+            selection_description.object_id,
+            selection_description_hash,
+        )
 
     selection_representation = selection.vote
 
     # Generate the encryption
     elgamal_encryption = elgamal_encrypt(
-        selection_representation, selection_nonce, elgamal_public_key
+        selection_representation, selection_nonce, elgamal_public_key, powers
     )
 
     if elgamal_encryption is None:
@@ -239,6 +553,7 @@ def encrypt_selection(
         selection_representation,
         is_placeholder,
         selection_nonce,
+        powers=powers,
     )
 
     if encrypted_selection.proof is None:
@@ -266,6 +581,8 @@ def encrypt_contest(
     crypto_extended_base_hash: ElementModQ,
     nonce_seed: ElementModQ,
     should_verify_proofs: bool = False,
+    scheduler: Optional[Scheduler] = None,
+    powers: Optional[PrecomputedPowers] = None,
 ) -> Optional[CiphertextBallotContest]:
     """
     Encrypt a specific `BallotContest` in the context of a specific `Ballot`.
@@ -283,6 +600,9 @@ def encrypt_contest(
     :param nonce_seed: an `ElementModQ` used as a header to seed the `Nonce` generated for this contest.
                  this value can be (or derived from) the Ballot nonce, but no relationship is required
     :param should_verify_proofs: specify if the proofs should be verified prior to returning (default False)
+    :param scheduler: an optional scheduler to encrypt the selections in parallel
+    :param powers: optional powers of the generator and public key precomputed for the nonces,
+                 only used when the selections are encrypted in this process
     """
     error: Optional[ContestErrorType] = None
     error_data: Optional[List[SelectionId]] = None
@@ -305,58 +625,41 @@ def encrypt_contest(
     contest_nonce = nonce_sequence[contest_description.sequence_order]
     chaum_pedersen_nonce = next(iter(nonce_sequence))
 
-    encrypted_selections: List[CiphertextBallotSelection] = []
+    # The selections to encrypt, with their descriptions and whether they are placeholders
+    plaintext_selections: List[
+        Tuple[PlaintextBallotSelection, SelectionDescription, bool]
+    ] = []
 
     selection_count = 0
 
-    # TODO: ISSUE #54 this code could be inefficient if we had a contest
-    # with a lot of choices, although the O(n^2) iteration here is small
-    # compared to the huge cost of doing the cryptography.
+    # Index the actual selections by id, keeping the first selection for an id.
+    # If overvote, no votes should be counted and instead placeholders should be used.
+    selections_by_id: Dict[SelectionId, PlaintextBallotSelection] = (
+        {}
+        if error is ContestErrorType.OverVote
+        else {
+            selection.object_id: selection
+            for selection in reversed(contest.ballot_selections)
+        }
+    )
 
-    # Generate the encrypted selections
+    # Generate the selections
     for description in contest_description.ballot_selections:
-        has_selection = False
-        encrypted_selection = None
-
-        # iterate over the actual selections for each contest description
-        # and apply the selected value if it exists.  If it does not, an explicit
-        # false is entered instead and the selection_count is not incremented
-        # this allows consumers to only pass in the relevant selections made by a voter
-        for selection in contest.ballot_selections:
-            # If overvote, no votes should be counted and instead placeholders should be used.
-            if (
-                selection.object_id == description.object_id
-                and error is not ContestErrorType.OverVote
-            ):
-                # track the selection count so we can append the
-                # appropriate number of true placeholder votes
-                has_selection = True
-                selection_count += selection.vote
-                encrypted_selection = encrypt_selection(
-                    selection,
-                    description,
-                    elgamal_public_key,
-                    crypto_extended_base_hash,
-                    contest_nonce,
-                    should_verify_proofs=should_verify_proofs,
-                )
-                break
-
-        if not has_selection:
+        # apply the selected value for each contest description if it exists.
+        # If it does not, an explicit false is entered instead and the selection_count
+        # is not incremented. this allows consumers to only pass in the relevant
+        # selections made by a voter
+        use_selection = selections_by_id.get(description.object_id)
+        if use_selection is not None:
+            # track the selection count so we can append the
+            # appropriate number of true placeholder votes
+            selection_count += use_selection.vote
+        else:
             # No selection was made for this possible value
             # so we explicitly set it to false
-            encrypted_selection = encrypt_selection(
-                selection_from(description),
-                description,
-                elgamal_public_key,
-                crypto_extended_base_hash,
-                contest_nonce,
-                should_verify_proofs=should_verify_proofs,
-            )
+            use_selection = selection_from(description)
 
-        if encrypted_selection is None:
-            return None  # log will have happened earlier
-        encrypted_selections.append(get_optional(encrypted_selection))
+        plaintext_selections.append((use_selection, description, False))
 
     # Handle Placeholder selections
     # After we loop through all of the real selections on the ballot,
@@ -372,28 +675,54 @@ def encrypt_contest(
             select_placeholder = True
             selection_count += 1
 
-        encrypted_selection = encrypt_selection(
-            selection=selection_from(
-                description=placeholder,
-                is_placeholder=True,
-                is_affirmative=select_placeholder,
-            ),
-            selection_description=placeholder,
-            elgamal_public_key=elgamal_public_key,
-            crypto_extended_base_hash=crypto_extended_base_hash,
-            nonce_seed=contest_nonce,
-            is_placeholder=True,
-            should_verify_proofs=should_verify_proofs,
+        plaintext_selections.append(
+            (
+                selection_from(
+                    description=placeholder,
+                    is_placeholder=True,
+                    is_affirmative=select_placeholder,
+                ),
+                placeholder,
+                True,
+            )
+        )
+
+    # Generate the encrypted selections
+    selection_arguments = [
+        (
+            selection,
+            description,
+            elgamal_public_key,
+            crypto_extended_base_hash,
+            contest_nonce,
+            is_placeholder,
+            should_verify_proofs,
+        )
+        for (selection, description, is_placeholder) in plaintext_selections
+    ]
+    encrypted_selections: List[Optional[CiphertextBallotSelection]]
+    if scheduler is None:
+        encrypted_selections = [
+            encrypt_selection(*arguments, powers=powers)
+            for arguments in selection_arguments
+        ]
+    else:
+        # the powers are not sent to the workers, since each would get the whole ballot's
+        encrypted_selections = scheduler.schedule(
+            _encrypt_selection_in_worker, selection_arguments
         )
-        if encrypted_selection is None:
-            return None  # log will have happened earlier
-        encrypted_selections.append(get_optional(encrypted_selection))
+
+    if len(encrypted_selections) != len(plaintext_selections) or any(
+        encrypted_selection is None for encrypted_selection in encrypted_selections
+    ):
+        return None  # log will have happened earlier
 
     encrypted_contest_data = hashed_elgamal_encrypt(
         ContestData(error, error_data, contest.write_ins).to_bytes(),
         Nonces(contest_nonce, "constant-extended-data")[0],
         elgamal_public_key,
         crypto_extended_base_hash,
+        powers,
     )
 
     # Create the return object
@@ -401,13 +730,14 @@ def encrypt_contest(
         contest.object_id,
         contest_description.sequence_order,
         contest_description_hash,
-        encrypted_selections,
+        [get_optional(selection) for selection in encrypted_selections],
         elgamal_public_key,
         crypto_extended_base_hash,
         chaum_pedersen_nonce,
         contest_description.number_elected,
         nonce=contest_nonce,
         extended_data=encrypted_contest_data,
+        powers=powers,
     )
 
     if should_verify_proofs or not encrypted_contest.proof:
@@ -423,6 +753,36 @@ def encrypt_contest(
     return encrypted_contest
 
 
+def _encrypt_selection_in_worker(
+    selection: PlaintextBallotSelection,
+    selection_description: SelectionDescription,
+    elgamal_public_key: ElGamalPublicKey,
+    *arguments: Any,
+) -> Optional[CiphertextBallotSelection]:
+    """
+    Encrypt a selection in a worker process, registering the public key as a fixed base
+    the first time the worker encrypts with it.
+    """
+    register_fixed_base(elgamal_public_key)
+    return encrypt_selection(
+        selection, selection_description, elgamal_public_key, *arguments
+    )
+
+
+def _encrypt_contest_in_worker(
+    contest: PlaintextBallotContest,
+    contest_description: ContestDescriptionWithPlaceholders,
+    elgamal_public_key: ElGamalPublicKey,
+    *arguments: Any,
+) -> Optional[CiphertextBallotContest]:
+    """
+    Encrypt a contest in a worker process, registering the public key as a fixed base
+    the first time the worker encrypts with it.
+    """
+    register_fixed_base(elgamal_public_key)
+    return encrypt_contest(contest, contest_description, elgamal_public_key, *arguments)
+
+
 # TODO: ISSUE #57: add the device hash to the function interface so it can be propagated with the ballot.
 # also propagate the seed so that the ballot codes can be regenerated
 # by traversing the collection of ballots encrypted by a specific device
@@ -435,6 +795,8 @@ def encrypt_ballot(
     encryption_seed: ElementModQ,
     nonce: Optional[ElementModQ] = None,
     should_verify_proofs: bool = False,
+    scheduler: Optional[Scheduler] = None,
+    powers: Optional[PrecomputedPowers] = None,
 ) -> Optional[CiphertextBallot]:
     """
     Encrypt a specific `Ballot` in the context of a specific `CiphertextElectionContext`.
@@ -453,7 +815,57 @@ def encrypt_ballot(
     :param nonce: an optional `int` used to seed the `Nonce` generated for this contest
                  if this value is not provided, the secret generating mechanism of the OS provides its own
     :param should_verify_proofs: specify if the proofs should be verified prior to returning (default False)
+    :param scheduler: an optional scheduler to encrypt the contests and selections in parallel,
+                 which is worthwhile for long ballots
+    :param powers: optional powers of the generator and public key precomputed for the nonces
+                 derived from the master nonce, such as by `EncryptionMediator.precompute`,
+                 only used for what is encrypted in this process
+    """
+
+    # Generate a random master nonce to use for the contest and selection nonce's on the ballot
+    random_master_nonce = get_or_else_optional_func(nonce, lambda: rand_q())
+
+    encrypted_contests = _encrypt_ballot_with_nonce(
+        ballot,
+        internal_manifest,
+        context,
+        random_master_nonce,
+        should_verify_proofs,
+        scheduler,
+        powers,
+    )
+    if encrypted_contests is None:
+        return None
+
+    log_info(": encryption_seed : %s", encryption_seed)
+
+    return _make_encrypted_ballot(
+        ballot,
+        internal_manifest,
+        context,
+        encryption_seed,
+        encrypted_contests,
+        random_master_nonce,
+        should_verify_proofs,
+    )
+
+
+def _encrypt_ballot_with_nonce(
+    ballot: PlaintextBallot,
+    internal_manifest: InternalManifest,
+    context: CiphertextElectionContext,
+    random_master_nonce: ElementModQ,
+    should_verify_proofs: bool = False,
+    scheduler: Optional[Scheduler] = None,
+    powers: Optional[PrecomputedPowers] = None,
+) -> Optional[List[CiphertextBallotContest]]:
     """
+    Encrypt the contests of a ballot from its master nonce. The contests do not depend on
+    the encryption seed, so they can be encrypted independently of the other ballots.
+    """
+
+    # Every selection and proof raises the election public key to a nonce
+    register_fixed_base(context.elgamal_public_key)
 
     # Determine the relevant range of contests for this ballot style
     style = internal_manifest.get_ballot_style(ballot.style_id)
@@ -463,9 +875,6 @@ def encrypt_ballot(
         log_warning(f"malformed input ballot: {ballot}")
         return None
 
-    # Generate a random master nonce to use for the contest and selection nonce's on the ballot
-    random_master_nonce = get_or_else_optional_func(nonce, lambda: rand_q())
-
     # Include a representation of the election and the external Id in the nonce's used
     # to derive other nonce values on the ballot
     nonce_seed = CiphertextBallot.nonce_seed(
@@ -474,18 +883,32 @@ def encrypt_ballot(
         random_master_nonce,
     )
 
-    log_info(f": manifest_hash : {internal_manifest.manifest_hash.to_hex()}")
-    log_info(f": encryption_seed : {encryption_seed.to_hex()}")
+    log_info(": manifest_hash : %s", internal_manifest.manifest_hash)
 
-    encrypted_contests = encrypt_ballot_contests(
+    return encrypt_ballot_contests(
         ballot,
         internal_manifest,
         context,
         nonce_seed,
         should_verify_proofs=should_verify_proofs,
+        scheduler=scheduler,
+        powers=powers,
     )
-    if encrypted_contests is None:
-        return None
+
+
+def _make_encrypted_ballot(
+    ballot: PlaintextBallot,
+    internal_manifest: InternalManifest,
+    context: CiphertextElectionContext,
+    encryption_seed: ElementModQ,
+    encrypted_contests: List[CiphertextBallotContest],
+    random_master_nonce: ElementModQ,
+    should_verify_proofs: bool = False,
+) -> Optional[CiphertextBallot]:
+    """
+    Make the encrypted ballot from its encrypted contests, chaining its code from the
+    encryption seed.
+    """
 
     # Create the return object
     encrypted_ballot = make_ciphertext_ballot(
@@ -519,32 +942,67 @@ def encrypt_ballot_contests(
     context: CiphertextElectionContext,
     nonce_seed: ElementModQ,
     should_verify_proofs: bool = False,
+    scheduler: Optional[Scheduler] = None,
+    powers: Optional[PrecomputedPowers] = None,
 ) -> Optional[List[CiphertextBallotContest]]:
     """Encrypt contests from a plaintext ballot with a specific style"""
-    encrypted_contests: List[CiphertextBallotContest] = []
+    contests: List[
+        Tuple[PlaintextBallotContest, ContestDescriptionWithPlaceholders]
+    ] = []
+
+    # Index the contests on the ballot by id, keeping the first contest for an id
+    contests_by_id = {
+        contest.object_id: contest for contest in reversed(ballot.contests)
+    }
 
     # Only iterate on contests for this specific ballot style
     for ballot_style_contest in description.get_contests_for(ballot.style_id):
-        use_contest = None
-        for contest in ballot.contests:
-            if contest.object_id == ballot_style_contest.object_id:
-                use_contest = contest
-                break
+        use_contest = contests_by_id.get(ballot_style_contest.object_id)
 
         # no selections provided for the contest, so create a placeholder contest
         if not use_contest:
             use_contest = contest_from(ballot_style_contest)
 
-        encrypted_contest = encrypt_contest(
-            use_contest,
-            ballot_style_contest,
-            context.elgamal_public_key,
-            context.crypto_extended_base_hash,
-            nonce_seed,
-            should_verify_proofs=should_verify_proofs,
+        contests.append((use_contest, ballot_style_contest))
+
+    encrypted_contests: List[Optional[CiphertextBallotContest]]
+    if scheduler is not None and len(contests) >= Scheduler.cpu_count():
+        # there are enough contests to keep every process busy, so encrypt them in parallel,
+        # without the powers, since each worker would get the whole ballot's
+        encrypted_contests = scheduler.schedule(
+            _encrypt_contest_in_worker,
+            [
+                (
+                    contest,
+                    ballot_style_contest,
+                    context.elgamal_public_key,
+                    context.crypto_extended_base_hash,
+                    nonce_seed,
+                    should_verify_proofs,
+                )
+                for (contest, ballot_style_contest) in contests
+            ],
         )
+    else:
+        # otherwise encrypt the contests in turn, optionally with their selections in parallel
+        encrypted_contests = []
+        for (contest, ballot_style_contest) in contests:
+            encrypted_contest = encrypt_contest(
+                contest,
+                ballot_style_contest,
+                context.elgamal_public_key,
+                context.crypto_extended_base_hash,
+                nonce_seed,
+                should_verify_proofs=should_verify_proofs,
+                scheduler=scheduler,
+                powers=powers,
+            )
+            if encrypted_contest is None:
+                return None
+            encrypted_contests.append(encrypted_contest)
 
-        if encrypted_contest is None:
-            return None
-        encrypted_contests.append(get_optional(encrypted_contest))
-    return encrypted_contests
+    if len(encrypted_contests) != len(contests) or any(
+        encrypted_contest is None for encrypted_contest in encrypted_contests
+    ):
+        return None  # log will have happened earlier
+    return [get_optional(contest) for contest in encrypted_contests]
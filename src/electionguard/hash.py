@@ -3,8 +3,12 @@ from abc import abstractmethod
 from collections.abc import Sequence
 from hashlib import sha256
 from typing import (
+    Any,
+    Dict,
     Iterable,
+    Iterator,
     List,
+    Tuple,
     Union,
     Protocol,
     runtime_checkable,
@@ -58,6 +62,48 @@ CryptoHashableAll = Union[
 ]
 
 
+_SEPARATOR = "|".encode(BYTE_ENCODING)
+_NULL = "null".encode(BYTE_ENCODING)
+
+# Kinds of hashable values. The kind only depends on the type of the value, so it is
+# determined once per type and the hasher then dispatches on the exact type.
+_ELEMENT = 0
+_CRYPTO_HASHABLE = 1
+_STR = 2
+_INT = 3
+_ITERABLE = 4
+_OTHER = 5
+
+_kinds_by_type: Dict[type, int] = {}
+
+
+def _get_kind(x: object) -> int:
+    """Determine how values of the type of x are hashed."""
+    kind = _kinds_by_type.get(type(x))
+    if kind is not None:
+        return kind
+
+    if isinstance(x, (ElementModP, ElementModQ)):
+        kind = _ELEMENT
+    elif isinstance(x, CryptoHashable):
+        kind = _CRYPTO_HASHABLE
+    elif isinstance(x, str):
+        # strings are iterable, so it's important to handle them before list-like types
+        kind = _STR
+    elif isinstance(x, int):
+        kind = _INT
+    elif isinstance(x, (Sequence, List, Iterable)):
+        kind = _ITERABLE
+    else:
+        kind = _OTHER
+    _kinds_by_type[type(x)] = kind
+    return kind
+
+
+def _digest_to_q(digest: bytes) -> ElementModQ:
+    return ElementModQ(int.from_bytes(digest, byteorder=BYTE_ORDER) % get_small_prime())
+
+
 def hash_elems(*a: CryptoHashableAll) -> ElementModQ:
     """
     Given zero or more elements, calculate their cryptographic hash
@@ -68,36 +114,70 @@ def hash_elems(*a: CryptoHashableAll) -> ElementModQ:
     :param a: Zero or more elements of any of the accepted types.
     :return: A cryptographic hash of these elements, concatenated.
     """
-    h = sha256()
-    h.update("|".encode(BYTE_ENCODING))
-    for x in a:
-        # We could just use str(x) for everything, but then we'd have a resulting string
-        # that's a bit Python-specific, and we'd rather make it easier for other languages
-        # to exactly match this hash function.
-
-        if isinstance(x, (ElementModP, ElementModQ)):
-            hash_me = x.to_hex()
-        elif isinstance(x, CryptoHashable):
-            hash_me = x.crypto_hash().to_hex()
-        elif isinstance(x, str):
-            # strings are iterable, so it's important to handle them before list-like types
-            hash_me = x
-        elif isinstance(x, int):
-            hash_me = str(x)
-        elif not x:
-            # This case captures empty lists and None, nicely guaranteeing that we don't
-            # need to do a recursive call if the list is empty. So we need a string to
-            # feed in for both of these cases. "None" would be a Python-specific thing,
-            # so we'll go with the more JSON-ish "null".
-            hash_me = "null"
-        elif isinstance(x, (Sequence, List, Iterable)):
-            # The simplest way to deal with lists, tuples, and such are to crunch them recursively.
-            hash_me = hash_elems(*x).to_hex()
-        else:
-            hash_me = str(x)
+    return _digest_to_q(_hash_into(sha256(_SEPARATOR), a).digest())
+
+
+class HashPrefix:
+    """
+    The hash state after hashing a fixed prefix of elements. Hashing further elements
+    continues from a copy of this state, so many hashes sharing the same leading elements
+    only hash that prefix once.
+    """
 
-        h.update((hash_me + "|").encode(BYTE_ENCODING))
+    def __init__(self, *a: CryptoHashableAll) -> None:
+        self._state = _hash_into(sha256(_SEPARATOR), a)
 
-    return ElementModQ(
-        int.from_bytes(h.digest(), byteorder=BYTE_ORDER) % get_small_prime()
-    )
+    def hash_elems(self, *a: CryptoHashableAll) -> ElementModQ:
+        """
+        Calculate the hash of the prefix elements followed by these elements,
+        equal to `hash_elems` of all of them.
+
+        :param a: Zero or more elements of any of the accepted types.
+        :return: A cryptographic hash of the prefix and these elements, concatenated.
+        """
+        return _digest_to_q(_hash_into(self._state.copy(), a).digest())
+
+
+def _hash_into(h: Any, a: Iterable) -> Any:
+    """Feed the elements into the hash state h, returning the state."""
+    # We could just use str(x) for everything, but then we'd have a resulting string
+    # that's a bit Python-specific, and we'd rather make it easier for other languages
+    # to exactly match this hash function.
+
+    # Lists, tuples, and such are hashed on their own and the hex of their hash is
+    # hashed in their place. Rather than recursing, the hashes of the enclosing lists
+    # are kept on a stack while a nested list is hashed.
+    elements: Iterator = iter(a)
+    enclosing: List[Tuple[Any, Iterator]] = []
+    while True:
+        for x in elements:
+            kind = _get_kind(x)
+            if kind == _ELEMENT:
+                h.update(x.to_hex_encoding())
+            elif kind == _STR:
+                h.update(x.encode(BYTE_ENCODING))
+            elif kind == _INT:
+                h.update(str(x).encode(BYTE_ENCODING))
+            elif kind == _CRYPTO_HASHABLE:
+                h.update(x.crypto_hash().to_hex_encoding())
+            elif not x:
+                # This case captures empty lists and None, nicely guaranteeing that we don't
+                # need to hash a nested list if the list is empty. So we need a string to
+                # feed in for both of these cases. "None" would be a Python-specific thing,
+                # so we'll go with the more JSON-ish "null".
+                h.update(_NULL)
+            elif kind == _ITERABLE:
+                enclosing.append((h, elements))
+                h = sha256(_SEPARATOR)
+                elements = iter(x)
+                break
+            else:
+                h.update(str(x).encode(BYTE_ENCODING))
+            h.update(_SEPARATOR)
+        else:
+            if not enclosing:
+                return h
+            nested_hash = _digest_to_q(h.digest())
+            (h, elements) = enclosing.pop()
+            h.update(nested_hash.to_hex_encoding())
+            h.update(_SEPARATOR)
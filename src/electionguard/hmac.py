@@ -1,6 +1,7 @@
 """Implementation of Hashing for Message Authentication Codes (HMAC)"""
 
-from hmac import digest
+from hashlib import sha256
+from hmac import digest, new
 from typing import Optional
 
 _BYTE_LENGTH = 4
@@ -27,6 +28,35 @@ def get_hmac(
     return digest(key, message, "SHA256")
 
 
+def get_hmac_keystream(
+    key: bytes, message: bytes, length: int, count: int, start: int = 1
+) -> bytes:
+    """
+    Get the concatenated hmac digests of a message for consecutive starting byte
+    positions, equal to `get_hmac(key, message, length, i)` for each position i.
+    The key is only prepared once for all of the digests.
+
+    :param key: key (k) in bytes
+    :param message: message in bytes
+    :param length: length (L) of total message
+    :param count: number of digests
+    :param start: first starting byte position
+    :return: hmac digests in bytes
+    """
+
+    keyed = new(key, digestmod=sha256)
+    end_byte = length.to_bytes(_BYTE_LENGTH, _BYTE_ORDER)
+    digest_size = keyed.digest_size
+    keystream = bytearray(count * digest_size)
+    for i in range(count):
+        hmac = keyed.copy()
+        hmac.update((start + i).to_bytes(_BYTE_LENGTH, _BYTE_ORDER))
+        hmac.update(message)
+        hmac.update(end_byte)
+        keystream[i * digest_size : (i + 1) * digest_size] = hmac.digest()
+    return bytes(keystream)
+
+
 def _fix_message_length(msg: bytes, length: int, start: int = 0) -> bytes:
     """
     Fix the message length to a set byte length with starting and end bytes.
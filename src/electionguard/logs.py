@@ -1,8 +1,7 @@
-import inspect
 import logging
 import os.path
 import sys
-from typing import Any, List, Tuple
+from typing import Any, List, Optional, Tuple
 from logging.handlers import RotatingFileHandler
 
 from .singleton import Singleton
@@ -30,19 +29,18 @@ class ElectionGuardLog(Singleton):
 
     @staticmethod
     def __get_call_info() -> Tuple[str, str, int]:
-        stack = inspect.stack()
-
-        # stack[0]: __get_call_info
-        # stack[1]: __formatted_message
-        # stack[2]: (log method, e.g. "warn")
-        # stack[3]: Singleton
-        # stack[4]: caller <-- we want this
-
-        filename = stack[4][1]
-        line = stack[4][2]
-        funcname = stack[4][3]
-
-        return filename, funcname, line
+        # Walk up the frames directly rather than with inspect.stack(),
+        # which would also read the source context of every frame.
+        # frame 0: __get_call_info
+        # frame 1: __formatted_message
+        # frame 2: (log method, e.g. "warn")
+        # frame 3: (log function, e.g. "log_warning")
+        # frame 4: caller <-- we want this
+        # pylint: disable=protected-access
+        frame = sys._getframe(4)
+        code = frame.f_code
+
+        return code.co_filename, code.co_name, frame.f_lineno
 
     def __formatted_message(self, message: str) -> str:
         filename, funcname, line = self.__get_call_info()
@@ -74,35 +72,58 @@ class ElectionGuardLog(Singleton):
         """
         return self.__logger.handlers
 
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Returns whether a message at the level would be handled by any handler,
+        including the handlers of ancestor loggers the message propagates to.
+        When there are no handlers at all, logging falls back to its last resort handler,
+        so the logger's own level decides
+        """
+        if not self.__logger.isEnabledFor(level):
+            return False
+        has_handlers = False
+        logger: Optional[logging.Logger] = self.__logger
+        while logger is not None:
+            if any(level >= handler.level for handler in logger.handlers):
+                return True
+            has_handlers = has_handlers or len(logger.handlers) > 0
+            logger = logger.parent if logger.propagate else None
+        return not has_handlers
+
     def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs a debug message
         """
-        self.__logger.debug(self.__formatted_message(message), *args, **kwargs)
+        if self.is_enabled_for(logging.DEBUG):
+            self.__logger.debug(self.__formatted_message(message), *args, **kwargs)
 
     def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs a info message
         """
-        self.__logger.info(self.__formatted_message(message), *args, **kwargs)
+        if self.is_enabled_for(logging.INFO):
+            self.__logger.info(self.__formatted_message(message), *args, **kwargs)
 
     def warn(self, message: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs a warning message
         """
-        self.__logger.warning(self.__formatted_message(message), *args, **kwargs)
+        if self.is_enabled_for(logging.WARNING):
+            self.__logger.warning(self.__formatted_message(message), *args, **kwargs)
 
     def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs a error message
         """
-        self.__logger.error(self.__formatted_message(message), *args, **kwargs)
+        if self.is_enabled_for(logging.ERROR):
+            self.__logger.error(self.__formatted_message(message), *args, **kwargs)
 
     def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
         """
         Logs a critical message
         """
-        self.__logger.critical(self.__formatted_message(message), *args, **kwargs)
+        if self.is_enabled_for(logging.CRITICAL):
+            self.__logger.critical(self.__formatted_message(message), *args, **kwargs)
 
 
 def get_stream_handler(log_level: int) -> logging.StreamHandler:
@@ -156,6 +177,14 @@ def log_handlers() -> List[logging.Handler]:
     return LOG.handlers()
 
 
+def log_is_enabled(level: int) -> bool:
+    """
+    Returns whether messages at the level are logged, so hot paths can skip
+    building expensive messages that would be discarded.
+    """
+    return LOG.is_enabled_for(level)
+
+
 def log_debug(msg: str, *args: Any, **kwargs: Any) -> None:
     """
     Logs a debug message to the console and the file log.
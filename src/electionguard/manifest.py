@@ -1,7 +1,9 @@
+from copy import deepcopy
 from dataclasses import dataclass, field, InitVar
 from datetime import datetime
 from enum import Enum, unique
-from typing import Dict, cast, List, Optional, Set, Any
+from functools import wraps
+from typing import Callable, Dict, cast, List, Optional, Set, Any, TypeVar
 
 from .election_object_base import ElectionObjectBase, OrderedObjectBase, list_eq
 from .group import ElementModQ
@@ -95,6 +97,44 @@ SUPPORTED_VOTE_VARIATIONS = [
     VoteVariationType.super_majority,
 ]
 
+
+_CRYPTO_HASH_CACHE = "_crypto_hash_cache"
+
+_CachedCryptoHashT = TypeVar("_CachedCryptoHashT", bound="_CachedCryptoHash")
+
+
+class _CachedCryptoHash:
+    """
+    Base for descriptions whose `crypto_hash` can be cached. Only `InternalManifest` caches
+    the hashes, of its own copies of the descriptions, which are not changed afterwards.
+    The hash of any other description is computed each time, since a change to a nested
+    value, such as a selection of a contest, would leave a cached hash stale.
+    Assigning any attribute drops the cached hash.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self.__dict__.pop(_CRYPTO_HASH_CACHE, None)
+        super().__setattr__(name, value)
+
+
+def _cached_crypto_hash(
+    crypto_hash: Callable[[_CachedCryptoHashT], ElementModQ]
+) -> Callable[[_CachedCryptoHashT], ElementModQ]:
+    """Use the hash cached by `_cache_crypto_hash`, if there is one."""
+
+    @wraps(crypto_hash)
+    def cached_crypto_hash(self: _CachedCryptoHashT) -> ElementModQ:
+        hash = self.__dict__.get(_CRYPTO_HASH_CACHE)
+        return hash if hash is not None else crypto_hash(self)
+
+    return cached_crypto_hash
+
+
+def _cache_crypto_hash(description: CryptoHashable) -> None:
+    """Cache the hash of a description until an attribute is assigned."""
+    description.__dict__[_CRYPTO_HASH_CACHE] = description.crypto_hash()
+
+
 # pylint: disable=super-init-not-called
 @dataclass(eq=True, unsafe_hash=True)
 class AnnotatedString(CryptoHashable):
@@ -320,7 +360,7 @@ class Candidate(ElectionObjectBase, CryptoHashable):
 
 
 @dataclass(eq=True, unsafe_hash=True)
-class SelectionDescription(OrderedObjectBase, CryptoHashable):
+class SelectionDescription(_CachedCryptoHash, OrderedObjectBase, CryptoHashable):
     """
     Data entity for the ballot selections in a contest,
     for example linking candidates and parties to their vote counts.
@@ -336,6 +376,7 @@ class SelectionDescription(OrderedObjectBase, CryptoHashable):
 
     candidate_id: str
 
+    @_cached_crypto_hash
     def crypto_hash(self) -> ElementModQ:
         """
         A hash representation of the object
@@ -346,7 +387,7 @@ class SelectionDescription(OrderedObjectBase, CryptoHashable):
 
 # pylint: disable=too-many-instance-attributes
 @dataclass(unsafe_hash=True)
-class ContestDescription(OrderedObjectBase, CryptoHashable):
+class ContestDescription(_CachedCryptoHash, OrderedObjectBase, CryptoHashable):
     """
     Use this data entity for describing a contest and linking the contest
     to the associated candidates and parties.
@@ -397,6 +438,7 @@ class ContestDescription(OrderedObjectBase, CryptoHashable):
             and self.ballot_subtitle == other.ballot_subtitle
         )
 
+    @_cached_crypto_hash
     def crypto_hash(self) -> ElementModQ:
         """
         Given a ContestDescription, deterministically derives a "hash" of that contest,
@@ -877,6 +919,18 @@ class InternalManifest:
 
     manifest_hash: ElementModQ = field(init=False)
 
+    _contests_by_id: Dict[str, ContestDescriptionWithPlaceholders] = field(
+        init=False, repr=False, compare=False
+    )
+
+    _ballot_styles_by_id: Dict[str, BallotStyle] = field(
+        init=False, repr=False, compare=False
+    )
+
+    _contests_by_ballot_style_id: Dict[
+        str, List[ContestDescriptionWithPlaceholders]
+    ] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self, manifest: Manifest) -> None:
         object.__setattr__(self, "manifest_hash", manifest.crypto_hash())
         object.__setattr__(self, "geopolitical_units", manifest.geopolitical_units)
@@ -884,6 +938,60 @@ class InternalManifest:
         object.__setattr__(
             self, "contests", self._generate_contests_with_placeholders(manifest)
         )
+        self._precompute_description_hashes()
+        self._index_ballot_styles()
+
+    def _precompute_description_hashes(self) -> None:
+        """
+        Compute the hashes of the contest and selection descriptions once,
+        so encrypting, validating, and tallying ballots reuse them.
+        The descriptions are copies of those of the manifest, so changing the manifest
+        afterwards does not leave them stale.
+        """
+        for contest in self.contests:
+            for selection in contest.ballot_selections + contest.placeholder_selections:
+                _cache_crypto_hash(selection)
+            _cache_crypto_hash(contest)
+
+    def _index_ballot_styles(self) -> None:
+        """
+        Index the contests and ballot styles by id, and the contests of each ballot style,
+        so looking them up for each ballot does not scan the manifest.
+        The first contest or ballot style with an id is used, as when scanning.
+        """
+        object.__setattr__(
+            self,
+            "_contests_by_id",
+            {contest.object_id: contest for contest in reversed(self.contests)},
+        )
+        object.__setattr__(
+            self,
+            "_ballot_styles_by_id",
+            {style.object_id: style for style in reversed(self.ballot_styles)},
+        )
+
+        contest_indexes_by_gp_unit_id: Dict[str, List[int]] = {}
+        for (index, contest) in enumerate(self.contests):
+            contest_indexes_by_gp_unit_id.setdefault(
+                contest.electoral_district_id, []
+            ).append(index)
+
+        contests_by_ballot_style_id: Dict[
+            str, List[ContestDescriptionWithPlaceholders]
+        ] = {}
+        for (style_id, style) in self._ballot_styles_by_id.items():
+            # keep the contests of the style in the order of the manifest
+            contest_indexes = {
+                index
+                for gp_unit_id in style.geopolitical_unit_ids or []
+                for index in contest_indexes_by_gp_unit_id.get(gp_unit_id, [])
+            }
+            contests_by_ballot_style_id[style_id] = [
+                self.contests[index] for index in sorted(contest_indexes)
+            ]
+        object.__setattr__(
+            self, "_contests_by_ballot_style_id", contests_by_ballot_style_id
+        )
 
     def contest_for(
         self, contest_id: str
@@ -893,22 +1001,13 @@ class InternalManifest:
         :param contest_id: Contest id
         :return: Contest description or none
         """
-        matching_contests = list(
-            filter(lambda i: i.object_id == contest_id, self.contests)
-        )
-
-        if any(matching_contests):
-            return matching_contests[0]
-        return None
+        return self._contests_by_id.get(contest_id)
 
     def get_ballot_style(self, ballot_style_id: str) -> BallotStyle:
         """
         Get a ballot style for a specified ballot_style_id
         """
-        style = list(
-            filter(lambda i: i.object_id == ballot_style_id, self.ballot_styles)
-        )[0]
-        return style
+        return self._ballot_styles_by_id[ballot_style_id]
 
     def get_contests_for(
         self, ballot_style_id: str
@@ -916,17 +1015,9 @@ class InternalManifest:
         """
         Get contests for a ballot style
         :param ballot_style_id: ballot style id
-        :return: contest descriptions
+        :return: contest descriptions, in the order of the manifest
         """
-        style = self.get_ballot_style(ballot_style_id)
-        if style.geopolitical_unit_ids is None:
-            return []
-        # pylint: disable=unnecessary-comprehension
-        gp_unit_ids = [gp_unit_id for gp_unit_id in style.geopolitical_unit_ids]
-        contests = list(
-            filter(lambda i: i.electoral_district_id in gp_unit_ids, self.contests)
-        )
-        return contests
+        return self._contests_by_ballot_style_id[ballot_style_id]
 
     @staticmethod
     def _generate_contests_with_placeholders(
@@ -937,7 +1028,7 @@ class InternalManifest:
         of placeholder selections to the end of the contest collection
         """
         contests: List[ContestDescriptionWithPlaceholders] = []
-        for contest in manifest.contests:
+        for contest in deepcopy(manifest.contests):
             placeholder_selections = generate_placeholder_selections_from(
                 contest, contest.number_elected
             )
@@ -2,7 +2,7 @@
 from typing import Union, Sequence, List, overload
 
 from electionguard.group import ElementModQ, ElementModPOrQ
-from electionguard.hash import hash_elems
+from electionguard.hash import HashPrefix, hash_elems
 
 
 class Nonces(Sequence[ElementModQ]):
@@ -15,6 +15,7 @@ class Nonces(Sequence[ElementModQ]):
 
     The Nonces class is a Sequence. It can be iterated, or it can be treated as an array
     and indexed. Asking for a nonce is constant time, regardless of the index.
+    The seed is hashed once, and each nonce continues from a copy of that hash state.
     """
 
     def __init__(self, seed: ElementModQ, *headers: Union[str, ElementModPOrQ]) -> None:
@@ -22,6 +23,7 @@ class Nonces(Sequence[ElementModQ]):
             self.__seed: ElementModQ = hash_elems(seed, *headers)
         else:
             self.__seed = seed
+        self.__prefix = HashPrefix(self.__seed)
 
     # https://github.com/python/mypy/issues/4108
     @overload
@@ -39,7 +41,10 @@ class Nonces(Sequence[ElementModQ]):
             return self.get_with_headers(index)
         if isinstance(index.stop, int):
             # Handling slices is a pain: https://stackoverflow.com/a/42731787
-            indices = range(index.start or 0, index.stop, index.step or 1)
+            start = index.start or 0
+            if index.step is None or index.step == 1:
+                return self.take(start, index.stop - start)
+            indices = range(start, index.stop, index.step)
             return [self[i] for i in indices]
         raise TypeError("Cannot take unbounded slice of Nonces")
 
@@ -56,4 +61,20 @@ class Nonces(Sequence[ElementModQ]):
         """
         if item < 0:
             raise TypeError("Nonces do not support negative indices.")
-        return hash_elems(self.__seed, item, *headers)
+        return self.__prefix.hash_elems(item, *headers)
+
+    def take(self, start: int, count: int, *headers: str) -> List[ElementModQ]:
+        """
+        Gets a block of consecutive items from the sequence, equal to getting
+        each of them with `get_with_headers`.
+
+        :param start: Index of the first nonce.
+        :param count: Number of nonces.
+        :param headers:  Optional string headers.
+        """
+        if start < 0:
+            raise TypeError("Nonces do not support negative indices.")
+        prefix = self.__prefix
+        return [
+            prefix.hash_elems(item, *headers) for item in range(start, start + count)
+        ]
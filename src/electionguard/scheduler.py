@@ -8,6 +8,7 @@ from multiprocessing.dummy import Pool as ThreadPool
 from multiprocessing.pool import Pool
 from psutil import cpu_count
 
+from .constants import ElectionConstants, get_constants, set_constants
 from .logs import log_warning
 from .singleton import Singleton
 
@@ -20,11 +21,16 @@ class Scheduler(Singleton, AbstractContextManager):
     for shared context or spawning processes.
     Implemented as a singleton to guarantee there is only one set
     of tread and process pools in use throughout the library.
+    The worker processes are started with the election constants in use,
+    and restarted if the constants change, so spawned processes use them too.
     Also implements the [Context Manager Protocol](https://docs.python.org/3.8/library/stdtypes.html#typecontextmanager)
     """
 
     __process_pool: Pool
     __thread_pool: Pool
+    __process_constants: ElectionConstants
+    __max_processes: int
+    __is_open: bool
 
     def __init__(self) -> None:
         super().__init__()
@@ -43,13 +49,25 @@ class Scheduler(Singleton, AbstractContextManager):
         # Reserve one CPU for I/O bound tasks
         if max_processes > 2:
             max_processes = max_processes - 1
-        self.__process_pool = ProcessPool(max_processes)
+        self.__max_processes = max_processes
+        self.__process_pool = self._open_process_pool()
         self.__thread_pool = ThreadPool(max_processes)
+        self.__is_open = True
+
+    def _open_process_pool(self) -> Pool:
+        """Open a process pool whose workers use the current election constants"""
+        self.__process_constants = get_constants()
+        return ProcessPool(
+            self.__max_processes,
+            initializer=set_constants,
+            initargs=(self.__process_constants,),
+        )
 
     def close(self) -> None:
         """Close pools"""
         self.__process_pool.close()
         self.__thread_pool.close()
+        self.__is_open = False
 
     @staticmethod
     def cpu_count() -> int:
@@ -74,6 +92,10 @@ class Scheduler(Singleton, AbstractContextManager):
         """
         if with_shared_resources:
             return self.safe_starmap(self.__thread_pool, task, arguments)
+        if self.__is_open and get_constants() != self.__process_constants:
+            # the workers were started with other constants, so restart them
+            self.__process_pool.close()
+            self.__process_pool = self._open_process_pool()
         return self.safe_starmap(self.__process_pool, task, arguments)
 
     @staticmethod
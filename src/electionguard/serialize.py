@@ -44,6 +44,13 @@ _config = Config(
 )
 
 
+def _encoder(data: Any) -> Any:
+    """Encode big integers as their hex and defer everything else to pydantic."""
+    if isinstance(data, BigInteger):
+        return data.to_hex()
+    return pydantic_encoder(data)
+
+
 def padded_encode(data: Any, size: DataSize = DataSize.Bytes_512) -> bytes:
     return add_padding(to_raw(data).encode(BYTE_ENCODING), size)
 
@@ -84,7 +91,7 @@ def from_list_raw(type_: Type[_T], raw: Union[str, bytes]) -> List[_T]:
 def to_raw(data: Any) -> str:
     """Serialize data to raw json format."""
 
-    return json.dumps(data, default=pydantic_encoder)
+    return json.dumps(data, default=_encoder)
 
 
 def from_file_wrapper(type_: Type[_T], file: TextIOWrapper) -> _T:
@@ -139,7 +146,7 @@ def to_file(
         "w",
         encoding=BYTE_ENCODING,
     ) as outfile:
-        json.dump(data, outfile, default=pydantic_encoder)
+        json.dump(data, outfile, default=_encoder)
         return path
 
 
@@ -1,6 +1,6 @@
 # pylint: disable=unnecessary-comprehension
 from dataclasses import dataclass, field
-from typing import Iterable, Optional, List, Dict, Set, Tuple, Any
+from typing import Iterable, Optional, List, Dict, Set, Tuple, Any, Union
 from collections.abc import Container, Sized
 
 from .ballot import (
@@ -10,17 +10,26 @@ from .ballot import (
     CiphertextSelection,
 )
 from .data_store import DataStore
-from .ballot_validator import ballot_is_valid_for_election
+from .ballot_validator import (
+    ballot_is_valid_for_election,
+    ballots_are_valid_for_election,
+)
 from .decryption_share import CiphertextDecryptionSelection
 from .election import CiphertextElectionContext
 from .election_object_base import ElectionObjectBase, OrderedObjectBase
-from .elgamal import ElGamalCiphertext, elgamal_add
+from .elgamal import ElGamalAccumulator, ElGamalCiphertext, elgamal_add
 from .group import ElementModQ, ONE_MOD_P, ElementModP
 from .logs import log_warning
 from .manifest import InternalManifest
 from .scheduler import Scheduler
 from .type import BallotId, ContestId, SelectionId
 
+STREAM_WINDOW_SIZE = 2000
+"""The default number of cast ballots accumulated at a time when streaming a tally."""
+
+_ACCUMULATE_CHUNKS_PER_CPU = 4
+_MIN_ACCUMULATE_CHUNK_SIZE = 256
+
 
 @dataclass
 class PlaintextTallySelection(ElectionObjectBase):
@@ -186,6 +195,23 @@ class PublishedCiphertextTally(ElectionObjectBase):
     contests: Dict[ContestId, CiphertextTallyContest]
 
 
+@dataclass
+class PartialCiphertextTally(PublishedCiphertextTally):
+    """
+    A published version of a ciphertext tally of some of the ballots in an election,
+    such as those of one precinct or machine, that can be merged with other partial tallies
+    """
+
+    cast_ballot_ids: List[BallotId]
+    """The id's of the cast ballots accumulated in the tally"""
+
+    spoiled_ballot_ids: List[BallotId]
+    """The id's of the spoiled ballots in the tally"""
+
+    crypto_extended_base_hash: ElementModQ
+    """The extended base hash of the election context the ballots were encrypted with"""
+
+
 @dataclass
 class CiphertextTally(ElectionObjectBase, Container, Sized):
     """
@@ -265,41 +291,146 @@ class CiphertextTally(ElectionObjectBase, Container, Sized):
         """
         Append a collection of Ballots to the tally and recalculate
         """
+        return self.stream_append(
+            (ballot for (_, ballot) in ballots),
+            should_validate,
+            scheduler,
+            window_size=None,
+        )
+
+    def stream_append(
+        self,
+        ballots: Iterable[SubmittedBallot],
+        should_validate: bool,
+        scheduler: Optional[Scheduler] = None,
+        window_size: Optional[int] = STREAM_WINDOW_SIZE,
+    ) -> bool:
+        """
+        Append ballots to the tally as they are read from an iterable, such as a generator
+        loading them lazily from storage. The ballots are read once, and are validated and
+        accumulated in windows of `window_size` ballots, so only one window of ballots is held
+        at a time. The selection proofs of each window are verified together in a batch.
+        A `window_size` of None validates and accumulates all ballots at once.
+        If any window fails to accumulate, the tally is rolled back to its state before the
+        call, so none of the ballots are appended. Without a scheduler, one is opened for
+        all of the windows and closed once they are appended.
+        """
+        if scheduler is None:
+            with Scheduler() as stream_scheduler:
+                return self._stream_append(
+                    ballots, should_validate, stream_scheduler, window_size
+                )
+        return self._stream_append(ballots, should_validate, scheduler, window_size)
+
+    def _stream_append(
+        self,
+        ballots: Iterable[SubmittedBallot],
+        should_validate: bool,
+        scheduler: Scheduler,
+        window_size: Optional[int],
+    ) -> bool:
+        """
+        Append ballots to the tally in windows, rolling back if a window fails
+        """
+        # the ciphertexts are replaced rather than mutated, so keeping them is enough to roll back
+        previous_ciphertexts = {
+            (contest_id, selection_id): selection.ciphertext
+            for (contest_id, contest) in self.contests.items()
+            for (selection_id, selection) in contest.selections.items()
+        }
+        appended_ballot_ids: Set[BallotId] = set()
+
+        window: List[SubmittedBallot] = []
+        window_ballot_ids: Set[BallotId] = set()
+        for ballot in ballots:
+            if ballot in self or ballot.object_id in window_ballot_ids:
+                continue
+            window.append(ballot)
+            window_ballot_ids.add(ballot.object_id)
+
+            if window_size is not None and len(window) >= window_size:
+                appended_ballot_ids.update(window_ballot_ids)
+                if not self._append_window(window, should_validate, scheduler):
+                    self._roll_back(previous_ciphertexts, appended_ballot_ids)
+                    return False
+                window = []
+                window_ballot_ids = set()
+
+        appended_ballot_ids.update(window_ballot_ids)
+        if not self._append_window(window, should_validate, scheduler):
+            self._roll_back(previous_ciphertexts, appended_ballot_ids)
+            return False
+        return True
+
+    def _append_window(
+        self,
+        ballots: List[SubmittedBallot],
+        should_validate: bool,
+        scheduler: Optional[Scheduler] = None,
+    ) -> bool:
+        """
+        Validate a window of ballots together and append the valid ones to the tally
+        """
         cast_ballot_selections: Dict[
             SelectionId, Dict[BallotId, ElGamalCiphertext]
         ] = {}
-        for ballot in ballots:
-            # get the value of the dict
-            ballot_value = ballot[1]
-            if not self.__contains__(ballot) and ballot_is_valid_for_election(
-                ballot_value, self._internal_manifest, self._encryption, should_validate
-            ):
-                if ballot_value.state == BallotBoxState.CAST:
-
-                    # collect the selections so they can can be accumulated in parallel
-                    for contest in ballot_value.contests:
-                        for selection in contest.ballot_selections:
-                            if selection.object_id not in cast_ballot_selections:
-                                cast_ballot_selections[selection.object_id] = {}
-
-                            cast_ballot_selections[selection.object_id][
-                                ballot_value.object_id
-                            ] = selection.ciphertext
-
-                # just append the spoiled ballots
-                elif ballot_value.state == BallotBoxState.SPOILED:
-                    self._add_spoiled(ballot_value)
+        cast_ballot_ids: Set[BallotId] = set()
+        for (ballot, is_valid) in zip(
+            ballots,
+            ballots_are_valid_for_election(
+                ballots, self._internal_manifest, self._encryption, should_validate
+            ),
+        ):
+            if not is_valid:
+                continue
+
+            if ballot.state == BallotBoxState.CAST:
+                # collect the selections so they can can be accumulated in parallel
+                for contest in ballot.contests:
+                    for selection in contest.ballot_selections:
+                        if selection.object_id not in cast_ballot_selections:
+                            cast_ballot_selections[selection.object_id] = {}
+                        cast_ballot_selections[selection.object_id][
+                            ballot.object_id
+                        ] = selection.ciphertext
+                cast_ballot_ids.add(ballot.object_id)
+
+            # just append the spoiled ballots
+            elif ballot.state == BallotBoxState.SPOILED:
+                self._add_spoiled(ballot)
+
+        return self._append_cast_window(
+            cast_ballot_selections, cast_ballot_ids, scheduler
+        )
+
+    def _append_cast_window(
+        self,
+        cast_ballot_selections: Dict[SelectionId, Dict[BallotId, ElGamalCiphertext]],
+        cast_ballot_ids: Set[BallotId],
+        scheduler: Optional[Scheduler] = None,
+    ) -> bool:
+        """
+        Accumulate a window of cast ballot selections into the tally
+        """
+        if not self._execute_accumulate(cast_ballot_selections, scheduler):
+            return False
 
         # cache the cast ballot id's so they are not double counted
-        if self._execute_accumulate(cast_ballot_selections, scheduler):
-            for ballot in ballots:
-                # get the value of the dict
-                ballot_value = ballot[1]
-                if ballot_value.state == BallotBoxState.CAST:
-                    self.cast_ballot_ids.add(ballot_value.object_id)
-            return True
+        self.cast_ballot_ids.update(cast_ballot_ids)
+        return True
 
-        return False
+    def _roll_back(
+        self,
+        previous_ciphertexts: Dict[Tuple[ContestId, SelectionId], ElGamalCiphertext],
+        appended_ballot_ids: Set[BallotId],
+    ) -> None:
+        """
+        Restore the selection ciphertexts and remove the appended ballot id's
+        """
+        for ((contest_id, selection_id), ciphertext) in previous_ciphertexts.items():
+            self.contests[contest_id].selections[selection_id].ciphertext = ciphertext
+        self.cast_ballot_ids.difference_update(appended_ballot_ids)
+        self.spoiled_ballot_ids.difference_update(appended_ballot_ids)
 
     def cast(self) -> int:
         """
@@ -316,14 +447,90 @@ class CiphertextTally(ElectionObjectBase, Container, Sized):
     def publish(self) -> PublishedCiphertextTally:
         return PublishedCiphertextTally(self.object_id, self.contests)
 
+    def publish_partial(self) -> PartialCiphertextTally:
+        """
+        Publish the tally with its ballot id's so it can be merged into another tally
+        """
+        return PartialCiphertextTally(
+            self.object_id,
+            self.contests,
+            sorted(self.cast_ballot_ids),
+            sorted(self.spoiled_ballot_ids),
+            self._encryption.crypto_extended_base_hash,
+        )
+
+    def merge(self, other: Union["CiphertextTally", PartialCiphertextTally]) -> bool:
+        """
+        Merge another tally of the same election into this tally, homomorphically adding
+        its selections and adding its ballot id's. The tally is left unchanged if the other
+        tally has a different election context, different contests or selections, or any
+        ballot in both tallies.
+        """
+        if isinstance(other, CiphertextTally):
+            other = other.publish_partial()
+
+        if (
+            other.crypto_extended_base_hash
+            != self._encryption.crypto_extended_base_hash
+        ):
+            log_warning(
+                f"merge cannot add {other.object_id} from a different election context"
+            )
+            return False
+
+        other_ballot_ids = set(other.cast_ballot_ids).union(other.spoiled_ballot_ids)
+        duplicate_ids = other_ballot_ids.intersection(self.cast_ballot_ids).union(
+            other_ballot_ids.intersection(self.spoiled_ballot_ids)
+        )
+        if duplicate_ids:
+            log_warning(
+                f"merge cannot add {other.object_id} with ballots that are already tallied: "
+                f"{sorted(duplicate_ids)}"
+            )
+            return False
+
+        if not self._is_mergeable(other.contests):
+            log_warning(f"merge cannot add {other.object_id} with mismatched contests")
+            return False
+
+        for (contest_id, contest) in other.contests.items():
+            for (selection_id, selection) in contest.selections.items():
+                self.contests[contest_id].selections[selection_id].elgamal_accumulate(
+                    selection.ciphertext
+                )
+
+        self.cast_ballot_ids.update(other.cast_ballot_ids)
+        self.spoiled_ballot_ids.update(other.spoiled_ballot_ids)
+        return True
+
+    def _is_mergeable(self, contests: Dict[ContestId, CiphertextTallyContest]) -> bool:
+        """
+        Check the contests and selections match those of this tally
+        """
+        if set(contests) != set(self.contests):
+            return False
+
+        for (contest_id, contest) in contests.items():
+            tally_contest = self.contests[contest_id]
+            if contest.description_hash != tally_contest.description_hash or set(
+                contest.selections
+            ) != set(tally_contest.selections):
+                return False
+
+            for (selection_id, selection) in contest.selections.items():
+                if (
+                    selection.description_hash
+                    != tally_contest.selections[selection_id].description_hash
+                ):
+                    return False
+
+        return True
+
     @staticmethod
     def _accumulate(
-        id: str, ballot_selections: Dict[BallotId, ElGamalCiphertext]
-    ) -> Tuple[str, ElGamalCiphertext]:
-        return (
-            id,
-            elgamal_add(*[ciphertext for ciphertext in ballot_selections.values()]),
-        )
+        id: str, ciphertexts: List[ElGamalCiphertext]
+    ) -> Tuple[str, ElGamalAccumulator]:
+        return (id, ElGamalAccumulator().add_all(ciphertexts))
 
     def _add_cast(
         self, ballot: SubmittedBallot, scheduler: Optional[Scheduler] = None
@@ -394,33 +601,68 @@ class CiphertextTally(ElectionObjectBase, Container, Sized):
         ],
         scheduler: Optional[Scheduler] = None,
     ) -> bool:
+        """
+        Accumulate the ciphertexts of each selection into the tally. The ciphertexts of
+        each selection are split into chunks that are accumulated concurrently, so even
+        a few selections keep every process busy, and the partial accumulations of each
+        selection are then combined. If the process pool fails, the chunks are accumulated
+        in this process instead.
+        """
 
-        result_set: List[Tuple[SelectionId, ElGamalCiphertext]]
-        if not scheduler:
-            scheduler = Scheduler()
-        result_set = scheduler.schedule(
-            self._accumulate,
-            [
-                (selection_id, selections)
-                for (
-                    selection_id,
-                    selections,
-                ) in ciphertext_selections_by_selection_id.items()
-            ],
+        ciphertexts_by_selection_id = {
+            selection_id: list(selections.values())
+            for (
+                selection_id,
+                selections,
+            ) in ciphertext_selections_by_selection_id.items()
+        }
+        chunk_size = _get_accumulate_chunk_size(
+            sum(
+                len(ciphertexts) for ciphertexts in ciphertexts_by_selection_id.values()
+            ),
+            Scheduler.cpu_count(),
         )
+        chunks = [
+            (selection_id, ciphertexts[index : index + chunk_size])
+            for (selection_id, ciphertexts) in ciphertexts_by_selection_id.items()
+            for index in range(0, len(ciphertexts), chunk_size)
+        ]
 
-        result_dict = {
-            selection_id: ciphertext for (selection_id, ciphertext) in result_set
-        }
+        result_set: List[Tuple[SelectionId, ElGamalAccumulator]]
+        if scheduler is None:
+            with Scheduler() as accumulate_scheduler:
+                result_set = accumulate_scheduler.schedule(self._accumulate, chunks)
+        else:
+            result_set = scheduler.schedule(self._accumulate, chunks)
+        if len(result_set) != len(chunks):
+            log_warning("accumulate process pool failed, accumulating in this process")
+            result_set = [self._accumulate(*chunk) for chunk in chunks]
+
+        result_dict: Dict[SelectionId, ElGamalAccumulator] = {}
+        for (selection_id, accumulator) in result_set:
+            if selection_id in result_dict:
+                result_dict[selection_id].combine(accumulator)
+            else:
+                result_dict[selection_id] = accumulator
 
         for contest in self.contests.values():
             for selection_id, selection in contest.selections.items():
                 if selection_id in result_dict:
-                    selection.elgamal_accumulate(result_dict[selection_id])
+                    selection.elgamal_accumulate(result_dict[selection_id].ciphertext())
 
         return True
 
 
+def _get_accumulate_chunk_size(ciphertext_count: int, cpu_count: int) -> int:
+    """
+    Get the number of ciphertexts accumulated per task, splitting the ciphertexts into
+    a few tasks per cpu to balance the load, but keeping each task large enough to
+    outweigh the cost of scheduling it.
+    """
+    chunk_count = max(1, cpu_count) * _ACCUMULATE_CHUNKS_PER_CPU
+    return max(_MIN_ACCUMULATE_CHUNK_SIZE, -(-ciphertext_count // chunk_count))
+
+
 def tally_ballot(
     ballot: SubmittedBallot, tally: CiphertextTally
 ) -> Optional[CiphertextTally]:
@@ -457,3 +699,21 @@ def tally_ballots(
     if tally.batch_append(store, True):
         return tally
     return None
+
+
+def tally_ballot_stream(
+    ballots: Iterable[SubmittedBallot],
+    internal_manifest: InternalManifest,
+    context: CiphertextElectionContext,
+    window_size: Optional[int] = STREAM_WINDOW_SIZE,
+) -> Optional[CiphertextTally]:
+    """
+    Tally ballots as they are read from an iterable, without holding all of them at once.
+    :return: a CiphertextTally or None if there is an error
+    """
+    tally: CiphertextTally = CiphertextTally(
+        "election-results", internal_manifest, context
+    )
+    if tally.stream_append(ballots, True, window_size=window_size):
+        return tally
+    return None
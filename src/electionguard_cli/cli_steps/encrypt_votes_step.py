@@ -60,9 +60,10 @@ class EncryptVotesStep(CliStepBase):
     def _encrypt_ballots(
         plaintext_ballots: List[PlaintextBallot], encrypter: EncryptionMediator
     ) -> List[CiphertextBallot]:
-        ciphertext_ballots: List[CiphertextBallot] = []
-        for plaintext_ballot in plaintext_ballots:
-            click.echo(f"Encrypting ballot: {plaintext_ballot.object_id}")
-            encrypted_ballot = encrypter.encrypt(plaintext_ballot)
-            ciphertext_ballots.append(get_optional(encrypted_ballot))
-        return ciphertext_ballots
+        encrypted_ballots = [
+            get_optional(ballot)
+            for ballot in encrypter.encrypt_batch(plaintext_ballots)
+        ]
+        for encrypted_ballot in encrypted_ballots:
+            click.echo(f"Encrypted ballot: {encrypted_ballot.object_id}")
+        return encrypted_ballots
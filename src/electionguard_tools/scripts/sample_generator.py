@@ -93,11 +93,10 @@ class ElectionSampleDataGenerator:
         )
 
         # Encrypt some ballots
-        ciphertext_ballots: List[CiphertextBallot] = []
-        for plaintext_ballot in plaintext_ballots:
-            ciphertext_ballots.append(
-                get_optional(self.encrypter.encrypt(plaintext_ballot))
-            )
+        ciphertext_ballots: List[CiphertextBallot] = [
+            get_optional(ballot)
+            for ballot in self.encrypter.encrypt_batch(plaintext_ballots)
+        ]
 
         ballot_store: DataStore[BallotId, SubmittedBallot] = DataStore()
         ballot_box = BallotBox(
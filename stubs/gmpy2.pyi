@@ -83,6 +83,8 @@ class mpz(int):
     def __xor__(self, other: int) -> mpz: ...
 
 def invert(x: mpz, m: mpz) -> mpz: ...
+def is_prime(x: int, n: int = ...) -> bool: ...
+def jacobi(x: int, y: int) -> int: ...
 def powmod(a: int, e: int, p: int) -> mpz: ...
 def to_binary(a: mpz) -> bytes: ...
 def from_binary(b: bytes) -> mpz: ...
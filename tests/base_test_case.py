@@ -1,16 +1,25 @@
-import os
 from unittest import TestCase
-from unittest.mock import patch
 from pytest import fixture
 from pytest_mock import MockerFixture
-from electionguard.constants import PrimeOption
+from electionguard.constants import (
+    ElectionConstants,
+    PrimeOption,
+    get_constants,
+    set_constants,
+    set_prime_option,
+)
 
 
 class BaseTestCase(TestCase):
-    """Base Test Case for overriding environment variables."""
+    """Base Test Case for overriding the election constants."""
 
     mocker: MockerFixture
 
+    prime_option: PrimeOption = PrimeOption.TestOnly
+    """Option for the primes used by the tests of the class."""
+
+    _previous_constants: ElectionConstants
+
     # pylint: disable=unused-private-member
     @fixture(autouse=True)
     def __inject_fixtures(self, mocker):
@@ -19,10 +28,8 @@ class BaseTestCase(TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up class."""
-        cls.env_patcher = patch.dict(
-            os.environ, {"PRIME_OPTION": PrimeOption.TestOnly.value}
-        )
-        cls.env_patcher.start()
+        cls._previous_constants = get_constants()
+        set_prime_option(cls.prime_option)
 
         super().setUpClass()
 
@@ -31,4 +38,4 @@ class BaseTestCase(TestCase):
         """Tear down class."""
         super().tearDownClass()
 
-        cls.env_patcher.stop()
+        set_constants(cls._previous_constants)
@@ -0,0 +1,149 @@
+from datetime import datetime
+from timeit import default_timer as timer
+from typing import List
+
+from statistics import mean
+
+from electionguard.ballot import (
+    CiphertextBallot,
+    CiphertextBallotContest,
+    CiphertextBallotSelection,
+)
+from electionguard.ballot_validator import ballot_is_valid_for_style
+from electionguard.elgamal import ElGamalCiphertext
+from electionguard.group import ONE_MOD_P, ZERO_MOD_Q
+from electionguard.manifest import (
+    BallotStyle,
+    Candidate,
+    CandidateContestDescription,
+    ElectionType,
+    GeopoliticalUnit,
+    InternalManifest,
+    Manifest,
+    ReportingUnitType,
+    SelectionDescription,
+    SpecVersion,
+    VoteVariationType,
+)
+
+
+def get_large_contest_manifest(selection_count: int) -> InternalManifest:
+    """
+    Get a manifest with one contest, such as a large multi-seat race,
+    with the given number of selections.
+    """
+    selections = [
+        SelectionDescription(f"selection-{i}", i, f"candidate-{i}")
+        for i in range(selection_count)
+    ]
+    contest = CandidateContestDescription(
+        "large-contest",
+        0,
+        "gp-unit",
+        VoteVariationType.n_of_m,
+        1,
+        1,
+        "large-contest-name",
+        selections,
+    )
+    style = BallotStyle("ballot-style")
+    style.geopolitical_unit_ids = ["gp-unit"]
+    manifest = Manifest(
+        spec_version=SpecVersion.EG0_95,
+        election_scope_id="large-contest-scope",
+        type=ElectionType.unknown,
+        start_date=datetime.now(),
+        end_date=datetime.now(),
+        geopolitical_units=[
+            GeopoliticalUnit("gp-unit", "gp-unit-name", ReportingUnitType.unknown)
+        ],
+        parties=[],
+        candidates=[Candidate(f"candidate-{i}") for i in range(selection_count)],
+        contests=[contest],
+        ballot_styles=[style],
+    )
+    return InternalManifest(manifest)
+
+
+def get_ciphertext_selection(
+    description: SelectionDescription, is_placeholder: bool
+) -> CiphertextBallotSelection:
+    """Get a selection matching the description, without a real encryption."""
+    return CiphertextBallotSelection(
+        description.object_id,
+        description.sequence_order,
+        description.crypto_hash(),
+        ElGamalCiphertext(ONE_MOD_P, ONE_MOD_P),
+        ZERO_MOD_Q,
+        is_placeholder,
+    )
+
+
+def get_ciphertext_ballot(internal_manifest: InternalManifest) -> CiphertextBallot:
+    """
+    Get a ballot matching the style of the manifest, without real encryptions,
+    listing the selections of each contest in reverse order.
+    """
+    contests = []
+    for description in internal_manifest.contests:
+        selections = [
+            get_ciphertext_selection(selection, False)
+            for selection in description.ballot_selections
+        ] + [
+            get_ciphertext_selection(selection, True)
+            for selection in description.placeholder_selections
+        ]
+        contests.append(
+            CiphertextBallotContest(
+                description.object_id,
+                description.sequence_order,
+                description.crypto_hash(),
+                list(reversed(selections)),
+                ElGamalCiphertext(ONE_MOD_P, ONE_MOD_P),
+                ZERO_MOD_Q,
+            )
+        )
+    return CiphertextBallot(
+        "ballot",
+        internal_manifest.ballot_styles[0].object_id,
+        internal_manifest.manifest_hash,
+        ZERO_MOD_Q,
+        contests,
+        ZERO_MOD_Q,
+        0,
+        ZERO_MOD_Q,
+        None,
+    )
+
+
+def validate_bench(
+    internal_manifest: InternalManifest, repetitions: int
+) -> List[float]:
+    """
+    Validates a ballot against its style,
+    returning the time (in seconds) of each validation.
+    """
+    ballot = get_ciphertext_ballot(internal_manifest)
+
+    timings = []
+    for _ in range(repetitions):
+        start = timer()
+        assert ballot_is_valid_for_style(ballot, internal_manifest)
+        timings.append(timer() - start)
+    return timings
+
+
+def main() -> None:
+    """Validate ballots with contests of increasing size."""
+    repetition_count = 20
+
+    for contest_size in (100, 200, 400, 800, 1600):
+        internal = get_large_contest_manifest(contest_size)
+        print(f"Validating a ballot with {contest_size} selections in one contest")
+        average = mean(validate_bench(internal, repetition_count))
+        print(f"    Avg               = {average:.6f} sec")
+        print(f"    Avg per selection = {average / contest_size * 1e6:.3f} µs")
+
+
+if __name__ == "__main__":
+    main()
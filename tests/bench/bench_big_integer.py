@@ -0,0 +1,132 @@
+from timeit import default_timer as timer
+from typing import Any, Callable, Dict, List, Tuple
+from unittest.mock import patch
+
+from statistics import mean
+
+from electionguard.big_integer import BigInteger
+from electionguard.chaum_pedersen import (
+    DisjunctiveChaumPedersenProof,
+    make_disjunctive_chaum_pedersen_zero,
+)
+from electionguard.elgamal import (
+    ElGamalCiphertext,
+    ElGamalKeyPair,
+    elgamal_encrypt,
+    elgamal_keypair_from_secret,
+)
+from electionguard.group import ElementModP, ElementModQ, ONE_MOD_Q, g_pow_p, mult_p
+from electionguard.nonces import Nonces
+from electionguard.utils import get_optional
+
+
+def int_compared_eq(self: BigInteger, other: Any) -> bool:
+    """Compare elements through python ints, as elements used to be compared."""
+    return (isinstance(other, BigInteger) and int(self.value) == int(other.value)) or (
+        isinstance(other, int) and int(self.value) == other
+    )
+
+
+class IntComparedElementModP(ElementModP):
+    """Element compared and hashed through python ints, as elements used to be."""
+
+    def __eq__(self, other: Any) -> bool:
+        return int_compared_eq(self, other)
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+
+def time_repeated(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Average time (in seconds) of calling the function."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = timer()
+        func()
+        timings.append(timer() - start)
+    return mean(timings)
+
+
+def dictionary_lookups(lookup: Dict[ElementModP, int], keys: List[ElementModP]) -> int:
+    """Look up every key in a discrete log style cache."""
+    return sum(lookup[key] for key in keys)
+
+
+def equality_checks(left: List[ElementModP], right: List[ElementModP]) -> int:
+    """Compare pairs of equal elements, as proof verification does."""
+    return sum(1 for (a, b) in zip(left, right) if a == b)
+
+
+def make_proofs(
+    keypair: ElGamalKeyPair, count: int, rands: Nonces
+) -> List[Tuple[ElGamalCiphertext, DisjunctiveChaumPedersenProof]]:
+    """Encrypt zeros and prove each encryption is a zero or one."""
+    proofs = []
+    for i in range(count):
+        ciphertext = get_optional(elgamal_encrypt(0, rands[i + 1], keypair.public_key))
+        proof = make_disjunctive_chaum_pedersen_zero(
+            ciphertext, rands[i + 1], keypair.public_key, ONE_MOD_Q, rands[count + i]
+        )
+        proofs.append((ciphertext, proof))
+    return proofs
+
+
+def verify_proofs(
+    keypair: ElGamalKeyPair,
+    proofs: List[Tuple[ElGamalCiphertext, DisjunctiveChaumPedersenProof]],
+) -> None:
+    """Verify every proof."""
+    for (ciphertext, proof) in proofs:
+        assert proof.is_valid(ciphertext, keypair.public_key, ONE_MOD_Q)
+
+
+def main() -> None:
+    """Compare element lookups, comparisons and proof checks through mpz and int."""
+    size = 10_000
+    rands = Nonces(ElementModQ(31337))
+
+    print(f"Building a discrete log cache of {size} elements")
+    elements: List[ElementModP] = []
+    element = g_pow_p(0)
+    for _ in range(size):
+        elements.append(element)
+        element = mult_p(element, g_pow_p(1))
+    int_compared = [IntComparedElementModP(e.value) for e in elements]
+    copies = [ElementModP(e.value) for e in elements]
+    int_compared_copies = [IntComparedElementModP(e.value) for e in elements]
+
+    cache = {e: exponent for (exponent, e) in enumerate(elements)}
+    int_compared_cache = {e: exponent for (exponent, e) in enumerate(int_compared)}
+
+    print(f"  Dictionary lookups ({size} iterations)")
+    mpz_lookup = time_repeated(lambda: dictionary_lookups(cache, copies))
+    int_lookup = time_repeated(
+        lambda: dictionary_lookups(int_compared_cache, int_compared_copies)
+    )
+    print(f"    mpz    = {mpz_lookup:.6f} sec")
+    print(f"    int    = {int_lookup:.6f} sec")
+    print(f"    Speedup: {int_lookup / mpz_lookup:.3f}x")
+
+    print(f"  Element equality checks ({size} iterations)")
+    mpz_equality = time_repeated(lambda: equality_checks(elements, copies))
+    int_equality = time_repeated(
+        lambda: equality_checks(int_compared, int_compared_copies)
+    )
+    print(f"    mpz    = {mpz_equality:.6f} sec")
+    print(f"    int    = {int_equality:.6f} sec")
+    print(f"    Speedup: {int_equality / mpz_equality:.3f}x")
+
+    proof_count = 100
+    print(f"  Validating Chaum-Pedersen proofs ({proof_count} iterations)")
+    keypair = get_optional(elgamal_keypair_from_secret(rands[0]))
+    proofs = make_proofs(keypair, proof_count, rands)
+    mpz_verify = time_repeated(lambda: verify_proofs(keypair, proofs))
+    with patch.object(BigInteger, "__eq__", int_compared_eq):
+        int_verify = time_repeated(lambda: verify_proofs(keypair, proofs))
+    print(f"    mpz    = {mpz_verify / proof_count:.6f} sec")
+    print(f"    int    = {int_verify / proof_count:.6f} sec")
+    print(f"    Speedup: {int_verify / mpz_verify:.3f}x")
+
+
+if __name__ == "__main__":
+    main()
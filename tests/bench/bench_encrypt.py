@@ -0,0 +1,81 @@
+import logging
+from io import StringIO
+from timeit import default_timer as timer
+from typing import List
+
+from statistics import mean, stdev
+
+from electionguard.elgamal import elgamal_keypair_from_secret
+from electionguard.encrypt import encrypt_ballot
+from electionguard.group import ElementModQ, TWO_MOD_Q
+from electionguard.logs import (
+    log_add_handler,
+    log_handlers,
+    log_remove_handler,
+)
+from electionguard.manifest import InternalManifest
+from electionguard.utils import get_optional
+from electionguard_tools.factories.ballot_factory import BallotFactory
+from electionguard_tools.factories.election_factory import ElectionFactory
+
+
+def encrypt_bench(
+    internal_manifest: InternalManifest, ballots_to_encrypt: int, log_level: int
+) -> List[float]:
+    """
+    Encrypts fake ballots with the log handled at the given level, writing the
+    log to memory, returning the time (in seconds) to encrypt each ballot.
+    """
+    election_factory = ElectionFactory()
+    keypair = get_optional(elgamal_keypair_from_secret(TWO_MOD_Q))
+    _, context = election_factory.get_fake_ciphertext_election(
+        election_factory.get_simple_manifest_from_file(), keypair.public_key
+    )
+    ballots = BallotFactory().generate_fake_plaintext_ballots_for_election(
+        internal_manifest, ballots_to_encrypt
+    )
+
+    original_handlers = list(log_handlers())
+    for original_handler in original_handlers:
+        log_remove_handler(original_handler)
+    handler = logging.StreamHandler(StringIO())
+    handler.setLevel(log_level)
+    log_add_handler(handler)
+
+    try:
+        timings = []
+        for ballot in ballots:
+            start = timer()
+            encrypt_ballot(ballot, internal_manifest, context, ElementModQ(1))
+            timings.append(timer() - start)
+        return timings
+    finally:
+        log_remove_handler(handler)
+        for original_handler in original_handlers:
+            log_add_handler(original_handler)
+
+
+def main() -> None:
+    """Compare encryption times with the crypto log messages handled and skipped."""
+    ballot_count = 20
+    manifest = ElectionFactory().get_simple_manifest_from_file()
+    internal = InternalManifest(manifest)
+
+    # warm up the fixed base tables and description hashes
+    encrypt_bench(internal, 2, logging.WARNING)
+
+    averages = {}
+    for name, level in (("INFO", logging.INFO), ("WARNING", logging.WARNING)):
+        print(f"Encrypting {ballot_count} ballots with the log at {name}")
+        timing_data = encrypt_bench(internal, ballot_count, level)
+        averages[name] = mean(timing_data)
+        print(f"    Avg    = {averages[name]:.6f} sec")
+        print(f"    Stddev = {stdev(timing_data):.6f} sec")
+
+    saved = averages["INFO"] - averages["WARNING"]
+    print()
+    print(f"Skipping crypto log messages saves {saved:.6f} sec per ballot")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,18 +7,27 @@ from tests.base_test_case import BaseTestCase
 
 from electionguard.chaum_pedersen import (
     ConstantChaumPedersenProof,
+    batch_verify_disjunctive_chaum_pedersen,
     make_disjunctive_chaum_pedersen_zero,
     make_disjunctive_chaum_pedersen_one,
     make_chaum_pedersen,
     make_constant_chaum_pedersen,
     make_disjunctive_chaum_pedersen,
 )
+from electionguard.constants import PrimeOption, use_prime_option
 from electionguard.elgamal import (
     ElGamalKeyPair,
     elgamal_encrypt,
     elgamal_keypair_from_secret,
 )
-from electionguard.group import ElementModQ, TWO_MOD_Q, ONE_MOD_Q, int_to_p, TWO_MOD_P
+from electionguard.group import (
+    ElementModQ,
+    TWO_MOD_Q,
+    ONE_MOD_Q,
+    int_to_p,
+    TWO_MOD_P,
+    rand_q,
+)
 from electionguard.utils import get_optional
 from electionguard_tools.strategies.elgamal import elgamal_keypairs
 from electionguard_tools.strategies.group import elements_mod_q_no_zero, elements_mod_q
@@ -129,6 +138,87 @@ class TestDisjunctiveChaumPedersen(BaseTestCase):
         self.assertFalse(proof.is_valid(message_bad, keypair.public_key, ONE_MOD_Q))
 
 
+class TestBatchDisjunctiveChaumPedersen(BaseTestCase):
+    """Batch verification of Disjunctive Chaum Pedersen tests"""
+
+    def _make_proofs(self, keypair: ElGamalKeyPair, count: int):
+        proofs = []
+        for i in range(count):
+            plaintext = i % 2
+            nonce = rand_q()
+            message = get_optional(
+                elgamal_encrypt(plaintext, nonce, keypair.public_key)
+            )
+            proof = make_disjunctive_chaum_pedersen(
+                message, nonce, keypair.public_key, ONE_MOD_Q, rand_q(), plaintext
+            )
+            proofs.append((message, proof))
+        return proofs
+
+    def test_batch_empty(self):
+        keypair = get_optional(elgamal_keypair_from_secret(TWO_MOD_Q))
+        self.assertEqual(
+            [],
+            batch_verify_disjunctive_chaum_pedersen([], keypair.public_key, ONE_MOD_Q),
+        )
+
+    @settings(
+        deadline=timedelta(milliseconds=2000),
+        suppress_health_check=[HealthCheck.too_slow],
+        max_examples=10,
+    )
+    @given(elgamal_keypairs(), integers(1, 10))
+    def test_batch_matches_individual_proofs(self, keypair: ElGamalKeyPair, count: int):
+        proofs = self._make_proofs(keypair, count)
+        (bad_message, bad_proof) = proofs[-1]
+        proofs[-1] = (
+            bad_message,
+            make_disjunctive_chaum_pedersen_zero(
+                get_optional(elgamal_encrypt(2, ONE_MOD_Q, keypair.public_key)),
+                ONE_MOD_Q,
+                keypair.public_key,
+                ONE_MOD_Q,
+                TWO_MOD_Q,
+            ),
+        )
+
+        expected = [
+            proof.is_valid(message, keypair.public_key, ONE_MOD_Q)
+            for (message, proof) in proofs
+        ]
+        self.assertEqual(
+            expected,
+            batch_verify_disjunctive_chaum_pedersen(
+                proofs, keypair.public_key, ONE_MOD_Q
+            ),
+        )
+        self.assertFalse(expected[-1])
+
+    @use_prime_option(PrimeOption.Standard)
+    def test_batch_with_standard_primes(self):
+        keypair = get_optional(elgamal_keypair_from_secret(rand_q()))
+        proofs = self._make_proofs(keypair, 6)
+
+        self.assertEqual(
+            [True] * 6,
+            batch_verify_disjunctive_chaum_pedersen(
+                proofs, keypair.public_key, ONE_MOD_Q
+            ),
+        )
+
+        # swapping two ciphertexts invalidates exactly those two proofs
+        (message0, proof0) = proofs[0]
+        (message1, proof1) = proofs[1]
+        proofs[0] = (message1, proof0)
+        proofs[1] = (message0, proof1)
+        self.assertEqual(
+            [False, False, True, True, True, True],
+            batch_verify_disjunctive_chaum_pedersen(
+                proofs, keypair.public_key, ONE_MOD_Q
+            ),
+        )
+
+
 class TestChaumPedersen(BaseTestCase):
     """Chaum Pedersen tests"""
 
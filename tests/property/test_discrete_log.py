@@ -1,16 +1,31 @@
 import asyncio
+from os import path
+from tempfile import TemporaryDirectory
+from typing import List, Tuple
+from unittest.mock import patch
+
 from hypothesis import given
 from hypothesis.strategies import integers
 
 from tests.base_test_case import BaseTestCase
 
-from electionguard.constants import get_generator, get_large_prime
+from electionguard.constants import (
+    PrimeOption,
+    get_generator,
+    get_large_prime,
+    use_prime_option,
+)
 from electionguard.discrete_log import (
     compute_discrete_log,
     compute_discrete_log_async,
+    DEFAULT_TABLE_SIZE,
     DiscreteLog,
+    DiscreteLogCache,
+    DiscreteLogNotFoundError,
+    DiscreteLogTable,
     precompute_discrete_log_cache,
 )
+from electionguard.scheduler import Scheduler
 from electionguard.group import (
     ElementModP,
     ElementModQ,
@@ -89,6 +104,27 @@ class TestDiscreteLogFunctions(BaseTestCase):
         self.assertEqual(plaintext, plaintext_again)
         self.assertEqual(len(cache), len(returned_cache))
 
+    def test_async_with_separate_event_loops(self) -> None:
+        # Arrange
+        elements = [g_pow_p(exponent) for exponent in range(20)]
+
+        async def discrete_logs() -> List[Tuple[int, DiscreteLogCache]]:
+            cache = {ONE_MOD_P: 0}
+            return await asyncio.gather(
+                *[compute_discrete_log_async(element, cache) for element in elements]
+            )
+
+        for _ in range(2):
+            # Act
+            loop = asyncio.new_event_loop()
+            results = loop.run_until_complete(discrete_logs())
+            loop.close()
+
+            # Assert
+            self.assertEqual(
+                list(range(20)), [exponent for (exponent, _cache) in results]
+            )
+
     @given(integers(0, 1000))
     def test_precompute_discrete_log(self, exponent: int) -> None:
         # Arrange
@@ -104,6 +140,144 @@ class TestDiscreteLogFunctions(BaseTestCase):
         self.assertEqual(exponent, calculated_exponent)
 
 
+class TestParallelPrecompute(BaseTestCase):
+    """Chunked and parallel discrete log precomputation tests"""
+
+    @patch("electionguard.discrete_log._PRECOMPUTE_CHUNK_SIZE", 100)
+    def test_precompute_cache_in_chunks(self) -> None:
+        # Arrange
+        progress: List[Tuple[int, int]] = []
+        cache_sizes: List[int] = []
+        initial_cache = {ONE_MOD_P: 0}
+
+        def on_progress(completed: int, total: int) -> None:
+            progress.append((completed, total))
+            cache_sizes.append(len(initial_cache))
+
+        # Act
+        with Scheduler() as scheduler, patch.object(
+            Scheduler, "cpu_count", return_value=1
+        ):
+            cache = precompute_discrete_log_cache(
+                1000, initial_cache, scheduler, on_progress
+            )
+
+        # Assert
+        self.assertEqual(1001, len(cache))
+        for exponent in [0, 99, 100, 101, 550, 1000]:
+            self.assertEqual(exponent, cache[g_pow_p(exponent)])
+        self.assertEqual((1000, 1000), progress[-1])
+        self.assertEqual(sorted(progress), progress)
+        # each round is stored in the cache before the next round is computed
+        self.assertEqual(
+            [completed - 100 + 1 for (completed, _) in progress], cache_sizes
+        )
+
+    @patch("electionguard.discrete_log._PRECOMPUTE_CHUNK_SIZE", 100)
+    def test_build_table_in_chunks(self) -> None:
+        # Arrange
+        progress: List[Tuple[int, int]] = []
+
+        # Act
+        with Scheduler() as scheduler:
+            table = DiscreteLogTable.build(
+                550,
+                scheduler,
+                lambda completed, total: progress.append((completed, total)),
+            )
+
+        # Assert
+        self.assertEqual(550, table.table_size)
+        for exponent in [0, 99, 100, 549, 550, 12345]:
+            self.assertEqual(exponent, table.discrete_log(g_pow_p(exponent)))
+        self.assertEqual((550, 550), progress[-1])
+
+    @patch("electionguard.discrete_log._PRECOMPUTE_CHUNK_SIZE", 100)
+    def test_precompute_cache_without_scheduler_closes_its_scheduler(self) -> None:
+        # Act
+        with patch.object(
+            Scheduler, "close", autospec=True, side_effect=Scheduler.close
+        ) as close:
+            cache = precompute_discrete_log_cache(300, {ONE_MOD_P: 0})
+
+        # Assert
+        self.assertEqual(301, len(cache))
+        close.assert_called_once()
+
+
+class TestDiscreteLogTable(BaseTestCase):
+    """Baby-step giant-step discrete log table tests"""
+
+    @given(integers(1, 64), integers(0, 5000))
+    def test_discrete_log(self, table_size: int, exponent: int) -> None:
+        # Arrange
+        table = DiscreteLogTable.build(table_size)
+
+        # Act
+        calculated_exponent = table.discrete_log(g_pow_p(exponent))
+
+        # Assert
+        self.assertEqual(table_size, table.table_size)
+        self.assertEqual(exponent, calculated_exponent)
+
+    def test_exponent_larger_than_max_is_not_found(self) -> None:
+        table = DiscreteLogTable.build(16)
+
+        self.assertEqual(100, table.discrete_log(g_pow_p(100), max_exponent=100))
+        with self.assertRaises(DiscreteLogNotFoundError):
+            table.discrete_log(g_pow_p(101), max_exponent=100)
+
+    def test_save_and_load(self) -> None:
+        # Arrange
+        table = DiscreteLogTable.build(128)
+        element = g_pow_p(1234)
+
+        # Act
+        with TemporaryDirectory() as directory:
+            table_path = path.join(directory, "dlog.table")
+            table.save(table_path)
+            loaded_table = DiscreteLogTable.load(table_path)
+
+        # Assert
+        self.assertEqual(table.table_size, loaded_table.table_size)
+        self.assertEqual(1234, loaded_table.discrete_log(element))
+
+    def test_memory_mapped_load(self) -> None:
+        # Arrange
+        table = DiscreteLogTable.build(64)
+
+        with TemporaryDirectory() as directory:
+            table_path = path.join(directory, "dlog.table")
+            table.save(table_path)
+
+            # Act
+            mapped_table = DiscreteLogTable.load(table_path, memory_map=True)
+
+            # Assert
+            self.assertEqual(64, mapped_table.table_size)
+            for exponent in [0, 63, 64, 4321]:
+                self.assertEqual(exponent, mapped_table.discrete_log(g_pow_p(exponent)))
+            del mapped_table
+
+    def test_load_rejects_other_files(self) -> None:
+        with TemporaryDirectory() as directory:
+            table_path = path.join(directory, "dlog.table")
+            with open(table_path, "wb") as table_file:
+                table_file.write(b"not a discrete log table" * 4)
+
+            for memory_map in [False, True]:
+                with self.assertRaises(ValueError):
+                    DiscreteLogTable.load(table_path, memory_map)
+
+    def test_table_for_other_constants_is_rejected(self) -> None:
+        table = DiscreteLogTable.build(16)
+
+        with use_prime_option(PrimeOption.Standard):
+            self.assertFalse(table.is_for_current_constants())
+            with self.assertRaises(ValueError):
+                table.discrete_log(ONE_MOD_P)
+
+
 class TestDiscreteLogClass(BaseTestCase):
     """Discrete log tests"""
 
@@ -146,6 +320,77 @@ class TestDiscreteLogClass(BaseTestCase):
         # Assert
         self.assertEqual(plaintext, plaintext_again)
 
+    def test_table_size(self) -> None:
+        # Arrange
+        DiscreteLog().set_table_size(32)
+
+        # Act
+        plaintext = DiscreteLog().discrete_log(g_pow_p(5000))
+        table_size = DiscreteLog().get_table().table_size
+        DiscreteLog().set_table_size(DEFAULT_TABLE_SIZE)
+
+        # Assert
+        self.assertEqual(32, table_size)
+        self.assertEqual(5000, plaintext)
+
+    def test_concurrent_async_requests_are_coalesced(self) -> None:
+        # Arrange
+        spy = self.mocker.spy(DiscreteLog, "discrete_log")
+        exponents = [12345, 12345, 6789, 12345, 6789]
+
+        async def discrete_logs() -> List[int]:
+            return await asyncio.gather(
+                *[
+                    DiscreteLog().discrete_log_async(g_pow_p(exponent))
+                    for exponent in exponents
+                ]
+            )
+
+        # Act
+        loop = asyncio.new_event_loop()
+        results = loop.run_until_complete(discrete_logs())
+        loop.close()
+
+        # Assert
+        self.assertEqual(exponents, results)
+        self.assertEqual(2, spy.call_count)
+
+    def test_precompute_cache_async_fills_cache(self) -> None:
+        # Act
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(DiscreteLog().precompute_cache_async(1500))
+        loop.close()
+
+        # Assert
+        self.assertGreaterEqual(len(DiscreteLog().get_cache()), 1501)
+        self.assertEqual(1500, DiscreteLog().get_cache()[g_pow_p(1500)])
+
+    def test_precompute_with_table_path(self) -> None:
+        with TemporaryDirectory() as directory:
+            # Arrange
+            table_path = path.join(directory, "dlog.table")
+            DiscreteLog().set_table_path(table_path)
+            DiscreteLog().set_table_size(16)
+
+            # Act
+            DiscreteLog().precompute_cache(10_000)
+            table_size = DiscreteLog().get_table().table_size
+            file_size = path.getsize(table_path)
+            plaintext = DiscreteLog().discrete_log(g_pow_p(9999))
+
+            # Another process starts with only the path and maps the same file
+            DiscreteLog().set_table_path(table_path)
+            mapped_table_size = DiscreteLog().get_table().table_size
+            DiscreteLog().set_table_path(None)
+            DiscreteLog().set_table_size(DEFAULT_TABLE_SIZE)
+
+        # Assert
+        # the file holds a baby step per square root of the exponents, not one per exponent
+        self.assertEqual(101, table_size)
+        self.assertEqual(48 + 16 * 101, file_size)
+        self.assertEqual(101, mapped_table_size)
+        self.assertEqual(9999, plaintext)
+
     def test_cached_one_async(self) -> None:
         # Arrange
         plaintext = ONE_MOD_Q
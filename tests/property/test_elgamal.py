@@ -11,6 +11,8 @@ from electionguard.constants import (
     get_large_prime,
 )
 from electionguard.elgamal import (
+    ElGamalAccumulator,
+    ElGamalCiphertext,
     ElGamalKeyPair,
     elgamal_encrypt,
     elgamal_add,
@@ -123,6 +125,35 @@ class TestElGamal(BaseTestCase):
 
         self.assertEqual(total, m1 + m2)
 
+    @given(
+        elgamal_keypairs(),
+        integers(0, 100),
+        elements_mod_q_no_zero(),
+        integers(0, 100),
+        elements_mod_q_no_zero(),
+    )
+    def test_elgamal_accumulator_matches_elgamal_add(
+        self,
+        keypair: ElGamalKeyPair,
+        m1: int,
+        r1: ElementModQ,
+        m2: int,
+        r2: ElementModQ,
+    ) -> None:
+        c1 = get_optional(elgamal_encrypt(m1, r1, keypair.public_key))
+        c2 = get_optional(elgamal_encrypt(m2, r2, keypair.public_key))
+
+        accumulator = ElGamalAccumulator(c1).add(c2)
+        combined = ElGamalAccumulator(c2).combine(ElGamalAccumulator().add_all([c1]))
+
+        self.assertEqual(elgamal_add(c1, c2), accumulator.ciphertext())
+        self.assertEqual(elgamal_add(c1, c2), combined.ciphertext())
+        self.assertEqual(accumulator.ciphertext().decrypt(keypair.secret_key), m1 + m2)
+        self.assertEqual(
+            ElGamalAccumulator().ciphertext(),
+            ElGamalCiphertext(ONE_MOD_P, ONE_MOD_P),
+        )
+
     def test_elgamal_add_requires_args(self) -> None:
         self.assertRaises(Exception, elgamal_add)
 
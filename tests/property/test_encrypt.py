@@ -54,6 +54,7 @@ from electionguard.manifest import (
     SelectionDescription,
     VoteVariationType,
 )
+from electionguard.scheduler import Scheduler
 
 
 election_factory = ElectionFactory.ElectionFactory()
@@ -591,6 +592,123 @@ class TestEncrypt(BaseTestCase):
             )
         )
 
+    def test_encrypt_batch_with_mediator_matches_serial_encryption(self):
+        # Arrange
+        keypair = elgamal_keypair_from_secret(int_to_q(2))
+        manifest = election_factory.get_simple_manifest_from_file()
+        internal_manifest, context = election_factory.get_fake_ciphertext_election(
+            manifest, keypair.public_key
+        )
+
+        ballots = ballot_factory.generate_fake_plaintext_ballots_for_election(
+            internal_manifest, 3
+        )
+        nonces = [int_to_q(i + 1) for i in range(len(ballots))]
+
+        device = EncryptionDevice(12345, 23456, 34567, "Location")
+        subject = EncryptionMediator(internal_manifest, context, device)
+
+        # Act
+        with patch("electionguard.ballot.to_ticks", return_value=1234):
+            result = subject.encrypt_batch(ballots, nonces)
+
+            # a failed process pool falls back to encrypting in this process
+            fallback_subject = EncryptionMediator(internal_manifest, context, device)
+            with patch.object(Scheduler, "schedule", return_value=[]):
+                fallback_result = fallback_subject.encrypt_batch(ballots, nonces)
+
+            encryption_seed = device.get_hash()
+            expected = []
+            for (ballot, nonce) in zip(ballots, nonces):
+                encrypted_ballot = encrypt_ballot(
+                    ballot, internal_manifest, context, encryption_seed, nonce
+                )
+                encryption_seed = encrypted_ballot.code
+                expected.append(encrypted_ballot)
+
+        # Assert
+        self.assertEqual(expected, result)
+        self.assertEqual(expected, fallback_result)
+        self.assertEqual(expected[-1].code, subject._encryption_seed)
+
+    def test_encrypt_ballot_with_scheduler_matches_serial_encryption(self):
+        # Arrange
+        keypair = elgamal_keypair_from_secret(int_to_q(2))
+        manifest = election_factory.get_simple_manifest_from_file()
+        internal_manifest, context = election_factory.get_fake_ciphertext_election(
+            manifest, keypair.public_key
+        )
+        ballot = ballot_factory.get_simple_ballot_from_file()
+        seed = election_factory.get_encryption_device().get_hash()
+
+        with patch("electionguard.ballot.to_ticks", return_value=1234):
+            expected = encrypt_ballot(
+                ballot, internal_manifest, context, seed, TWO_MOD_Q
+            )
+
+            # Act
+            # in parallel over the contests, then over the selections of each contest
+            results = []
+            for cpu_count in (1, 1000):
+                with patch.object(Scheduler, "cpu_count", return_value=cpu_count):
+                    results.append(
+                        encrypt_ballot(
+                            ballot,
+                            internal_manifest,
+                            context,
+                            seed,
+                            TWO_MOD_Q,
+                            scheduler=Scheduler(),
+                        )
+                    )
+
+        # Assert
+        for result in results:
+            self.assertEqual(expected, result)
+
+    def test_encrypt_precomputed_ballot_with_mediator_matches_encryption(self):
+        # Arrange
+        keypair = elgamal_keypair_from_secret(int_to_q(2))
+        manifest = election_factory.get_simple_manifest_from_file()
+        internal_manifest, context = election_factory.get_fake_ciphertext_election(
+            manifest, keypair.public_key
+        )
+        ballot = ballot_factory.get_simple_ballot_from_file()
+        device = EncryptionDevice(12345, 23456, 34567, "Location")
+
+        with patch("electionguard.ballot.to_ticks", return_value=1234):
+            expected = encrypt_ballot(
+                ballot, internal_manifest, context, device.get_hash(), TWO_MOD_Q
+            )
+
+            # Act
+            with EncryptionMediator(internal_manifest, context, device) as subject:
+                subject.precompute(ballot.object_id, ballot.style_id, TWO_MOD_Q)
+                result = subject.encrypt(ballot)
+
+            with EncryptionMediator(internal_manifest, context, device) as subject:
+                subject.precompute(ballot.object_id, ballot.style_id, TWO_MOD_Q)
+                batch_result = subject.encrypt_batch([ballot])
+
+            with EncryptionMediator(internal_manifest, context, device) as subject:
+                subject.precompute(ballot.object_id, ballot.style_id, TWO_MOD_Q)
+                subject.discard_precomputed(ballot.object_id)
+                discarded_result = subject.encrypt(ballot)
+
+            subject = EncryptionMediator(internal_manifest, context, device)
+            subject.precompute(ballot.object_id, ballot.style_id, TWO_MOD_Q)
+            subject.close()
+            closed_result = subject.encrypt(ballot)
+
+        # Assert
+        # the ballot is encrypted with the nonce it was precomputed for,
+        # until discarded or the mediator is closed
+        self.assertEqual(expected, result)
+        self.assertEqual([expected], batch_result)
+        for other_result in (discarded_result, closed_result):
+            self.assertIsNotNone(other_result)
+            self.assertNotEqual(expected.nonce, other_result.nonce)
+
     def test_encrypt_simple_ballot_from_files_succeeds(self) -> None:
         # Arrange
         keypair = elgamal_keypair_from_secret(int_to_q(2))
@@ -1,3 +1,5 @@
+from base64 import b16decode
+import pickle
 from typing import Optional
 
 from hypothesis import given
@@ -5,17 +7,21 @@ from hypothesis import given
 from tests.base_test_case import BaseTestCase
 
 from electionguard.constants import (
+    PrimeOption,
+    use_prime_option,
     get_small_prime,
     get_large_prime,
     get_generator,
     get_cofactor,
 )
+from electionguard.elgamal import ElGamalCiphertext
 from electionguard.group import (
     ElementModP,
     ElementModQ,
     a_minus_b_q,
     mult_inv_p,
     ONE_MOD_P,
+    TWO_MOD_P,
     mult_p,
     ZERO_MOD_P,
     ONE_MOD_Q,
@@ -27,7 +33,16 @@ from electionguard.group import (
     div_q,
     div_p,
     a_plus_bc_q,
+    pow_p,
+    multi_pow_p,
+    FixedBaseTable,
+    PrecomputedPowers,
+    register_fixed_base,
+    unregister_fixed_base,
+    batch_is_valid_residue,
+    rand_q,
 )
+from electionguard.serialize import from_raw, to_raw
 from electionguard.utils import (
     flatmap_optional,
     get_or_else_optional,
@@ -196,6 +211,143 @@ class TestModularArithmetic(BaseTestCase):
         self.assertEqual(None, int_to_q(oversize))
 
 
+class TestElementRepresentation(BaseTestCase):
+    """Element representation tests"""
+
+    @given(elements_mod_p(), elements_mod_q())
+    def test_hex_representation(self, p: ElementModP, q: ElementModQ) -> None:
+        for element in [p, q]:
+            self.assertEqual(element, type(element)(element.to_hex()))
+            self.assertEqual(element.to_hex(), str(element))
+            self.assertEqual(b16decode(element.to_hex()), element.to_hex_bytes())
+        self.assertFalse(hasattr(p, "__dict__"))
+
+    @given(elements_mod_p(), elements_mod_q())
+    def test_serialization_round_trip(self, p: ElementModP, q: ElementModQ) -> None:
+        ciphertext = ElGamalCiphertext(p, p)
+        self.assertEqual(f'"{p.to_hex()}"', to_raw(p))
+        self.assertEqual(ciphertext, from_raw(ElGamalCiphertext, to_raw(ciphertext)))
+        self.assertEqual(p, pickle.loads(pickle.dumps(p)))
+        self.assertIsInstance(pickle.loads(pickle.dumps(q)), ElementModQ)
+
+
+class TestFixedBaseTable(BaseTestCase):
+    """Fixed-base exponentiation tests"""
+
+    @given(elements_mod_p_no_zero(), elements_mod_q())
+    def test_table_matches_pow_p(self, base: ElementModP, e: ElementModQ) -> None:
+        table = FixedBaseTable(base)
+        self.assertEqual(pow_p(base, e), table.pow(e))
+        self.assertEqual(pow_p(base, int(e)), table.pow(int(e)))
+
+    @given(elements_mod_p_no_zero(), elements_mod_p())
+    def test_table_falls_back_for_large_exponents(
+        self, base: ElementModP, e: ElementModP
+    ) -> None:
+        table = FixedBaseTable(base)
+        self.assertEqual(
+            ElementModP(pow(int(base), int(e), get_large_prime())), table.pow(e)
+        )
+
+    @given(elements_mod_p_no_zero(), elements_mod_q())
+    def test_registered_base_is_used_by_pow_p(
+        self, base: ElementModP, e: ElementModQ
+    ) -> None:
+        expected = pow_p(base, e)
+
+        table = register_fixed_base(base)
+        self.assertIs(table, register_fixed_base(base))
+        self.assertEqual(expected, pow_p(base, e))
+
+        unregister_fixed_base(base)
+        self.assertEqual(expected, pow_p(base, e))
+
+    @given(elements_mod_p())
+    def test_g_pow_p_matches_powmod(self, e: ElementModP) -> None:
+        self.assertEqual(
+            ElementModP(pow(get_generator(), int(e), get_large_prime())), g_pow_p(e)
+        )
+
+    @given(elements_mod_p_no_zero(), elements_mod_q(), elements_mod_q())
+    def test_precomputed_powers_match_pow_p(
+        self, base: ElementModP, e1: ElementModQ, e2: ElementModQ
+    ) -> None:
+        powers = PrecomputedPowers(base, [e1], [e1])
+        for e in (e1, e2):
+            self.assertEqual(g_pow_p(e), powers.g_pow_p(e))
+            self.assertEqual(pow_p(base, e), powers.pow_p(base, e))
+            self.assertEqual(pow_p(TWO_MOD_P, e), powers.pow_p(TWO_MOD_P, e))
+
+
+class TestMultiPow(BaseTestCase):
+    """Simultaneous multi-exponentiation tests"""
+
+    @given(
+        elements_mod_p(), elements_mod_p_no_zero(), elements_mod_q(), elements_mod_q()
+    )
+    def test_multi_pow_p_matches_pow_p(
+        self, a: ElementModP, b: ElementModP, e1: ElementModQ, e2: ElementModQ
+    ) -> None:
+        self.assertEqual(
+            mult_p(pow_p(a, e1), pow_p(b, e2), g_pow_p(e1)),
+            multi_pow_p([a, b, get_generator()], [e1, e2, e1]),
+        )
+        self.assertEqual(
+            mult_p(pow_p(a, int(e1) * 3), pow_p(b, int(e2) + 7)),
+            multi_pow_p([a, b], [int(e1) * 3, int(e2) + 7]),
+        )
+
+    @given(elements_mod_p_no_zero(), elements_mod_q())
+    def test_multi_pow_p_negative_exponent(
+        self, base: ElementModP, e: ElementModQ
+    ) -> None:
+        self.assertEqual(mult_inv_p(pow_p(base, e)), multi_pow_p([base], [-int(e)]))
+
+    def test_multi_pow_p_edge_cases(self) -> None:
+        self.assertEqual(ONE_MOD_P, multi_pow_p([], []))
+        self.assertEqual(ONE_MOD_P, multi_pow_p([TWO_MOD_P], [0]))
+        self.assertRaises(ValueError, multi_pow_p, [TWO_MOD_P], [])
+
+    @use_prime_option(PrimeOption.Standard)
+    def test_multi_pow_p_with_standard_primes(self) -> None:
+        bases = [g_pow_p(rand_q()) for _ in range(4)] + [get_generator()]
+        exponents = [rand_q() for _ in range(5)]
+        self.assertEqual(
+            mult_p(*[pow_p(b, e) for (b, e) in zip(bases, exponents)]),
+            multi_pow_p(bases, exponents),
+        )
+
+
+class TestBatchResidue(BaseTestCase):
+    """Batch residue validation tests"""
+
+    @given(elements_mod_p(), elements_mod_q())
+    def test_batch_matches_individual_residues(
+        self, p: ElementModP, q: ElementModQ
+    ) -> None:
+        residue = g_pow_p(q)
+        self.assertTrue(batch_is_valid_residue([]))
+        self.assertTrue(batch_is_valid_residue([residue, residue]))
+        self.assertEqual(
+            p.is_valid_residue(), batch_is_valid_residue([residue, p, residue])
+        )
+
+    @use_prime_option(PrimeOption.Standard)
+    def test_batch_with_standard_primes(self) -> None:
+        residues = [g_pow_p(rand_q()) for _ in range(5)]
+        self.assertTrue(batch_is_valid_residue(residues))
+
+        # p - 1 has order 2 and 2^(2q) has order r / 2, neither is in Z^r_p
+        for bad in [
+            ElementModP(get_large_prime() - 1),
+            ElementModP(4),
+            pow_p(2, 2 * get_small_prime()),
+        ]:
+            self.assertFalse(bad.is_valid_residue())
+            self.assertFalse(batch_is_valid_residue(residues + [bad]))
+        self.assertFalse(batch_is_valid_residue(residues + [ZERO_MOD_P]))
+
+
 class TestOptionalFunctions(BaseTestCase):
     """Math Optional Functions tests"""
 
@@ -1,17 +1,67 @@
+from hashlib import sha256
 from typing import List, Optional
 
 from hypothesis import given
-from hypothesis.strategies import integers
+from hypothesis.strategies import (
+    integers,
+    lists,
+    none,
+    one_of,
+    recursive,
+    text,
+    tuples,
+)
 
 
 from tests.base_test_case import BaseTestCase
 
 from electionguard.big_integer import BigInteger
 from electionguard.group import ElementModP, ElementModQ
-from electionguard.hash import hash_elems
+from electionguard.constants import get_small_prime
+from electionguard.hash import CryptoHashable, HashPrefix, hash_elems
 from electionguard_tools.strategies.group import elements_mod_p, elements_mod_q
 
 
+def _recursive_hash_elems(*a) -> ElementModQ:
+    """The straightforward recursive definition of `hash_elems`."""
+    h = sha256()
+    h.update("|".encode("utf-8"))
+    for x in a:
+        if isinstance(x, (ElementModP, ElementModQ)):
+            hash_me = x.to_hex()
+        elif isinstance(x, CryptoHashable):
+            hash_me = x.crypto_hash().to_hex()
+        elif isinstance(x, str):
+            hash_me = x
+        elif isinstance(x, int):
+            hash_me = str(x)
+        elif not x:
+            hash_me = "null"
+        elif isinstance(x, (list, tuple)):
+            hash_me = _recursive_hash_elems(*x).to_hex()
+        else:
+            hash_me = str(x)
+        h.update((hash_me + "|").encode("utf-8"))
+    return ElementModQ(int.from_bytes(h.digest(), byteorder="big") % get_small_prime())
+
+
+class _Hashable:
+    """Minimal `CryptoHashable` implementation."""
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+    def crypto_hash(self) -> ElementModQ:
+        return hash_elems(self.value)
+
+
+_nested_elements = recursive(
+    one_of(none(), integers(), text(max_size=5), elements_mod_q(), elements_mod_p()),
+    lambda children: one_of(lists(children, max_size=4), tuples(children, children)),
+    max_leaves=20,
+)
+
+
 class TestHash(BaseTestCase):
     """Hash tests"""
 
@@ -107,3 +157,41 @@ class TestHash(BaseTestCase):
 
         self.assertNotEqual(nested_hash, non_nested_1)
         self.assertEqual(nested_hash, non_nested_2)
+
+    @given(lists(_nested_elements, max_size=5))
+    def test_hash_matches_recursive_definition(self, elements: List) -> None:
+        self.assertEqual(_recursive_hash_elems(*elements), hash_elems(*elements))
+
+    @given(lists(_nested_elements, max_size=3), lists(_nested_elements, max_size=3))
+    def test_hash_prefix_matches_hash_of_all_elements(
+        self, prefix: List, elements: List
+    ) -> None:
+        hash_prefix = HashPrefix(*prefix)
+
+        self.assertEqual(
+            hash_elems(*prefix, *elements), hash_prefix.hash_elems(*elements)
+        )
+        self.assertEqual(hash_elems(*prefix), hash_prefix.hash_elems())
+
+    def test_hash_of_other_types_matches_recursive_definition(self) -> None:
+        elements = [
+            True,
+            False,
+            1.5,
+            _Hashable("a"),
+            [_Hashable("b"), [None, [], ()]],
+            BigInteger(12345),
+        ]
+        self.assertEqual(_recursive_hash_elems(*elements), hash_elems(*elements))
+        self.assertEqual(hash_elems(iter(["0", "1"])), hash_elems(["0", "1"]))
+
+    def test_hash_of_deeply_nested_lists(self) -> None:
+        nested: List = ["0"]
+        for _ in range(5000):
+            nested = [nested]
+
+        expected = hash_elems("0")
+        for _ in range(5001):
+            expected = hash_elems(expected.to_hex())
+
+        self.assertEqual(expected, hash_elems(nested))
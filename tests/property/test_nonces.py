@@ -6,6 +6,7 @@ from hypothesis.strategies import integers
 from tests.base_test_case import BaseTestCase
 
 from electionguard.group import ElementModQ
+from electionguard.hash import hash_elems
 from electionguard.nonces import Nonces
 from electionguard_tools.strategies.group import elements_mod_q
 
@@ -54,8 +55,24 @@ class TestNonces(BaseTestCase):
         self.assertEqual(len(l2), 10)
         self.assertEqual(l, l2)
 
+    @given(elements_mod_q(), integers(min_value=0, max_value=1000000))
+    def test_nonces_take_matches_hash_of_seed_and_index(
+        self, seed: ElementModQ, i: int
+    ):
+        n = Nonces(seed, "header")
+        expected_seed = hash_elems(seed, "header")
+
+        nonces = n.take(i, 3, "purpose")
+
+        self.assertEqual(
+            [hash_elems(expected_seed, i + j, "purpose") for j in range(3)], nonces
+        )
+        self.assertEqual(n.get_with_headers(i + 2, "purpose"), nonces[2])
+        self.assertEqual(n[i : i + 3], n.take(i, 3))
+
     def test_nonces_type_errors(self):
         n = Nonces(ElementModQ(3))
         self.assertRaises(TypeError, len, n)
         self.assertRaises(TypeError, lambda: n[1:])
         self.assertRaises(TypeError, lambda: n.get_with_headers(-1))
+        self.assertRaises(TypeError, lambda: n.take(-1, 2))
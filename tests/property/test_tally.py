@@ -1,5 +1,7 @@
+from dataclasses import replace
 from datetime import timedelta
 from typing import Dict
+from unittest.mock import patch
 
 from hypothesis import given, HealthCheck, settings, Phase
 from hypothesis.strategies import integers
@@ -11,11 +13,20 @@ from electionguard.ballot import (
     SubmittedBallot,
 )
 from electionguard.ballot_box import cast_ballot, spoil_ballot
+from electionguard.chaum_pedersen import batch_is_valid_disjunctive_chaum_pedersen
 from electionguard.data_store import DataStore
 from electionguard.elgamal import ElGamalSecretKey
 from electionguard.encrypt import encrypt_ballot
 from electionguard.group import ONE_MOD_Q
-from electionguard.tally import CiphertextTally, tally_ballots, tally_ballot
+from electionguard.scheduler import Scheduler
+from electionguard.serialize import from_raw, to_raw
+from electionguard.tally import (
+    CiphertextTally,
+    PartialCiphertextTally,
+    tally_ballot_stream,
+    tally_ballots,
+    tally_ballot,
+)
 
 
 from electionguard_tools.strategies.election import (
@@ -78,6 +89,278 @@ class TestTally(BaseTestCase):
         decrypted_tallies = self._decrypt_with_secret(result, secret_key)
         self.assertEqual(plaintext_tallies, decrypted_tallies)
 
+    @settings(
+        deadline=timedelta(milliseconds=10000),
+        suppress_health_check=[HealthCheck.too_slow],
+        max_examples=3,
+        # disabling the "shrink" phase, because it runs very slowly
+        phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.target],
+    )
+    @given(integers(3, 6).flatmap(lambda n: elections_and_ballots(n)))
+    def test_tally_cast_ballots_accumulates_valid_tally_in_chunks(
+        self, everything: ElectionsAndBallotsTupleType
+    ):
+        # Arrange
+        (
+            _election_description,
+            internal_manifest,
+            ballots,
+            secret_key,
+            context,
+        ) = everything
+        plaintext_tallies = accumulate_plaintext_ballots(ballots)
+
+        store = DataStore()
+        encryption_seed = ElectionFactory.get_encryption_device().get_hash()
+        for ballot in ballots:
+            encrypted_ballot = encrypt_ballot(
+                ballot, internal_manifest, context, encryption_seed
+            )
+            encryption_seed = encrypted_ballot.code
+            store.set(encrypted_ballot.object_id, cast_ballot(encrypted_ballot))
+
+        # act
+        with patch("electionguard.tally._MIN_ACCUMULATE_CHUNK_SIZE", 2), patch(
+            "electionguard.tally._ACCUMULATE_CHUNKS_PER_CPU", len(ballots) * 100
+        ):
+            result = tally_ballots(store, internal_manifest, context)
+        self.assertIsNotNone(result)
+
+        # Assert
+        decrypted_tallies = self._decrypt_with_secret(result, secret_key)
+        self.assertEqual(plaintext_tallies, decrypted_tallies)
+
+    @settings(
+        deadline=timedelta(milliseconds=10000),
+        suppress_health_check=[HealthCheck.too_slow],
+        max_examples=3,
+        # disabling the "shrink" phase, because it runs very slowly
+        phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.target],
+    )
+    @given(integers(3, 6).flatmap(lambda n: elections_and_ballots(n)))
+    def test_tally_ballot_stream_accumulates_valid_tally(
+        self, everything: ElectionsAndBallotsTupleType
+    ):
+        # Arrange
+        (
+            _election_description,
+            internal_manifest,
+            ballots,
+            secret_key,
+            context,
+        ) = everything
+        plaintext_tallies = accumulate_plaintext_ballots(ballots)
+
+        encryption_seed = ElectionFactory.get_encryption_device().get_hash()
+        submitted_ballots = []
+        for ballot in ballots:
+            encrypted_ballot = encrypt_ballot(
+                ballot, internal_manifest, context, encryption_seed
+            )
+            encryption_seed = encrypted_ballot.code
+            submitted_ballots.append(cast_ballot(encrypted_ballot))
+
+        # act
+        # a generator can only be read once, and the repeated ballot is only counted once
+        with patch.object(
+            Scheduler, "close", autospec=True, side_effect=Scheduler.close
+        ) as close:
+            result = tally_ballot_stream(
+                (ballot for ballot in submitted_ballots + submitted_ballots[:1]),
+                internal_manifest,
+                context,
+                window_size=2,
+            )
+        self.assertIsNotNone(result)
+
+        # the ballots are accumulated in this process if the process pool fails
+        with patch.object(Scheduler, "schedule", return_value=[]):
+            fallback_result = tally_ballot_stream(
+                submitted_ballots, internal_manifest, context, window_size=2
+            )
+
+        # Assert
+        # one scheduler is opened and closed for all of the windows
+        close.assert_called_once()
+        for tally in (result, fallback_result):
+            self.assertEqual(tally.cast(), len(ballots))
+            decrypted_tallies = self._decrypt_with_secret(tally, secret_key)
+            self.assertEqual(plaintext_tallies, decrypted_tallies)
+
+    @settings(
+        deadline=timedelta(milliseconds=10000),
+        suppress_health_check=[HealthCheck.too_slow],
+        max_examples=3,
+        # disabling the "shrink" phase, because it runs very slowly
+        phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.target],
+    )
+    @given(integers(3, 6).flatmap(lambda n: elections_and_ballots(n)))
+    def test_tally_ballot_stream_skips_ballot_with_invalid_selection_proof(
+        self, everything: ElectionsAndBallotsTupleType
+    ):
+        # Arrange
+        (
+            _election_description,
+            internal_manifest,
+            ballots,
+            secret_key,
+            context,
+        ) = everything
+        plaintext_tallies = accumulate_plaintext_ballots(ballots[1:])
+
+        encryption_seed = ElectionFactory.get_encryption_device().get_hash()
+        submitted_ballots = []
+        for ballot in ballots:
+            encrypted_ballot = encrypt_ballot(
+                ballot, internal_manifest, context, encryption_seed
+            )
+            encryption_seed = encrypted_ballot.code
+            submitted_ballots.append(cast_ballot(encrypted_ballot))
+
+        # the proofs are not part of the crypto hash, so swapping them only breaks the proofs
+        selections = submitted_ballots[0].contests[0].ballot_selections
+        (selections[0].proof, selections[1].proof) = (
+            selections[1].proof,
+            selections[0].proof,
+        )
+
+        # act
+        with patch(
+            "electionguard.ballot_validator.batch_is_valid_disjunctive_chaum_pedersen",
+            wraps=batch_is_valid_disjunctive_chaum_pedersen,
+        ) as batch_is_valid:
+            result = tally_ballot_stream(submitted_ballots, internal_manifest, context)
+
+        # Assert
+        # the proofs of every ballot are checked in one batch before finding the invalid ballot
+        batch_is_valid.assert_called_once()
+        self.assertEqual(result.cast(), len(ballots) - 1)
+        self.assertNotIn(submitted_ballots[0].object_id, result.cast_ballot_ids)
+        decrypted_tallies = self._decrypt_with_secret(result, secret_key)
+        self.assertEqual(plaintext_tallies, decrypted_tallies)
+
+    @settings(
+        deadline=timedelta(milliseconds=10000),
+        suppress_health_check=[HealthCheck.too_slow],
+        max_examples=3,
+        # disabling the "shrink" phase, because it runs very slowly
+        phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.target],
+    )
+    @given(integers(3, 6).flatmap(lambda n: elections_and_ballots(n)))
+    def test_tally_ballot_stream_with_failing_window_is_rolled_back(
+        self, everything: ElectionsAndBallotsTupleType
+    ):
+        # Arrange
+        (
+            _election_description,
+            internal_manifest,
+            ballots,
+            _secret_key,
+            context,
+        ) = everything
+
+        encryption_seed = ElectionFactory.get_encryption_device().get_hash()
+        submitted_ballots = []
+        for ballot in ballots:
+            encrypted_ballot = encrypt_ballot(
+                ballot, internal_manifest, context, encryption_seed
+            )
+            encryption_seed = encrypted_ballot.code
+            submitted_ballots.append(cast_ballot(encrypted_ballot))
+        submitted_ballots[0] = spoil_ballot(submitted_ballots[0])
+
+        tally = CiphertextTally("stream", internal_manifest, context)
+        self.assertTrue(tally.stream_append(submitted_ballots[:1], True))
+        expected_contests = to_raw(tally.publish().contests)
+
+        # accumulate the first window, then fail on the next one
+        accumulate = CiphertextTally._execute_accumulate
+        window_results = iter([True, False])
+
+        def accumulate_then_fail(tally, *args):
+            return next(window_results) and accumulate(tally, *args)
+
+        # act
+        with patch.object(
+            CiphertextTally,
+            "_execute_accumulate",
+            autospec=True,
+            side_effect=accumulate_then_fail,
+        ):
+            result = tally.stream_append(submitted_ballots, True, window_size=2)
+
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(tally.cast(), 0)
+        self.assertEqual(tally.spoiled(), 1)
+        self.assertEqual(expected_contests, to_raw(tally.publish().contests))
+
+    @settings(
+        deadline=timedelta(milliseconds=10000),
+        suppress_health_check=[HealthCheck.too_slow],
+        max_examples=3,
+        # disabling the "shrink" phase, because it runs very slowly
+        phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.target],
+    )
+    @given(integers(2, 5).flatmap(lambda n: elections_and_ballots(n)))
+    def test_tally_merge_partial_tallies_accumulates_valid_tally(
+        self, everything: ElectionsAndBallotsTupleType
+    ):
+        # Arrange
+        (
+            _election_description,
+            internal_manifest,
+            ballots,
+            secret_key,
+            context,
+        ) = everything
+        plaintext_tallies = accumulate_plaintext_ballots(ballots)
+
+        encryption_seed = ElectionFactory.get_encryption_device().get_hash()
+        submitted_ballots = []
+        for ballot in ballots:
+            encrypted_ballot = encrypt_ballot(
+                ballot, internal_manifest, context, encryption_seed
+            )
+            encryption_seed = encrypted_ballot.code
+            submitted_ballots.append(cast_ballot(encrypted_ballot))
+
+        # tally each half of the ballots separately, as different machines would
+        half = len(submitted_ballots) // 2
+        partials = []
+        for ballots_part in (submitted_ballots[:half], submitted_ballots[half:]):
+            partial = tally_ballot_stream(ballots_part, internal_manifest, context)
+            partials.append(
+                from_raw(PartialCiphertextTally, to_raw(partial.publish_partial()))
+            )
+
+        # act
+        result = CiphertextTally("merged", internal_manifest, context)
+        merged = [result.merge(partial) for partial in partials]
+
+        # Assert
+        self.assertTrue(all(merged))
+        self.assertEqual(result.cast(), len(ballots))
+        decrypted_tallies = self._decrypt_with_secret(result, secret_key)
+        self.assertEqual(plaintext_tallies, decrypted_tallies)
+
+        # a partial tally can not be merged twice, even with an empty ballot id,
+        # nor a tally of another election context
+        empty_id_partial = replace(
+            CiphertextTally("empty", internal_manifest, context).publish_partial(),
+            cast_ballot_ids=[""],
+        )
+        self.assertTrue(result.merge(empty_id_partial))
+        self.assertFalse(result.merge(empty_id_partial))
+        self.assertFalse(result.merge(partials[0]))
+        other_context = replace(context, crypto_extended_base_hash=ONE_MOD_Q)
+        self.assertFalse(
+            result.merge(CiphertextTally("other", internal_manifest, other_context))
+        )
+        self.assertEqual(
+            decrypted_tallies, self._decrypt_with_secret(result, secret_key)
+        )
+
     @settings(
         deadline=timedelta(milliseconds=10000),
         suppress_health_check=[HealthCheck.too_slow],
@@ -7,8 +7,12 @@ from tests.base_test_case import BaseTestCase
 from electionguard.constants import (
     PrimeOption,
     LARGE_TEST_CONSTANTS,
+    SMALL_TEST_CONSTANTS,
     get_constants,
+    reset_constants,
+    set_constants,
     STANDARD_CONSTANTS,
+    use_prime_option,
 )
 
 from electionguard.constants import (
@@ -22,7 +26,7 @@ from electionguard.constants import (
 class TestConstants(BaseTestCase):
     """Election constant tests."""
 
-    @patch.dict(os.environ, {"PRIME_OPTION": PrimeOption.Standard.value})
+    @use_prime_option(PrimeOption.Standard)
     def test_get_standard_primes(self):
         """Test getting standard constants with large primes."""
         # Act
@@ -36,7 +40,7 @@ class TestConstants(BaseTestCase):
         self.assertEqual(constants.cofactor, get_cofactor())
         self.assertEqual(constants.generator, get_generator())
 
-    @patch.dict(os.environ, {"PRIME_OPTION": PrimeOption.TestOnly.value})
+    @use_prime_option(PrimeOption.TestOnly)
     def test_get_test_primes(self):
         """Test getting test only constants with small primes."""
         # Act
@@ -49,3 +53,42 @@ class TestConstants(BaseTestCase):
         self.assertEqual(constants.small_prime, get_small_prime())
         self.assertEqual(constants.cofactor, get_cofactor())
         self.assertEqual(constants.generator, get_generator())
+
+    def test_set_constants(self):
+        """Test setting constants and restoring the previous ones."""
+        # Arrange
+        previous = get_constants()
+
+        # Act
+        set_constants(SMALL_TEST_CONSTANTS)
+
+        # Assert
+        try:
+            self.assertEqual(get_constants(), SMALL_TEST_CONSTANTS)
+            self.assertEqual(get_large_prime(), 503)
+            self.assertEqual(get_small_prime(), 251)
+        finally:
+            set_constants(previous)
+        self.assertEqual(get_constants(), previous)
+
+    def test_use_prime_option_restores_constants(self):
+        """Test the constants are restored after temporarily using an option."""
+        # Act
+        with use_prime_option(PrimeOption.Standard) as constants:
+            # Assert
+            self.assertEqual(constants, STANDARD_CONSTANTS)
+            self.assertEqual(get_large_prime(), STANDARD_CONSTANTS.large_prime)
+
+        self.assertEqual(get_constants(), LARGE_TEST_CONSTANTS)
+
+    @patch.dict(os.environ, {"PRIME_OPTION": PrimeOption.Standard.value})
+    def test_reset_constants_from_environment(self):
+        """Test resetting the constants resolves the environment variable."""
+        # Act
+        reset_constants()
+
+        # Assert
+        try:
+            self.assertEqual(get_constants(), STANDARD_CONSTANTS)
+        finally:
+            set_constants(LARGE_TEST_CONSTANTS)
@@ -1,7 +1,6 @@
-import os
-from unittest.mock import patch
 from unittest import TestCase
-from electionguard import PrimeOption
+from unittest.mock import patch
+from electionguard import PrimeOption, use_prime_option
 
 from electionguard.byte_padding import TruncationError
 from electionguard.elgamal import (
@@ -128,6 +127,23 @@ class TestEncrypt(TestCase):
                 )
             )
 
+    def test_encrypt_contest_does_not_register_public_key(self) -> None:
+        # Arrange
+        keypair = get_optional(elgamal_keypair_from_secret(rand_q()))
+        contest_description = get_sample_contest_description()
+        contest = contest_from(contest_description)
+
+        # Act
+        with patch("electionguard.encrypt.register_fixed_base") as register:
+            encrypted_contest = encrypt_contest(
+                contest, contest_description, keypair.public_key, ONE_MOD_Q, rand_q()
+            )
+
+        # Assert
+        # a table per key would evict the tables of the generator and election key
+        self.assertIsNotNone(encrypted_contest)
+        register.assert_not_called()
+
     def test_contest_encrypt_with_overvotes(self) -> None:
 
         # Arrange
@@ -222,7 +238,7 @@ class TestEncrypt(TestCase):
             for write_in in contest_data.write_ins.values():
                 self.assertEqual(write_in, write_in_value)
 
-    @patch.dict(os.environ, {"PRIME_OPTION": PrimeOption.Standard.value})
+    @use_prime_option(PrimeOption.Standard)
     def test_contest_data_integration(self) -> None:
         """Contest data encryption done with production primes to match other repositories."""
 
@@ -1,4 +1,4 @@
-from electionguard.hmac import get_hmac
+from electionguard.hmac import get_hmac, get_hmac_keystream
 
 from tests.base_test_case import BaseTestCase
 
@@ -26,3 +26,23 @@ class TestHmac(BaseTestCase):
         self.assertIsNotNone(hmac_1)
         self.assertIsNotNone(hmac_2)
         self.assertIsNotNone(hmac_3)
+
+    def test_get_hmac_keystream(self) -> None:
+        """
+        Validate that the keystream matches the hmac for each start position.
+        """
+
+        # Arrange
+        key = b"mock_key"
+        message = b"mock_message"
+        length = 256
+        count = 3
+
+        # Act
+        keystream = get_hmac_keystream(key, message, length, count)
+
+        # Assert
+        self.assertEqual(
+            b"".join(get_hmac(key, message, length, i + 1) for i in range(count)),
+            keystream,
+        )
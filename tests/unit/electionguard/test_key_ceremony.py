@@ -1,5 +1,3 @@
-import os
-from unittest.mock import patch
 from tests.base_test_case import BaseTestCase
 
 from electionguard.constants import (
@@ -31,10 +29,11 @@ RECIPIENT_KEY = RECIPIENT_KEY_PAIR.share()
 ALTERNATE_VERIFIER_GUARDIAN_ID = "Test Guardian 3"
 
 
-@patch.dict(os.environ, {"PRIME_OPTION": PrimeOption.Standard.value})
 class TestKeyCeremony(BaseTestCase):
     """Key ceremony tests"""
 
+    prime_option = PrimeOption.Standard
+
     def test_generate_election_key_pair(self) -> None:
         # Act
         election_key_pair = generate_election_key_pair(
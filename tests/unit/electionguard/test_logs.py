@@ -9,6 +9,7 @@ from electionguard.logs import (
     log_debug,
     log_error,
     log_info,
+    log_is_enabled,
     log_warning,
 )
 
@@ -51,3 +52,61 @@ class TestLogs(BaseTestCase):
 
         # Assert
         self.assertEqual(len(added_handlers), 1)
+
+    def test_log_is_enabled(self):
+        # Arrange
+        handlers = list(log_handlers())
+        for handler in handlers:
+            log_remove_handler(handler)
+        self.addCleanup(self._restore_handlers, handlers)
+        log_add_handler(get_stream_handler(logging.INFO))
+
+        # Act
+        info_enabled = log_is_enabled(logging.INFO)
+        debug_handler = get_stream_handler(logging.DEBUG)
+        log_add_handler(debug_handler)
+        debug_enabled_with_handler = log_is_enabled(logging.DEBUG)
+
+        # Assert
+        self.assertTrue(info_enabled)
+        self.assertTrue(debug_enabled_with_handler)
+
+    def test_log_is_enabled_without_handlers_uses_last_resort(self):
+        # Arrange
+        # without handlers or propagation, logging falls back to its last resort handler
+        handlers = list(log_handlers())
+        for handler in handlers:
+            log_remove_handler(handler)
+        self.addCleanup(self._restore_handlers, handlers)
+        logger = logging.getLogger("electionguard")
+        logger.propagate = False
+        self.addCleanup(setattr, logger, "propagate", True)
+
+        # Act
+        warning_enabled = log_is_enabled(logging.WARNING)
+
+        # Assert
+        self.assertTrue(warning_enabled)
+
+    @staticmethod
+    def _restore_handlers(handlers):
+        for handler in list(log_handlers()):
+            log_remove_handler(handler)
+        for handler in handlers:
+            log_add_handler(handler)
+
+    def test_log_message_includes_caller(self):
+        # Arrange
+        message = "test log message"
+
+        # Act
+        with self.assertLogs("electionguard", logging.WARNING) as logs:
+            log_warning(message)
+
+        # Assert
+        self.assertEqual(len(logs.records), 1)
+        self.assertTrue(
+            logs.records[0]
+            .getMessage()
+            .startswith("test_logs.py.test_log_message_includes_caller:#L")
+        )
@@ -172,6 +172,62 @@ class TestManifest(BaseTestCase):
         for other_hash in hashes[1:]:
             self.assertEqual(hashes[0], other_hash)
 
+    def test_manifest_hash_is_updated_when_manifest_changes(self) -> None:
+        # Arrange
+        subject = election_factory.get_simple_manifest_from_file()
+        original_hash = subject.crypto_hash()
+        contest = subject.contests[0]
+        original_contest_hash = contest.crypto_hash()
+
+        # Act
+        subject.election_scope_id = "another-election-scope-id"
+        contest.name = "another contest name"
+
+        # Assert
+        self.assertNotEqual(original_hash, subject.crypto_hash())
+        self.assertNotEqual(original_contest_hash, contest.crypto_hash())
+        self.assertEqual(
+            subject.crypto_hash(), from_raw(Manifest, to_raw(subject)).crypto_hash()
+        )
+
+    def test_manifest_hash_is_updated_when_nested_description_changes(self) -> None:
+        # Arrange
+        subject = election_factory.get_simple_manifest_from_file()
+        internal_manifest = InternalManifest(subject)
+        original_hash = subject.crypto_hash()
+        contest = subject.contests[0]
+        original_contest_hash = contest.crypto_hash()
+
+        # Act
+        # only nested descriptions change, the manifest itself is not assigned to
+        contest.name = "another contest name"
+        renamed_contest_hash = contest.crypto_hash()
+        contest.ballot_selections[0].candidate_id = "another-candidate-id"
+        changed_candidate_hash = contest.crypto_hash()
+        contest.ballot_selections.append(
+            SelectionDescription("another-selection-id", 100, "another-candidate-id")
+        )
+
+        # Assert
+        contest_hashes = {
+            original_contest_hash,
+            renamed_contest_hash,
+            changed_candidate_hash,
+            contest.crypto_hash(),
+        }
+        self.assertEqual(4, len(contest_hashes))
+        self.assertNotEqual(original_hash, subject.crypto_hash())
+        self.assertEqual(
+            subject.crypto_hash(), from_raw(Manifest, to_raw(subject)).crypto_hash()
+        )
+
+        # the internal manifest keeps the descriptions it was built from
+        self.assertEqual(original_hash, internal_manifest.manifest_hash)
+        self.assertEqual(
+            original_contest_hash,
+            internal_manifest.contest_for(contest.object_id).crypto_hash(),
+        )
+
     def test_manifest_from_file_generates_consistent_internal_description_contest_hashes(
         self,
     ) -> None:
@@ -255,3 +311,24 @@ class TestManifest(BaseTestCase):
         )
 
         self.assertFalse(description.is_valid())
+
+    def test_internal_manifest_gets_contests_for_each_ballot_style(self) -> None:
+        # Arrange
+        manifest = election_factory.get_hamilton_manifest_from_file()
+
+        # Act
+        subject = InternalManifest(manifest)
+
+        # Assert
+        self.assertGreater(len(subject.ballot_styles), 1)
+        for style in subject.ballot_styles:
+            self.assertIs(style, subject.get_ballot_style(style.object_id))
+            expected = [
+                contest
+                for contest in subject.contests
+                if contest.electoral_district_id in style.geopolitical_unit_ids
+            ]
+            self.assertEqual(expected, subject.get_contests_for(style.object_id))
+        for contest in subject.contests:
+            self.assertIs(contest, subject.contest_for(contest.object_id))
+        self.assertIsNone(subject.contest_for("not-a-contest"))
@@ -4,6 +4,7 @@ from typing import List
 
 from tests.base_test_case import BaseTestCase
 
+from electionguard.constants import PrimeOption, get_constants, use_prime_option
 from electionguard.scheduler import Scheduler
 
 
@@ -52,3 +53,17 @@ class TestScheduler(BaseTestCase):
         self.assertIsInstance(result, List)
 
         subject.close()
+
+    def test_schedule_uses_current_constants_in_workers(self):
+        # Act
+        with Scheduler() as subject:
+            results = []
+            for option in PrimeOption:
+                with use_prime_option(option) as constants:
+                    results.append(
+                        (constants, subject.schedule(get_constants, [[], []]))
+                    )
+
+        # Assert
+        for (constants, worker_constants) in results:
+            self.assertEqual([constants, constants], worker_constants)